@@ -0,0 +1,68 @@
+"""Add full-text search index over issue titles and descriptions
+
+Revision ID: 5e1a7c2d9f03
+Revises: 952b0cce3457
+Create Date: 2026-10-19 11:02:17.553201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1a7c2d9f03'
+down_revision: Union[str, Sequence[str], None] = '952b0cce3457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from app/search.py as of this revision, so later changes there do not alter this migration
+POSTGRES_SEARCH_DDL = [
+    """ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_issues_search_vector ON issues USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts
+    USING fts5(title, description, content='issues', content_rowid='id')""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ad AFTER DELETE ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # The generated column is computed for existing rows when it is added
+        for statement in POSTGRES_SEARCH_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        # Index the issues that existed before the triggers
+        op.execute("INSERT INTO issues_fts(issues_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_issues_search_vector")
+        op.execute("ALTER TABLE issues DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        for trigger in ('issues_fts_ai', 'issues_fts_ad', 'issues_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS issues_fts")
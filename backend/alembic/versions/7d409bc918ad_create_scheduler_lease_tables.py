@@ -0,0 +1,41 @@
+"""Create scheduler_leases and scheduled_jobs tables
+
+Revision ID: 7d409bc918ad
+Revises: b7d4e0a15c62
+Create Date: 2026-10-19 15:21:48.302716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d409bc918ad'
+down_revision: Union[str, Sequence[str], None] = 'b7d4e0a15c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scheduler_leases',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('holder', sa.String(), nullable=False),
+    sa.Column('acquired_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('scheduled_jobs',
+    sa.Column('job_id', sa.String(), nullable=False),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.Column('last_run_by', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('scheduled_jobs')
+    op.drop_table('scheduler_leases')
@@ -0,0 +1,50 @@
+"""Create export_jobs table
+
+Revision ID: 952b0cce3457
+Revises: 3c7f6b1c84b0
+Create Date: 2026-10-19 09:12:44.180332
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '952b0cce3457'
+down_revision: Union[str, Sequence[str], None] = '3c7f6b1c84b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+export_dataset_enum = sa.Enum('ISSUES', 'DAILY_STATS', name='exportdataset')
+export_file_format_enum = sa.Enum('PARQUET', 'ARROW', name='exportfileformat')
+export_status_enum = sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='exportstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('export_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('dataset', export_dataset_enum, nullable=False),
+    sa.Column('format', export_file_format_enum, nullable=False),
+    sa.Column('status', export_status_enum, nullable=False),
+    sa.Column('file_path', sa.String(), nullable=True),
+    sa.Column('row_count', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('requested_by_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['requested_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_id'), 'export_jobs', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_export_jobs_id'), table_name='export_jobs')
+    op.drop_table('export_jobs')
+    export_status_enum.drop(op.get_bind(), checkfirst=True)
+    export_file_format_enum.drop(op.get_bind(), checkfirst=True)
+    export_dataset_enum.drop(op.get_bind(), checkfirst=True)
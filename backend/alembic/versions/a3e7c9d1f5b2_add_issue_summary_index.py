@@ -0,0 +1,27 @@
+"""Add issue summary covering index
+
+Revision ID: a3e7c9d1f5b2
+Revises: f1c6d83a9e25
+Create Date: 2026-10-19 19:12:08.413276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e7c9d1f5b2'
+down_revision: Union[str, Sequence[str], None] = 'f1c6d83a9e25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_issues_owner_status_severity', 'issues', ['owner_id', 'status', 'severity'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_owner_status_severity', table_name='issues')
@@ -0,0 +1,30 @@
+"""Add prefix index on lowercased issue titles for short autocomplete prefixes
+
+Revision ID: a9d2f6c4e8b1
+Revises: e7b3c1d9a4f2
+Create Date: 2026-10-20 10:14:36.205118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d2f6c4e8b1'
+down_revision: Union[str, Sequence[str], None] = 'e7b3c1d9a4f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other databases use the in-memory title index instead
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE INDEX IF NOT EXISTS ix_issues_title_lower_pattern ON issues (lower(title) text_pattern_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_issues_title_lower_pattern")
@@ -0,0 +1,46 @@
+"""Create issue_attachments table
+
+Revision ID: b6f2d8e4a190
+Revises: a3e7c9d1f5b2
+Create Date: 2026-10-19 20:03:51.207448
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f2d8e4a190'
+down_revision: Union[str, Sequence[str], None] = 'a3e7c9d1f5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_attachments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('issue_id', sa.Integer(), nullable=False),
+    sa.Column('uploaded_by_id', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('content_type', sa.String(), nullable=False),
+    sa.Column('size_bytes', sa.BigInteger(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['issue_id'], ['issues.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['uploaded_by_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_issue_attachments_id'), 'issue_attachments', ['id'], unique=False)
+    op.create_index(op.f('ix_issue_attachments_issue_id'), 'issue_attachments', ['issue_id'], unique=False)
+    op.create_index(op.f('ix_issue_attachments_sha256'), 'issue_attachments', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_issue_attachments_sha256'), table_name='issue_attachments')
+    op.drop_index(op.f('ix_issue_attachments_issue_id'), table_name='issue_attachments')
+    op.drop_index(op.f('ix_issue_attachments_id'), table_name='issue_attachments')
+    op.drop_table('issue_attachments')
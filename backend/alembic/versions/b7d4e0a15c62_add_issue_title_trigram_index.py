@@ -0,0 +1,37 @@
+"""Add trigram index on issue titles for autocomplete
+
+Revision ID: b7d4e0a15c62
+Revises: 5e1a7c2d9f03
+Create Date: 2026-10-19 13:40:05.918274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e0a15c62'
+down_revision: Union[str, Sequence[str], None] = '5e1a7c2d9f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from app/suggest.py as of this revision, so later changes there do not alter this migration
+POSTGRES_SUGGEST_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_issues_title_trgm ON issues USING GIN (title gin_trgm_ops)",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other databases use the in-memory title index instead
+    if op.get_bind().dialect.name == 'postgresql':
+        for statement in POSTGRES_SUGGEST_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_issues_title_trgm")
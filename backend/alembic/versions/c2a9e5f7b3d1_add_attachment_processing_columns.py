@@ -0,0 +1,44 @@
+"""Add attachment processing columns
+
+Revision ID: c2a9e5f7b3d1
+Revises: b6f2d8e4a190
+Create Date: 2026-10-19 21:26:40.918032
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a9e5f7b3d1'
+down_revision: Union[str, Sequence[str], None] = 'b6f2d8e4a190'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+attachment_status_enum = sa.Enum('PENDING', 'PROCESSING', 'READY', 'FAILED', name='attachmentstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # add_column does not create enum types by itself
+    attachment_status_enum.create(op.get_bind(), checkfirst=True)
+    op.add_column('issue_attachments', sa.Column('status', attachment_status_enum, server_default='PENDING', nullable=False))
+    op.add_column('issue_attachments', sa.Column('detected_type', sa.String(), nullable=True))
+    op.add_column('issue_attachments', sa.Column('artifacts', sa.JSON(), nullable=True))
+    op.add_column('issue_attachments', sa.Column('stage_timings', sa.JSON(), nullable=True))
+    op.add_column('issue_attachments', sa.Column('processing_error', sa.Text(), nullable=True))
+    op.add_column('issue_attachments', sa.Column('processed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issue_attachments', schema=None) as batch_op:
+        batch_op.drop_column('processed_at')
+        batch_op.drop_column('processing_error')
+        batch_op.drop_column('stage_timings')
+        batch_op.drop_column('artifacts')
+        batch_op.drop_column('detected_type')
+        batch_op.drop_column('status')
+    attachment_status_enum.drop(op.get_bind(), checkfirst=True)
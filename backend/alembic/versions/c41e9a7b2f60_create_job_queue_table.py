@@ -0,0 +1,50 @@
+"""Create job_queue table
+
+Revision ID: c41e9a7b2f60
+Revises: 7d409bc918ad
+Create Date: 2026-10-19 16:02:11.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e9a7b2f60'
+down_revision: Union[str, Sequence[str], None] = '7d409bc918ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+queued_job_status_enum = sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='queuedjobstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_queue',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', queued_job_status_enum, nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_by', sa.String(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_queue_id'), 'job_queue', ['id'], unique=False)
+    op.create_index('ix_job_queue_claim', 'job_queue', ['status', 'priority', 'run_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_queue_claim', table_name='job_queue')
+    op.drop_index(op.f('ix_job_queue_id'), table_name='job_queue')
+    op.drop_table('job_queue')
+    queued_job_status_enum.drop(op.get_bind(), checkfirst=True)
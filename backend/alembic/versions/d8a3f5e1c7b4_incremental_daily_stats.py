@@ -0,0 +1,42 @@
+"""Track incremental daily stats state
+
+Revision ID: d8a3f5e1c7b4
+Revises: c41e9a7b2f60
+Create Date: 2026-10-19 16:48:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3f5e1c7b4'
+down_revision: Union[str, Sequence[str], None] = 'c41e9a7b2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The issuestatus type already exists; it was created with the issues table
+issue_status_enum = postgresql.ENUM('OPEN', 'TRIAGED', 'IN_PROGRESS', 'DONE', name='issuestatus', create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('daily_stats', sa.Column('computed_through', sa.DateTime(), nullable=True))
+    op.create_table('issue_status_snapshots',
+    sa.Column('issue_id', sa.Integer(), nullable=False),
+    sa.Column('status', issue_status_enum, nullable=False),
+    sa.PrimaryKeyConstraint('issue_id')
+    )
+    # Refreshes read only issues changed since the last run
+    op.create_index(op.f('ix_issues_updated_at'), 'issues', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_issues_updated_at'), table_name='issues')
+    op.drop_table('issue_status_snapshots')
+    with op.batch_alter_table('daily_stats', schema=None) as batch_op:
+        batch_op.drop_column('computed_through')
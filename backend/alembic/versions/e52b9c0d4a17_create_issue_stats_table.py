@@ -0,0 +1,75 @@
+"""Create normalized issue_stats table with rollups
+
+Revision ID: e52b9c0d4a17
+Revises: d8a3f5e1c7b4
+Create Date: 2026-10-19 17:31:05.216540
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e52b9c0d4a17'
+down_revision: Union[str, Sequence[str], None] = 'd8a3f5e1c7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+stats_granularity_enum = sa.Enum('DAY', 'WEEK', 'MONTH', name='statsgranularity')
+# The issue enum types already exist; they were created with the issues table
+issue_status_enum = postgresql.ENUM('OPEN', 'TRIAGED', 'IN_PROGRESS', 'DONE', name='issuestatus', create_type=False)
+issue_severity_enum = postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='issueseverity', create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    issue_stats = op.create_table('issue_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('granularity', stats_granularity_enum, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('status', issue_status_enum, nullable=False),
+    sa.Column('severity', issue_severity_enum, nullable=True),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_issue_stats_period', 'issue_stats', ['granularity', 'period_start', 'status', 'severity', 'count'], unique=False)
+
+    # Snapshot rows have no severity: drop them and the watermarks so the next refresh recounts once
+    op.execute("DELETE FROM issue_status_snapshots")
+    op.execute("UPDATE daily_stats SET computed_through = NULL")
+    with op.batch_alter_table('issue_status_snapshots', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('severity', issue_severity_enum, nullable=False))
+
+    # Copy the JSON daily stats; they were not split by severity. Rollups repeat the latest day of each period.
+    daily_stats = sa.table('daily_stats', sa.column('date', sa.DateTime()), sa.column('issue_counts_by_status', sa.JSON()))
+    rows = []
+    latest_day_of_period = {}
+    for day_value, counts in op.get_bind().execute(sa.select(daily_stats.c.date, daily_stats.c.issue_counts_by_status).order_by(daily_stats.c.date)):
+        day = day_value.date()
+        day_counts = {status: count for status, count in counts.items() if count}
+        rows += [
+            {'granularity': 'DAY', 'period_start': day, 'status': status, 'severity': None, 'count': count}
+            for status, count in day_counts.items()
+        ]
+        latest_day_of_period[('WEEK', day - timedelta(days=day.weekday()))] = day_counts
+        latest_day_of_period[('MONTH', day.replace(day=1))] = day_counts
+    for (granularity, start), day_counts in latest_day_of_period.items():
+        rows += [
+            {'granularity': granularity, 'period_start': start, 'status': status, 'severity': None, 'count': count}
+            for status, count in day_counts.items()
+        ]
+    if rows:
+        op.bulk_insert(issue_stats, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issue_status_snapshots', schema=None) as batch_op:
+        batch_op.drop_column('severity')
+    op.drop_index('ix_issue_stats_period', table_name='issue_stats')
+    op.drop_table('issue_stats')
+    stats_granularity_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,46 @@
+"""Create idempotency_keys table
+
+Revision ID: e7b3c1d9a4f2
+Revises: c2a9e5f7b3d1
+Create Date: 2026-10-19 23:12:05.471820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c1d9a4f2'
+down_revision: Union[str, Sequence[str], None] = 'c2a9e5f7b3d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+idempotency_status_enum = sa.Enum('IN_PROGRESS', 'COMPLETED', name='idempotencystatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('fingerprint', sa.String(), nullable=False),
+    sa.Column('status', idempotency_status_enum, nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_until', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('scope', 'user_id', 'key')
+    )
+    op.create_index(op.f('ix_idempotency_keys_expires_at'), 'idempotency_keys', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_idempotency_keys_expires_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
+    idempotency_status_enum.drop(op.get_bind(), checkfirst=True)
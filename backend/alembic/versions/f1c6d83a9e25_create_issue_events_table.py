@@ -0,0 +1,51 @@
+"""Create issue_events table
+
+Revision ID: f1c6d83a9e25
+Revises: e52b9c0d4a17
+Create Date: 2026-10-19 18:05:44.731902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d83a9e25'
+down_revision: Union[str, Sequence[str], None] = 'e52b9c0d4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+issue_event_type_enum = sa.Enum('CREATED', 'UPDATED', 'DELETED', name='issueeventtype')
+# The issue enum types already exist; they were created with the issues table
+issue_status_enum = postgresql.ENUM('OPEN', 'TRIAGED', 'IN_PROGRESS', 'DONE', name='issuestatus', create_type=False)
+issue_severity_enum = postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='issueseverity', create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_events',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('issue_id', sa.Integer(), nullable=False),
+    sa.Column('event_type', issue_event_type_enum, nullable=False),
+    sa.Column('actor_id', sa.Integer(), nullable=True),
+    sa.Column('at', sa.DateTime(), nullable=False),
+    sa.Column('old_status', issue_status_enum, nullable=True),
+    sa.Column('new_status', issue_status_enum, nullable=True),
+    sa.Column('old_severity', issue_severity_enum, nullable=True),
+    sa.Column('new_severity', issue_severity_enum, nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_issue_events_issue_id_at', 'issue_events', ['issue_id', 'at'], unique=False)
+    op.create_index('ix_issue_events_at', 'issue_events', ['at'], unique=False)
+
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_events_at', table_name='issue_events')
+    op.drop_index('ix_issue_events_issue_id_at', table_name='issue_events')
+    op.drop_table('issue_events')
+    issue_event_type_enum.drop(op.get_bind(), checkfirst=True)
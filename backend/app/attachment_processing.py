@@ -0,0 +1,182 @@
+# backend/app/attachment_processing.py
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from datetime import datetime
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import crud, models
+from .attachment_stages import extract_text, make_thumbnail, sniff_content_type
+from .job_queue import job_handlers
+from .storage import BlobStorage, blob_storage
+from .websockets import manager
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Worker processes for CPU-bound processing steps, per web or queue worker process.
+# Further attachments wait for a free process instead of competing for CPU with requests.
+ATTACHMENT_PROCESS_WORKERS = int(os.getenv("ATTACHMENT_PROCESS_WORKERS", "2"))
+
+# A step running longer than this (not counting time waiting for a free process) fails the attachment's processing, and its worker process is killed
+ATTACHMENT_STAGE_TIMEOUT_SECONDS = float(os.getenv("ATTACHMENT_STAGE_TIMEOUT_SECONDS", "120"))
+
+# Artifact names, stored next to the blob as <digest>.<name>
+THUMBNAIL_ARTIFACT = "thumbnail.png"
+TEXT_ARTIFACT = "text.txt"
+
+# Detected types whose text is extracted into a text artifact
+TEXT_TYPES = ("text/plain",)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+# Held by each submitted step until it finishes, so a step is only submitted, and its timeout
+# only started, once a worker process is free to run it
+_pool_slots = threading.BoundedSemaphore(ATTACHMENT_PROCESS_WORKERS)
+
+def _process_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned rather than forked: the parent has scheduler threads and open connections
+            _pool = ProcessPoolExecutor(max_workers=ATTACHMENT_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+def shutdown_process_pool():
+    """
+    Stops the worker processes, if they were started. Called on application shutdown.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+def _recycle_process_pool(pool: ProcessPoolExecutor):
+    """
+    Kills the worker processes of `pool`, e.g. one stuck on a step, and replaces it with a
+    fresh pool on next use. Other steps running in it fail with BrokenProcessPool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # ProcessPoolExecutor cannot cancel a running call; terminating its processes is the only way
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _run_stage(function, *args):
+    """
+    Runs `function(*args)` in the process pool once a worker process is free, and returns its
+    result and how long it ran, in seconds.
+    """
+    _pool_slots.acquire()
+    try:
+        pool = _process_pool()
+        started = time.perf_counter()
+        future = pool.submit(function, *args)
+    except BaseException:
+        _pool_slots.release()
+        raise
+    # Released when the step ends, including by the pool being recycled under it
+    future.add_done_callback(lambda _: _pool_slots.release())
+    try:
+        return future.result(timeout=ATTACHMENT_STAGE_TIMEOUT_SECONDS), time.perf_counter() - started
+    except TimeoutError:
+        logger.warning("Attachment processing step timed out; recycling the process pool",
+                       extra={"stage": getattr(function, "__name__", str(function)), "timeout_seconds": ATTACHMENT_STAGE_TIMEOUT_SECONDS})
+        _recycle_process_pool(pool)
+        raise
+
+def process_attachment(db: Session, attachment_id: int, storage: BlobStorage = blob_storage) -> Optional[models.IssueAttachment]:
+    """
+    Runs the processing pipeline for an attachment: detects its type from its contents, then
+    writes a thumbnail for images and the extracted text of text files next to the blob.
+    Each step runs in the process pool and its execution is timed; the attachment ends up READY with its
+    artifacts and stage timings (in milliseconds), or FAILED with the error.
+    Artifacts already stored for the same contents are reused.
+    """
+    db_attachment = crud.update_attachment(db, attachment_id, status=models.AttachmentStatus.PROCESSING)
+    if db_attachment is None:
+        logger.warning("Attachment not found for processing", extra={"attachment_id": attachment_id})
+        return None
+
+    digest = db_attachment.sha256
+    path = storage.path(digest)
+    timings: Dict[str, float] = {}
+
+    def timed(stage: str, function, *args):
+        result, elapsed = _run_stage(function, *args)
+        timings[stage] = round(elapsed * 1000, 3)
+        return result
+
+    try:
+        detected_type = timed("sniff", sniff_content_type, path)
+        artifacts = []
+        if detected_type.startswith("image/"):
+            artifacts.append(THUMBNAIL_ARTIFACT)
+            if not os.path.exists(storage.artifact_path(digest, THUMBNAIL_ARTIFACT)):
+                timed("thumbnail", make_thumbnail, path, storage.artifact_path(digest, THUMBNAIL_ARTIFACT))
+        elif detected_type in TEXT_TYPES:
+            artifacts.append(TEXT_ARTIFACT)
+            if not os.path.exists(storage.artifact_path(digest, TEXT_ARTIFACT)):
+                timed("text", extract_text, path, storage.artifact_path(digest, TEXT_ARTIFACT))
+    except Exception as e:
+        logger.error(f"Attachment processing failed: {e}", exc_info=True, extra={"attachment_id": attachment_id})
+        db.rollback()
+        return crud.update_attachment(
+            db, attachment_id,
+            status=models.AttachmentStatus.FAILED,
+            stage_timings=timings,
+            processing_error=str(e) or type(e).__name__,
+            processed_at=datetime.utcnow(),
+        )
+
+    logger.info("Attachment processed", extra={"attachment_id": attachment_id, "detected_type": detected_type, "stage_timings_ms": timings})
+    return crud.update_attachment(
+        db, attachment_id,
+        status=models.AttachmentStatus.READY,
+        detected_type=detected_type,
+        artifacts=artifacts,
+        stage_timings=timings,
+        processing_error=None,
+        processed_at=datetime.utcnow(),
+    )
+
+async def run_attachment_processing(db: Session, attachment_id: int):
+    """
+    Processes an attachment off the event loop, then notifies WebSocket clients with the
+    outcome and per-stage timings. Takes ownership of `db` and closes it.
+    """
+    try:
+        db_attachment = await run_in_threadpool(process_attachment, db, attachment_id)
+        if db_attachment is None:
+            return
+        message = {
+            "type": "attachment_processed",
+            "issue_id": db_attachment.issue_id,
+            "attachment_id": db_attachment.id,
+            "status": db_attachment.status.value,
+            "detected_type": db_attachment.detected_type,
+            "artifacts": db_attachment.artifacts or [],
+            "stage_timings_ms": db_attachment.stage_timings or {},
+        }
+    finally:
+        await run_in_threadpool(db.close)
+    await manager.broadcast(message)
+
+def _run_queued_processing(db: Session, payload: dict):
+    process_attachment(db, payload["attachment_id"])
+
+# Lets queue workers (re)process attachments: enqueue_job(db, "process_attachment", {"attachment_id": attachment.id})
+job_handlers["process_attachment"] = _run_queued_processing
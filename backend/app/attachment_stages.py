@@ -0,0 +1,90 @@
+# backend/app/attachment_stages.py
+"""
+CPU-bound attachment processing steps. They run in worker processes, so this module
+only imports what the steps need: importing it must not touch the database.
+"""
+
+import os
+import re
+import uuid
+
+from PIL import Image
+
+# Bytes read to decide what a file is
+SNIFF_BYTES = 8192
+
+# Text extracted from the start of a file; the rest is ignored
+TEXT_EXTRACT_MAX_BYTES = 1024 * 1024
+
+# Bounding box of generated thumbnails
+THUMBNAIL_SIZE = (320, 320)
+
+# Magic numbers of binary formats we recognize, checked in order
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+]
+
+# Terminal escape sequences and control characters, common in logs
+_CONTROL = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+def _write_atomically(path: str, write):
+    temp_path = f"{path}.{uuid.uuid4().hex}.partial"
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def sniff_content_type(path: str) -> str:
+    """
+    Detects a file's MIME type from its contents rather than what the uploader declared.
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if b"\x00" not in head:
+        try:
+            head.decode("utf-8")
+            return "text/plain"
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the sample is still text
+            if e.start >= len(head) - 3:
+                return "text/plain"
+    return "application/octet-stream"
+
+def make_thumbnail(path: str, thumbnail_path: str):
+    """
+    Writes a PNG thumbnail of an image, fitting THUMBNAIL_SIZE and keeping its aspect ratio.
+    """
+    with Image.open(path) as image:
+        image.thumbnail(THUMBNAIL_SIZE)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+        _write_atomically(thumbnail_path, lambda temp_path: image.save(temp_path, format="PNG"))
+
+def extract_text(path: str, text_path: str) -> int:
+    """
+    Writes the searchable text of a text or log file, without terminal escapes and control
+    characters. Returns the number of characters written.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(TEXT_EXTRACT_MAX_BYTES)
+    text = _CONTROL.sub("", raw.decode("utf-8", errors="replace"))
+
+    def write(temp_path: str):
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    _write_atomically(text_path, write)
+    return len(text)
@@ -0,0 +1,110 @@
+# backend/app/attachments.py
+
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import models
+from .job_queue import job_handlers
+from .storage import BlobStorage, blob_storage
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Largest accepted attachment
+ATTACHMENT_MAX_BYTES = int(os.getenv("ATTACHMENT_MAX_BYTES", str(100 * 1024 * 1024)))
+
+# Uploads are written to storage in blocks of this size, whatever sizes the request body arrives in
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+
+# When set, downloads are handed to the reverse proxy (nginx X-Accel-Redirect) under this internal
+# location, which maps to ATTACHMENT_STORAGE_DIR; the proxy then serves the file with sendfile
+ATTACHMENT_ACCEL_REDIRECT_PREFIX = os.getenv("ATTACHMENT_ACCEL_REDIRECT_PREFIX")
+
+# Blobs never change, so clients may cache downloads for as long as they like
+ATTACHMENT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+# Unreferenced blobs younger than this are kept, as their attachment row may not be committed yet
+ORPHAN_BLOB_GRACE = timedelta(hours=1)
+
+class AttachmentTooLarge(Exception):
+    pass
+
+class AttachmentEmpty(Exception):
+    pass
+
+async def store_upload(chunks: AsyncIterator[bytes], max_bytes: int = ATTACHMENT_MAX_BYTES,
+                       storage: BlobStorage = blob_storage) -> Tuple[str, int]:
+    """
+    Streams an upload into blob storage in ATTACHMENT_CHUNK_SIZE blocks, hashing it on the way,
+    and returns (SHA-256 hex digest, size). At most one block is held in memory.
+    Raises AttachmentTooLarge as soon as more than `max_bytes` have arrived, and AttachmentEmpty
+    for an empty body; nothing is stored then.
+    """
+    writer = await run_in_threadpool(storage.writer)
+    received = 0
+    buffer = bytearray()
+    try:
+        async for chunk in chunks:
+            received += len(chunk)
+            if received > max_bytes:
+                raise AttachmentTooLarge(f"Attachments are limited to {max_bytes} bytes")
+            buffer += chunk
+            while len(buffer) >= ATTACHMENT_CHUNK_SIZE:
+                block = bytes(buffer[:ATTACHMENT_CHUNK_SIZE])
+                del buffer[:ATTACHMENT_CHUNK_SIZE]
+                # File writes block, so they run off the event loop
+                await run_in_threadpool(writer.write, block)
+        if received == 0:
+            raise AttachmentEmpty("Attachment is empty")
+        if buffer:
+            await run_in_threadpool(writer.write, bytes(buffer))
+        return await run_in_threadpool(writer.commit)
+    except BaseException:
+        await run_in_threadpool(writer.abort)
+        raise
+
+def _is_referenced(db: Session, digest: str) -> bool:
+    referenced = db.query(models.IssueAttachment.id).filter(models.IssueAttachment.sha256 == digest).first() is not None
+    # Ends the read, so the next check sees attachments committed since
+    db.commit()
+    return referenced
+
+def prune_orphan_blobs(db: Session, storage: BlobStorage = blob_storage, check: Optional[Callable[[], None]] = None) -> int:
+    """
+    Deletes blobs no attachment refers to anymore, e.g. after their issues were deleted.
+    Candidates are checked again as they are deleted, since a duplicate upload may have
+    refreshed or referenced one meanwhile. `check` is called before each deletion; an
+    exception from it stops the prune. Returns how many blobs were deleted.
+    """
+    cutoff = datetime.utcnow() - ORPHAN_BLOB_GRACE
+    candidates = [digest for digest, stored_at in storage.iter_blobs() if stored_at < cutoff]
+    referenced = set()
+    for start in range(0, len(candidates), 1000):
+        batch = candidates[start:start + 1000]
+        referenced.update(digest for (digest,) in db.query(models.IssueAttachment.sha256).filter(
+            models.IssueAttachment.sha256.in_(batch)
+        ).distinct())
+    db.commit()
+    pruned = 0
+    for digest in candidates:
+        if digest in referenced:
+            continue
+        if check is not None:
+            check()
+        if storage.delete_unless(digest, lambda stored_at: stored_at >= cutoff or _is_referenced(db, digest)):
+            pruned += 1
+    if pruned:
+        logger.info("Pruned orphaned attachment blobs", extra={"blob_count": pruned})
+    return pruned
+
+def _run_queued_prune(db: Session, payload: dict):
+    prune_orphan_blobs(db)
+
+job_handlers["prune_attachment_blobs"] = _run_queued_prune
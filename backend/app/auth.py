@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from . import schemas, crud, models
 from .database import get_db
+from .replicas import use_primary
 import os
 from dotenv import load_dotenv
 
@@ -64,6 +65,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     )
     token_data = verify_token(token, credentials_exception)
     user = crud.get_user_by_email(db, email=token_data.email)
+    if user is None and use_primary(db):
+        # Just registered users may not have reached the replica yet
+        user = crud.get_user_by_email(db, email=token_data.email)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -1,15 +1,36 @@
 # backend/app/crud.py
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from . import models, schemas
+from .issue_cache import issue_cache
 from passlib.context import CryptContext
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Callable, Tuple
 from datetime import datetime, date # Import date
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Initialize password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Callbacks run after an issue write has been committed, as hook(action, issue)
+# where action is "created", "updated" or "deleted". In-memory indexes and caches
+# register here to stay in sync with the issues table.
+issue_write_hooks: List[Callable[[str, models.Issue], None]] = []
+issue_write_hooks.append(issue_cache.on_issue_write)
+
+def _run_issue_write_hooks(action: str, db_issue: models.Issue):
+    """
+    Notifies every registered hook of a committed issue write.
+    A failing hook is logged and never fails the write itself.
+    """
+    for hook in issue_write_hooks:
+        try:
+            hook(action, db_issue)
+        except Exception as e:
+            logger.error(f"Issue write hook failed: {e}", exc_info=True, extra={"action": action, "issue_id": db_issue.id})
+
 def get_password_hash(password: str) -> str:
     """
     Hashes a plain-text password using the configured hashing algorithm.
@@ -91,21 +112,64 @@ def delete_user(db: Session, user_id: int) -> Optional[dict]:
 
 # --- Issue CRUD Operations ---
 
+def _record_issue_event(db: Session, event_type: models.IssueEventType, db_issue: models.Issue, actor_id: Optional[int],
+                        old_status: Optional[models.IssueStatus] = None, old_severity: Optional[models.IssueSeverity] = None):
+    """
+    Adds an issue_events row to the session, to be committed together with the issue write.
+    """
+    deleted = event_type == models.IssueEventType.DELETED
+    at = {
+        models.IssueEventType.CREATED: db_issue.created_at,
+        models.IssueEventType.UPDATED: db_issue.updated_at,
+    }.get(event_type) or datetime.utcnow()
+    db.add(models.IssueEvent(
+        issue_id=db_issue.id,
+        event_type=event_type,
+        actor_id=actor_id,
+        at=at,
+        old_status=old_status,
+        new_status=None if deleted else db_issue.status,
+        old_severity=old_severity,
+        new_severity=None if deleted else db_issue.severity,
+    ))
+
 def create_issue(db: Session, issue: schemas.IssueCreate, owner_id: int) -> models.Issue:
     """
-    Creates a new issue in the database.
+    Creates a new issue in the database and records a CREATED event by its owner.
     """
     db_issue = models.Issue(**issue.model_dump(), owner_id=owner_id)
     db.add(db_issue)
+    db.flush() # Assigns the id and column defaults for the event
+    _record_issue_event(db, models.IssueEventType.CREATED, db_issue, actor_id=owner_id)
     db.commit()
     db.refresh(db_issue)
+    _run_issue_write_hooks("created", db_issue)
     return db_issue
 
+def create_issues(db: Session, issues: List[Tuple[schemas.IssueCreate, int]]) -> List[models.Issue]:
+    """
+    Creates several issues, each paired with its owner ID, with one multi-row INSERT ... RETURNING
+    and one commit, recording their CREATED events alongside. Returns the issues in input order.
+    Use a session with expire_on_commit=False, or each returned issue is reloaded when read.
+    """
+    if not issues:
+        return []
+    db_issues = list(db.scalars(
+        insert(models.Issue).returning(models.Issue, sort_by_parameter_order=True),
+        [{**issue.model_dump(), "owner_id": owner_id} for issue, owner_id in issues],
+    ))
+    for db_issue in db_issues:
+        _record_issue_event(db, models.IssueEventType.CREATED, db_issue, actor_id=db_issue.owner_id)
+    db.commit()
+    for db_issue in db_issues:
+        _run_issue_write_hooks("created", db_issue)
+    return db_issues
+
 def get_issue(db: Session, issue_id: int) -> Optional[models.Issue]:
     """
-    Retrieves a single issue by its ID.
+    Retrieves a single issue by its ID, from this worker's hot-issue cache when it holds the row.
     """
-    return db.query(models.Issue).filter(models.Issue.id == issue_id).first()
+    return issue_cache.read_through(db, issue_id, lambda: db.query(models.Issue).filter(models.Issue.id == issue_id).first())
 
 def get_issues(db: Session, skip: int = 0, limit: int = 100) -> List[models.Issue]:
     """
@@ -119,32 +183,134 @@ def get_issues_by_owner(db: Session, owner_id: int, skip: int = 0, limit: int =
     """
     return db.query(models.Issue).filter(models.Issue.owner_id == owner_id).offset(skip).limit(limit).all()
 
-def update_issue(db: Session, issue_id: int, issue_update: schemas.IssueUpdate) -> Optional[models.Issue]:
+def get_owner_issue_summary(db: Session, owner_id: int, recent_limit: int = 5) -> Dict:
+    """
+    Counts one owner's issues by status and severity and returns their `recent_limit` newest issues.
+    The counts are an index-only scan of ix_issues_owner_status_severity.
+    """
+    status_counts = {status: 0 for status in models.IssueStatus}
+    severity_counts = {severity: 0 for severity in models.IssueSeverity}
+    results = db.query(models.Issue.status, models.Issue.severity, func.count()).filter(
+        models.Issue.owner_id == owner_id
+    ).group_by(models.Issue.status, models.Issue.severity).all()
+    for status_enum, severity_enum, count in results:
+        status_counts[status_enum] += count
+        severity_counts[severity_enum] += count
+    recent_issues = db.query(models.Issue).filter(models.Issue.owner_id == owner_id).order_by(
+        models.Issue.id.desc()
+    ).limit(recent_limit).all()
+    return {
+        "total": sum(status_counts.values()),
+        "status_counts": status_counts,
+        "severity_counts": severity_counts,
+        "recent_issues": recent_issues,
+    }
+
+def iter_issues(db: Session, owner_id: Optional[int] = None, batch_size: int = 1000) -> Iterator:
+    """
+    Streams issue rows ordered by ID through a server-side cursor.
+    Rows are fetched `batch_size` at a time, so memory stays flat regardless of table size.
+    Restricts the stream to a single owner when `owner_id` is given.
+    """
+    query = db.query(
+        models.Issue.id,
+        models.Issue.title,
+        models.Issue.description,
+        models.Issue.severity,
+        models.Issue.status,
+        models.Issue.created_at,
+        models.Issue.updated_at,
+        models.Issue.owner_id,
+    )
+    if owner_id is not None:
+        query = query.filter(models.Issue.owner_id == owner_id)
+    return iter(query.order_by(models.Issue.id).yield_per(batch_size))
+
+def update_issue(db: Session, issue_id: int, issue_update: schemas.IssueUpdate, actor_id: Optional[int] = None) -> Optional[models.Issue]:
     """
     Updates an existing issue's information.
     Handles optional fields and updates 'updated_at' timestamp.
+    Records an UPDATED event with the previous status and severity.
     """
     db_issue: Optional[models.Issue] = db.query(models.Issue).filter(models.Issue.id == issue_id).first()
     if db_issue:
+        issue_cache.refresh_if_cached(db, db_issue)
+        old_status, old_severity = db_issue.status, db_issue.severity
         update_data = issue_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_issue, key, value)
         db_issue.updated_at = datetime.utcnow()
+        _record_issue_event(db, models.IssueEventType.UPDATED, db_issue, actor_id, old_status=old_status, old_severity=old_severity)
+        issue_cache.before_issue_commit(db, db_issue.id)
         db.commit()
         db.refresh(db_issue)
+        _run_issue_write_hooks("updated", db_issue)
     return db_issue
 
-def delete_issue(db: Session, issue_id: int) -> Optional[dict]:
+def delete_issue(db: Session, issue_id: int, actor_id: Optional[int] = None) -> Optional[dict]:
     """
-    Deletes an issue from the database.
+    Deletes an issue from the database and records a DELETED event.
     """
     db_issue = db.query(models.Issue).filter(models.Issue.id == issue_id).first()
     if db_issue:
+        issue_cache.refresh_if_cached(db, db_issue)
+        _record_issue_event(db, models.IssueEventType.DELETED, db_issue, actor_id, old_status=db_issue.status, old_severity=db_issue.severity)
         db.delete(db_issue)
+        issue_cache.before_issue_commit(db, db_issue.id)
         db.commit()
+        _run_issue_write_hooks("deleted", db_issue)
         return {"message": "Issue deleted successfully"}
     return None
 
+# --- Attachment Operations ---
+
+def create_attachment(db: Session, issue_id: int, filename: str, content_type: str, size_bytes: int,
+                      sha256: str, uploaded_by_id: Optional[int] = None) -> models.IssueAttachment:
+    """
+    Records an attachment whose contents are already in blob storage under `sha256`.
+    """
+    db_attachment = models.IssueAttachment(
+        issue_id=issue_id,
+        uploaded_by_id=uploaded_by_id,
+        filename=filename,
+        content_type=content_type,
+        size_bytes=size_bytes,
+        sha256=sha256,
+    )
+    db.add(db_attachment)
+    db.commit()
+    db.refresh(db_attachment)
+    return db_attachment
+
+def get_attachments(db: Session, issue_id: int) -> List[models.IssueAttachment]:
+    """
+    Retrieves an issue's attachments, oldest first.
+    """
+    return db.query(models.IssueAttachment).filter(models.IssueAttachment.issue_id == issue_id).order_by(
+        models.IssueAttachment.id
+    ).all()
+
+def get_attachment(db: Session, issue_id: int, attachment_id: int) -> Optional[models.IssueAttachment]:
+    """
+    Retrieves one of an issue's attachments by ID.
+    """
+    return db.query(models.IssueAttachment).filter(
+        models.IssueAttachment.id == attachment_id, models.IssueAttachment.issue_id == issue_id
+    ).first()
+
+def update_attachment(db: Session, attachment_id: int, **fields) -> Optional[models.IssueAttachment]:
+    """
+    Updates an attachment's processing state (status, detected_type, artifacts, stage_timings,
+    processing_error, processed_at).
+    """
+    db_attachment = db.query(models.IssueAttachment).filter(models.IssueAttachment.id == attachment_id).first()
+    if db_attachment:
+        for key, value in fields.items():
+            setattr(db_attachment, key, value)
+        db.commit()
+        db.refresh(db_attachment)
+    return db_attachment
+
 # --- Dashboard Operations ---
 
 def get_issue_status_counts(db: Session) -> Dict[models.IssueStatus, int]:
@@ -158,6 +324,56 @@ def get_issue_status_counts(db: Session) -> Dict[models.IssueStatus, int]:
         status_counts[status_enum] = count
     return status_counts
 
+def get_issue_summary(db: Session, reporter_limit: int = 10) -> Dict:
+    """
+    Aggregates issue counts by status, by severity, by status and severity, and per reporter.
+    Everything is rolled up from a single GROUP BY over (owner_id, status, severity), which
+    ix_issues_owner_status_severity answers without reading the table.
+    Returns the `reporter_limit` reporters with the most issues.
+    """
+    status_counts = {status: 0 for status in models.IssueStatus}
+    severity_counts = {severity: 0 for severity in models.IssueSeverity}
+    status_severity_counts = {status: {severity: 0 for severity in models.IssueSeverity} for status in models.IssueStatus}
+    reporters: Dict[int, Dict] = {}
+    results = db.query(
+        models.Issue.owner_id, models.Issue.status, models.Issue.severity, func.count()
+    ).group_by(models.Issue.owner_id, models.Issue.status, models.Issue.severity).all()
+    for owner_id, status_enum, severity_enum, count in results:
+        status_counts[status_enum] += count
+        severity_counts[severity_enum] += count
+        status_severity_counts[status_enum][severity_enum] += count
+        reporter = reporters.setdefault(owner_id, {
+            "owner_id": owner_id, "total": 0, "status_counts": {status: 0 for status in models.IssueStatus}
+        })
+        reporter["total"] += count
+        reporter["status_counts"][status_enum] += count
+    top_reporters = sorted(reporters.values(), key=lambda reporter: (-reporter["total"], reporter["owner_id"]))
+    return {
+        "total": sum(status_counts.values()),
+        "status_counts": status_counts,
+        "severity_counts": severity_counts,
+        "status_severity_counts": status_severity_counts,
+        "reporter_count": len(reporters),
+        "top_reporters": top_reporters[:reporter_limit],
+    }
+
+# --- Issue Event Operations ---
+
+def iter_issue_events(db: Session, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                      issue_id: Optional[int] = None, batch_size: int = 1000) -> Iterator[models.IssueEvent]:
+    """
+    Streams issue events in [since, until) in the order they happened through a server-side cursor.
+    Consumers computing analytics incrementally pass the end of their previous range as `since`.
+    """
+    query = db.query(models.IssueEvent)
+    if since is not None:
+        query = query.filter(models.IssueEvent.at >= since)
+    if until is not None:
+        query = query.filter(models.IssueEvent.at < until)
+    if issue_id is not None:
+        query = query.filter(models.IssueEvent.issue_id == issue_id)
+    return iter(query.order_by(models.IssueEvent.at, models.IssueEvent.id).yield_per(batch_size))
+
 # --- Daily Stats Operations ---
 
 def create_daily_stats(db: Session, stats_date: date, counts: Dict[models.IssueStatus, int]) -> models.DailyStats:
@@ -184,3 +400,39 @@ def get_all_daily_stats(db: Session, skip: int = 0, limit: int = 100) -> List[mo
     Retrieves all daily statistics records with pagination.
     """
     return db.query(models.DailyStats).offset(skip).limit(limit).all()
+
+def iter_daily_stats(db: Session, batch_size: int = 1000) -> Iterator[models.DailyStats]:
+    """
+    Streams daily statistics records ordered by date through a server-side cursor.
+    """
+    return iter(db.query(models.DailyStats).order_by(models.DailyStats.date).yield_per(batch_size))
+
+# --- Export Job Operations ---
+
+def create_export_job(db: Session, job: schemas.ExportJobCreate, requested_by_id: int) -> models.ExportJob:
+    """
+    Creates a new pending export job.
+    """
+    db_job = models.ExportJob(dataset=job.dataset, format=job.format, requested_by_id=requested_by_id)
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_export_job(db: Session, job_id: int) -> Optional[models.ExportJob]:
+    """
+    Retrieves a single export job by its ID.
+    """
+    return db.query(models.ExportJob).filter(models.ExportJob.id == job_id).first()
+
+def update_export_job(db: Session, job_id: int, **fields) -> Optional[models.ExportJob]:
+    """
+    Updates the state of an export job (status, file_path, row_count, error, completed_at).
+    """
+    db_job = get_export_job(db, job_id)
+    if db_job:
+        for key, value in fields.items():
+            setattr(db_job, key, value)
+        db.commit()
+        db.refresh(db_job)
+    return db_job
@@ -1,11 +1,17 @@
 # backend/app/database.py
 
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
 
+from .deadlines import apply_deadline, install_deadline_reset, request_deadline
+from .db_pool import PRE_PING_STRATEGIES, InstrumentedQueuePool, install_idle_ping, pool_status
+from .replicas import ReplicaSet, RoutingSession
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -17,14 +23,57 @@ if not DATABASE_URL:
     raise ValueError(
         "DATABASE_URL environment variable not set. Please create a .env file.")
 
+# Connection pool settings, per worker process. Connections beyond DB_POOL_SIZE (up to
+# DB_MAX_OVERFLOW more) are closed when returned; once all are in use, checkouts wait up to
+# DB_POOL_TIMEOUT_SECONDS. Connections are replaced after DB_POOL_RECYCLE_SECONDS.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+# How pooled connections are checked before use: "checkout", "idle" or "off" (see db_pool.py)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "idle").lower()
+# Connections unused for longer than this are pinged before use with the "idle" strategy
+DB_POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", "30"))
+
+if DB_POOL_PRE_PING not in PRE_PING_STRATEGIES:
+    raise ValueError(f"DB_POOL_PRE_PING must be one of {', '.join(PRE_PING_STRATEGIES)}")
+
+def _pool_options(url: str) -> dict:
+    # In-memory SQLite lives in a single connection, which cannot be pooled
+    database_url = make_url(url)
+    if database_url.get_backend_name() == "sqlite" and database_url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+    }
+
+def _create_engine(url: str):
+    created = create_engine(url, pool_pre_ping=DB_POOL_PRE_PING == "checkout", **_pool_options(url))
+    if DB_POOL_PRE_PING == "idle":
+        install_idle_ping(created, DB_POOL_PING_IDLE_SECONDS)
+    install_deadline_reset(created)
+    return created
+
 # Create the SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True
-)
+engine = _create_engine(DATABASE_URL)
+
+# Optional comma-separated read replica URLs. Read-only requests are spread over them
+# round-robin; writes and everything outside requests use the primary.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# How often each worker pings its replicas; failing ones are skipped until they pass again
+DB_REPLICA_HEALTH_CHECK_SECONDS = int(os.getenv("DB_REPLICA_HEALTH_CHECK_SECONDS", "15"))
+
+replicas = ReplicaSet([_create_engine(url) for url in DATABASE_REPLICA_URLS])
 
-# Create a SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Requests with these methods only read, so their sessions may read from a replica
+READ_ONLY_METHODS = ("GET", "HEAD")
+
+# Create a SessionLocal class. Sessions use the primary unless given a replica.
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
 
 # Base class for our declarative models (tables)
 Base = declarative_base()
@@ -32,13 +81,34 @@ Base = declarative_base()
 # Dependency to get a database session
 
 
-def get_db():
+def get_db(request: Request = None):
     """
     Dependency function to provide a database session.
     It yields a session and ensures it's closed after the request.
+    Sessions of read-only requests read from a healthy replica, if any are configured.
+    Statements are cancelled once the request's deadline passes.
     """
-    db = SessionLocal()
+    replica = replicas.choose() if replicas and request is not None and request.method in READ_ONLY_METHODS else None
+    db = SessionLocal(replica=replica)
+    deadline = request_deadline(request)
+    if deadline is not None:
+        apply_deadline(db, deadline)
     try:
         yield db
     finally:
         db.close()
+
+def get_pool_status() -> dict:
+    """
+    Reports this worker's connection pool occupancy and checkout statistics.
+    """
+    return pool_status(engine, DB_POOL_PRE_PING)
+
+def get_replica_status() -> list:
+    """
+    Reports each read replica's health and connection pool, as seen from this worker.
+    """
+    return [
+        {**status, "database_pool": pool_status(replica.engine, DB_POOL_PRE_PING)}
+        for replica, status in zip(replicas.replicas, replicas.status())
+    ]
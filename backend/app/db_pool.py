@@ -0,0 +1,140 @@
+# backend/app/db_pool.py
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Recent checkout waits kept for percentiles
+WAIT_SAMPLES = 1024
+
+# Liveness checks for pooled connections, set with DB_POOL_PRE_PING:
+# - "checkout": ping on every checkout (SQLAlchemy's pool_pre_ping), one extra round trip each time
+# - "idle": ping only connections that sat unused for longer than the idle threshold
+# - "off": never ping; dead connections surface as errors and are replaced afterwards
+PRE_PING_STRATEGIES = ("checkout", "idle", "off")
+
+class PoolMetrics:
+    """
+    Checkout counters and wait times of a connection pool in this worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.last_timeout_at: Optional[float] = None # time.monotonic()
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._recent_waits = deque(maxlen=WAIT_SAMPLES)
+
+    def record_checkout(self, wait_seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+            self._recent_waits.append(wait_seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+            self.last_timeout_at = time.monotonic()
+
+    def wait_percentile(self, percentile: float) -> float:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+        if not waits:
+            return 0.0
+        return waits[min(len(waits) - 1, int(len(waits) * percentile / 100))]
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that times every checkout, i.e. how long a caller waited for a free connection,
+    including opening or pinging one, and counts checkouts that timed out.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+def install_idle_ping(engine: Engine, idle_seconds: float):
+    """
+    Pings connections on checkout only when they were idle in the pool for more than
+    `idle_seconds`, which is when the server or a proxy may have dropped them. A failed ping
+    discards the connection and the pool retries with a fresh one.
+    """
+    @event.listens_for(engine, "checkin")
+    def mark_idle(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at <= idle_seconds:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            logger.warning(f"Discarding idle database connection that failed a ping: {e}")
+            raise exc.DisconnectionError() from e
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+def pool_status(engine: Engine, pre_ping: str) -> Dict:
+    """
+    Reports the engine pool's occupancy and checkout statistics. The pool is saturated when
+    every connection it may open is checked out, so further requests queue for one.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__, "pre_ping": pre_ping, "saturated": False}
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    status = {
+        "pool_class": type(pool).__name__,
+        "pre_ping": pre_ping,
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturated": pool._max_overflow >= 0 and checked_out >= capacity,
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update({
+            "checkouts": metrics.checkouts,
+            "timeouts": metrics.timeouts,
+            "seconds_since_last_timeout": None if metrics.last_timeout_at is None else round(time.monotonic() - metrics.last_timeout_at, 3),
+            "wait_ms_avg": round(metrics.total_wait_seconds / metrics.checkouts * 1000, 3) if metrics.checkouts else 0.0,
+            "wait_ms_p95": round(metrics.wait_percentile(95) * 1000, 3),
+            "wait_ms_max": round(metrics.max_wait_seconds * 1000, 3),
+        })
+    return status
@@ -0,0 +1,153 @@
+# backend/app/deadlines.py
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.routing import Match
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Time a request may take before its database statements are cancelled
+REQUEST_TIMEOUT_SECONDS = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "10"))
+
+# Routes that legitimately need longer, by path template
+ROUTE_TIMEOUT_SECONDS: Dict[str, float] = {
+    "/api/v1/issues/export": 300,
+    "/api/v1/issues/{issue_id}/attachments": 600, # The body is streamed to storage within the request
+    "/api/v1/dashboard/summary": 30,
+    "/api/v1/dashboard/history": 30,
+    "/api/v1/dashboard/sla": 30,
+    "/api/v1/dashboard/slices": 30,
+}
+
+# SQLite checks the deadline every this many virtual machine instructions
+SQLITE_PROGRESS_INTERVAL = 10000
+
+# Postgres error code for a statement cancelled by statement_timeout
+QUERY_CANCELED = "57014"
+
+class DeadlineExceeded(Exception):
+    pass
+
+class DeadlineMetrics:
+    """
+    Per-route counts of requests that ran out of time in this worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, route: str, outcome: str):
+        with self._lock:
+            counts = self.counts.setdefault(route, {"deadline_exceeded": 0, "pool_timeouts": 0})
+            counts[outcome] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                {"route": route, "timeout_seconds": route_timeout(route), **counts}
+                for route, counts in sorted(self.counts.items())
+            ]
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+
+deadline_metrics = DeadlineMetrics()
+
+def route_timeout(route: str) -> float:
+    return ROUTE_TIMEOUT_SECONDS.get(route, REQUEST_TIMEOUT_SECONDS)
+
+def _route_path(request: Request) -> str:
+    # Middleware runs before routing, so find the route the router is about to pick
+    partial = None
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or request.url.path
+
+def remaining_seconds(deadline: float) -> float:
+    return deadline - time.monotonic()
+
+def is_deadline_error(error: BaseException) -> bool:
+    """
+    Whether a database error means a statement was cancelled because its deadline passed.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return True
+    if isinstance(error, exc.OperationalError):
+        original = error.orig
+        return getattr(original, "pgcode", None) == QUERY_CANCELED or getattr(original, "sqlstate", None) == QUERY_CANCELED \
+            or str(original) == "interrupted"
+    return False
+
+async def deadline_middleware(request: Request, call_next):
+    """
+    Gives each request a deadline, from its route's timeout, for get_db to enforce on the
+    database. Cancelled statements return 504 and exhausted pools 503, counted per route.
+    """
+    route = _route_path(request)
+    request.state.route = route
+    request.state.deadline = time.monotonic() + route_timeout(route)
+    try:
+        return await call_next(request)
+    except Exception as e:
+        if is_deadline_error(e):
+            deadline_metrics.record(route, "deadline_exceeded")
+            logger.warning("Request deadline exceeded", extra={"route": route, "method": request.method})
+            return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content={"detail": "Request deadline exceeded"})
+        if isinstance(e, exc.TimeoutError):
+            deadline_metrics.record(route, "pool_timeouts")
+            logger.warning("No database connection available", extra={"route": route, "method": request.method})
+            return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"detail": "Database is busy, retry shortly"},
+                                headers={"Retry-After": "1"})
+        raise
+
+def apply_deadline(db: Session, deadline: float):
+    """
+    Bounds every statement `db` runs by the time left until `deadline` (time.monotonic()).
+    Postgres gets a transaction-local statement_timeout; SQLite is interrupted from its
+    progress handler. A transaction starting after the deadline raises DeadlineExceeded.
+    """
+    @event.listens_for(db, "after_begin")
+    def limit_statements(session, transaction, connection):
+        remaining = remaining_seconds(deadline)
+        if remaining <= 0:
+            raise DeadlineExceeded("Request deadline exceeded")
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(1, int(remaining * 1000))}")
+        elif connection.dialect.name == "sqlite":
+            connection.connection.dbapi_connection.set_progress_handler(lambda: time.monotonic() > deadline, SQLITE_PROGRESS_INTERVAL)
+
+def install_deadline_reset(engine: Engine):
+    """
+    Clears SQLite progress handlers when connections return to the pool, so a request's
+    deadline never outlives it. Postgres timeouts are transaction-local and need nothing.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "checkin")
+    def reset_progress_handler(dbapi_connection, connection_record):
+        if dbapi_connection is not None:
+            dbapi_connection.set_progress_handler(None, 0)
+
+def request_deadline(request: Optional[Request]) -> Optional[float]:
+    if request is None:
+        return None
+    return getattr(request.state, "deadline", None)
@@ -0,0 +1,212 @@
+# backend/app/dedup.py
+
+import logging
+import os
+import re
+import tempfile
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from .indexing import IssueIndex
+from . import crud
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Where the index snapshot is written on shutdown and read back on startup
+DUPLICATE_INDEX_SNAPSHOT = os.getenv("DUPLICATE_INDEX_SNAPSHOT", "duplicate_index.npz")
+
+# MinHash / LSH parameters. 32 bands of 4 rows put the LSH S-curve midpoint near
+# a Jaccard similarity of 0.42, so pairs above DUPLICATE_THRESHOLD are very likely
+# to share at least one bucket.
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 4
+DUPLICATE_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, _MAX_HASH, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.randint(0, _MAX_HASH, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+_NON_WORD = re.compile(r"\W+", re.UNICODE)
+
+def shingles(text: str) -> Set[str]:
+    """
+    Returns the character shingles of whitespace- and punctuation-normalized text.
+    Character shingles tolerate typos and word-order changes between reports.
+    """
+    normalized = _NON_WORD.sub(" ", text.lower()).strip()
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    Computes the MinHash signature of a document, or None if it has no shingles.
+    """
+    tokens = shingles(text)
+    if not tokens:
+        return None
+    hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in tokens), dtype=np.uint64, count=len(tokens))
+    # (a * x + b) mod p stays below 2**64 because a, b and x are all 32-bit values
+    permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return (permuted.min(axis=1) & _MAX_HASH).astype(np.uint32)
+
+def issue_text(title: Optional[str], description: Optional[str]) -> str:
+    return f"{title or ''} {description or ''}"
+
+class DuplicateIndex(IssueIndex):
+    """
+    In-memory MinHash locality-sensitive-hashing index over issue titles and descriptions.
+    Lookups only compare against issues that share an LSH bucket, not the whole table.
+    """
+    name = "duplicate index"
+
+    def _reset(self):
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._entries: Dict[int, Tuple[int, str]] = {} # issue_id -> (owner_id, title)
+        self._buckets: List[Dict[bytes, Set[int]]] = [defaultdict(set) for _ in range(BANDS)]
+
+    def _indexed_ids(self) -> Set[int]:
+        return set(self._signatures)
+
+    def _index_row(self, row):
+        self._insert(row.id, row.owner_id, row.title, minhash_signature(issue_text(row.title, row.description)))
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes() for band in range(BANDS)]
+
+    def _insert(self, issue_id: int, owner_id: int, title: str, signature: Optional[np.ndarray]):
+        self._remove(issue_id)
+        if signature is None:
+            return
+        self._signatures[issue_id] = signature
+        self._entries[issue_id] = (owner_id, title)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].add(issue_id)
+
+    def _remove(self, issue_id: int):
+        signature = self._signatures.pop(issue_id, None)
+        if signature is None:
+            return
+        self._entries.pop(issue_id, None)
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(issue_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def add(self, issue_id: int, owner_id: int, title: str, description: Optional[str]):
+        """
+        Adds or re-indexes a single issue.
+        """
+        signature = minhash_signature(issue_text(title, description))
+        with self._lock:
+            self._insert(issue_id, owner_id, title, signature)
+
+    def find_duplicates(self, title: str, description: Optional[str] = None, owner_id: Optional[int] = None,
+                        limit: int = 5, threshold: float = DUPLICATE_THRESHOLD) -> List[Dict]:
+        """
+        Returns up to `limit` indexed issues whose estimated Jaccard similarity is at least `threshold`,
+        most similar first. Restricts matches to a single owner when `owner_id` is given.
+        """
+        signature = minhash_signature(issue_text(title, description))
+        if signature is None:
+            return []
+        with self._lock:
+            candidates: Set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(key, ()))
+            if owner_id is not None:
+                candidates = {issue_id for issue_id in candidates if self._entries[issue_id][0] == owner_id}
+            if not candidates:
+                return []
+            candidate_ids = list(candidates)
+            similarities = (np.stack([self._signatures[issue_id] for issue_id in candidate_ids]) == signature).mean(axis=1)
+            titles = [self._entries[issue_id][1] for issue_id in candidate_ids]
+
+        ranked = sorted(zip(candidate_ids, titles, similarities), key=lambda match: (-match[2], -match[0]))
+        return [
+            {"issue_id": issue_id, "title": title, "similarity": round(float(similarity), 3)}
+            for issue_id, title, similarity in ranked
+            if similarity >= threshold
+        ][:limit]
+
+    # --- Snapshots ---
+
+    def save_snapshot(self, path: str):
+        """
+        Writes the signatures and metadata to an .npz file so restarts skip the full rebuild.
+        """
+        with self._lock:
+            issue_ids = list(self._signatures)
+            signatures = np.stack([self._signatures[issue_id] for issue_id in issue_ids]) if issue_ids else np.empty((0, NUM_PERMUTATIONS), dtype=np.uint32)
+            owners = [self._entries[issue_id][0] for issue_id in issue_ids]
+            titles = [self._entries[issue_id][1] for issue_id in issue_ids]
+            indexed_at = self.indexed_at or datetime.utcnow()
+        # Each writer gets its own temporary file, so workers saving at shutdown never mix their writes
+        fd, partial_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".partial.npz", dir=os.path.dirname(path) or ".")
+        try:
+            with os.fdopen(fd, "wb") as partial:
+                np.savez(
+                    partial,
+                    ids=np.array(issue_ids, dtype=np.int64),
+                    owners=np.array(owners, dtype=np.int64),
+                    titles=np.array(titles, dtype=np.str_),
+                    signatures=signatures,
+                    indexed_at=np.array(indexed_at.isoformat()),
+                    params=np.array([NUM_PERMUTATIONS, BANDS, SHINGLE_SIZE]),
+                )
+            os.replace(partial_path, path)
+        except BaseException:
+            os.remove(partial_path)
+            raise
+        logger.info("Duplicate index snapshot saved", extra={"path": path, "issue_count": len(issue_ids)})
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Loads a snapshot written by save_snapshot. Returns False if it is missing or incompatible.
+        """
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as snapshot:
+            if snapshot["params"].tolist() != [NUM_PERMUTATIONS, BANDS, SHINGLE_SIZE]:
+                logger.warning("Duplicate index snapshot was built with different parameters; ignoring it")
+                return False
+            with self._lock:
+                self.clear()
+                for issue_id, owner_id, title, signature in zip(snapshot["ids"], snapshot["owners"], snapshot["titles"], snapshot["signatures"]):
+                    self._insert(int(issue_id), int(owner_id), str(title), signature.copy())
+                self.indexed_at = datetime.fromisoformat(str(snapshot["indexed_at"]))
+        return True
+
+    def load_or_build(self, db: Session, path: str = DUPLICATE_INDEX_SNAPSHOT):
+        """
+        Restores the index from a snapshot and catches up on changes made since it was taken,
+        falling back to a full rebuild when no usable snapshot exists.
+        """
+        try:
+            loaded = self.load_snapshot(path)
+        except Exception as e:
+            logger.error(f"Could not read duplicate index snapshot: {e}", exc_info=True)
+            loaded = False
+        if not loaded:
+            self.build(db)
+            return
+
+        self.catch_up(db)
+        logger.info("Duplicate index restored from snapshot", extra={"path": path, "issue_count": len(self)})
+
+duplicate_index = DuplicateIndex()
+crud.issue_write_hooks.append(duplicate_index.on_issue_write)
@@ -0,0 +1,285 @@
+# backend/app/exports.py
+
+import csv
+import enum
+import io
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from . import crud, models
+from .database import SessionLocal
+from .job_queue import enqueue_job, job_handlers
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Directory where columnar export files are written
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+
+# Where columnar exports run: "queue" hands them to the job queue workers (python -m app.worker),
+# "local" to a small executor in the web process, separate from the threads serving requests
+EXPORT_RUNNER = os.getenv("EXPORT_RUNNER", "local")
+
+# Exports running at once per web process with the local runner; further exports wait their turn
+EXPORT_LOCAL_WORKERS = int(os.getenv("EXPORT_LOCAL_WORKERS", "2"))
+
+# Column order shared by every export format
+ISSUE_EXPORT_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "severity",
+    "status",
+    "created_at",
+    "updated_at",
+    "owner_id",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+def _serialize_value(value):
+    """
+    Converts enum and datetime values to their plain string form.
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def issue_rows_to_csv(rows: Iterable, chunk_size: int = 1000) -> Iterator[str]:
+    """
+    Encodes issue rows as CSV, yielding one text chunk per `chunk_size` rows.
+    The header row is always emitted, even for an empty export.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(ISSUE_EXPORT_FIELDS)
+    pending = 0
+    for row in rows:
+        writer.writerow([_serialize_value(value) for value in row])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue()
+
+def issue_rows_to_ndjson(rows: Iterable, chunk_size: int = 1000) -> Iterator[str]:
+    """
+    Encodes issue rows as newline-delimited JSON, yielding one text chunk per `chunk_size` rows.
+    """
+    lines = []
+    for row in rows:
+        record = {field: _serialize_value(value) for field, value in zip(ISSUE_EXPORT_FIELDS, row)}
+        lines.append(json.dumps(record))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+EXPORT_ENCODERS = {
+    "csv": issue_rows_to_csv,
+    "ndjson": issue_rows_to_ndjson,
+}
+
+def stream_issue_export(db: Session, export_format: str, owner_id: Optional[int] = None, batch_size: int = 1000) -> Iterator[str]:
+    """
+    Streams an issue export in the requested format and closes the session when done.
+    The session is owned by the stream, so it must not be shared with the request.
+    """
+    encoder = EXPORT_ENCODERS[export_format]
+    try:
+        rows = crud.iter_issues(db, owner_id=owner_id, batch_size=batch_size)
+        yield from encoder(rows, chunk_size=batch_size)
+    finally:
+        db.close()
+
+# --- Columnar (Parquet / Arrow IPC) exports ---
+
+COLUMNAR_FILE_EXTENSIONS = {
+    models.ExportFileFormat.PARQUET: "parquet",
+    models.ExportFileFormat.ARROW: "arrow",
+}
+
+def _enum_dictionary_type():
+    return pa.dictionary(pa.int8(), pa.string())
+
+ISSUE_ARROW_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("title", pa.string()),
+    ("description", pa.string()),
+    ("severity", _enum_dictionary_type()),
+    ("status", _enum_dictionary_type()),
+    ("created_at", pa.timestamp("us")),
+    ("updated_at", pa.timestamp("us")),
+    ("owner_id", pa.int64()),
+])
+
+DAILY_STATS_ARROW_SCHEMA = pa.schema(
+    [("date", pa.timestamp("us"))] + [(status.value, pa.int64()) for status in models.IssueStatus]
+)
+
+def _batched(rows: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def _enum_column(values, enum_cls) -> pa.DictionaryArray:
+    """
+    Encodes enum members against the full, declaration-ordered set of enum values.
+    Every batch shares one dictionary, so readers see a stable categorical type.
+    """
+    members = list(enum_cls)
+    index = {member: position for position, member in enumerate(members)}
+    return pa.DictionaryArray.from_arrays(
+        pa.array([index[value] for value in values], type=pa.int8()),
+        pa.array([member.value for member in members], type=pa.string()),
+    )
+
+def _issue_record_batch(rows: List) -> pa.RecordBatch:
+    ids, titles, descriptions, severities, statuses, created, updated, owners = zip(*rows)
+    return pa.RecordBatch.from_arrays([
+        pa.array(ids, type=pa.int64()),
+        pa.array(titles, type=pa.string()),
+        pa.array(descriptions, type=pa.string()),
+        _enum_column(severities, models.IssueSeverity),
+        _enum_column(statuses, models.IssueStatus),
+        pa.array(created, type=pa.timestamp("us")),
+        pa.array(updated, type=pa.timestamp("us")),
+        pa.array(owners, type=pa.int64()),
+    ], schema=ISSUE_ARROW_SCHEMA)
+
+def _daily_stats_record_batch(stats: List[models.DailyStats]) -> pa.RecordBatch:
+    columns = [pa.array([row.date for row in stats], type=pa.timestamp("us"))]
+    for status in models.IssueStatus:
+        columns.append(pa.array([row.issue_counts_by_status.get(status.value, 0) for row in stats], type=pa.int64()))
+    return pa.RecordBatch.from_arrays(columns, schema=DAILY_STATS_ARROW_SCHEMA)
+
+def write_record_batches(path: str, schema: pa.Schema, batches: Iterable[pa.RecordBatch], file_format: models.ExportFileFormat) -> int:
+    """
+    Writes record batches to a Parquet or Arrow IPC file one batch at a time.
+    Returns the number of rows written.
+    """
+    row_count = 0
+    if file_format == models.ExportFileFormat.PARQUET:
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+    else:
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+    return row_count
+
+def write_columnar_export(db: Session, dataset: models.ExportDataset, path: str, file_format: models.ExportFileFormat, batch_size: int = 10000) -> int:
+    """
+    Writes a whole table to a columnar file, reading it from a DB cursor in batches.
+    """
+    if dataset == models.ExportDataset.ISSUES:
+        rows = crud.iter_issues(db, batch_size=batch_size)
+        batches = (_issue_record_batch(batch) for batch in _batched(rows, batch_size))
+        return write_record_batches(path, ISSUE_ARROW_SCHEMA, batches, file_format)
+    stats = crud.iter_daily_stats(db, batch_size=batch_size)
+    batches = (_daily_stats_record_batch(batch) for batch in _batched(stats, batch_size))
+    return write_record_batches(path, DAILY_STATS_ARROW_SCHEMA, batches, file_format)
+
+def run_export_job(db: Session, job_id: int, batch_size: int = 10000):
+    """
+    Runs a pending export job to completion and records the outcome on the job row.
+    Intended to run in the background; the session is owned and closed by this function.
+    """
+    partial_path = None
+    try:
+        job = crud.update_export_job(db, job_id, status=models.ExportStatus.RUNNING)
+        if job is None:
+            logger.warning("Export job not found", extra={"job_id": job_id})
+            return
+
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        file_name = f"{job.dataset.value.lower()}-{job.id}.{COLUMNAR_FILE_EXTENSIONS[job.format]}"
+        path = os.path.join(EXPORT_DIR, file_name)
+        partial_path = f"{path}.partial"
+
+        row_count = write_columnar_export(db, job.dataset, partial_path, job.format, batch_size=batch_size)
+        os.replace(partial_path, path) # Only expose fully written files
+
+        crud.update_export_job(
+            db, job_id,
+            status=models.ExportStatus.COMPLETED,
+            file_path=path,
+            row_count=row_count,
+            completed_at=datetime.utcnow(),
+        )
+        logger.info("Export job completed", extra={"job_id": job_id, "row_count": row_count})
+    except Exception as e:
+        logger.error(f"Export job failed: {e}", exc_info=True, extra={"job_id": job_id})
+        if partial_path is not None and os.path.exists(partial_path):
+            os.remove(partial_path)
+        db.rollback()
+        crud.update_export_job(
+            db, job_id,
+            status=models.ExportStatus.FAILED,
+            error=str(e),
+            completed_at=datetime.utcnow(),
+        )
+    finally:
+        db.close()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _local_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=EXPORT_LOCAL_WORKERS, thread_name_prefix="export")
+        return _executor
+
+def shutdown_export_executor():
+    """
+    Stops the local export threads, if they were started, abandoning exports not yet begun.
+    Called on application shutdown.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+def start_export_job(db: Session, job: models.ExportJob):
+    """
+    Hands a pending export job to EXPORT_RUNNER, never to the threads serving requests.
+    """
+    if EXPORT_RUNNER == "queue":
+        enqueue_job(db, "export", {"export_job_id": job.id})
+    elif EXPORT_RUNNER == "local":
+        # The export outlives the request session, so give it its own
+        _local_executor().submit(run_export_job, SessionLocal(bind=db.get_bind()), job.id)
+    else:
+        raise ValueError("EXPORT_RUNNER must be queue or local")
+
+def _run_queued_export(db: Session, payload: dict):
+    run_export_job(db, payload["export_job_id"])
+
+# Runs the exports start_export_job queues when EXPORT_RUNNER is "queue"
+job_handlers["export"] = _run_queued_export
@@ -0,0 +1,244 @@
+# backend/app/idempotency.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, delete, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import models
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# How long a stored response is replayed to requests repeating its Idempotency-Key
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", str(24 * 3600)))
+
+# A claimed key whose request has not finished after this long is taken to be abandoned (e.g. its worker died)
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+
+# How long a duplicate waits for the in-flight original before it is answered 409 Conflict
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))
+
+# Completed responses each worker keeps in memory in front of the table
+IDEMPOTENCY_CACHE_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_CACHE_MAX_ENTRIES", "10000"))
+
+# Response header marking a replay of a stored response
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Upper bound of the backoff between checks on an in-flight original
+_MAX_POLL_SECONDS = 0.25
+
+# (scope, user ID, Idempotency-Key header value)
+KeyIdentity = Tuple[str, int, str]
+
+def request_fingerprint(body: Any) -> str:
+    """
+    Hash of a request body, to tell a retry from a different request reusing its key.
+    """
+    return hashlib.sha256(json.dumps(jsonable_encoder(body), sort_keys=True).encode()).hexdigest()
+
+class IdempotencyStore:
+    """
+    Runs a request at most once per Idempotency-Key and replays its response to retries.
+    Keys are claimed with an insert into the idempotency_keys table, so exactly one request
+    runs across all workers; duplicates arriving meanwhile wait for it to finish. Completed
+    responses are also kept in a bounded per-worker LRU, so replays usually skip the database.
+    Failed requests give their key up, so they can be retried.
+    """
+
+    def __init__(self, ttl_seconds: int = IDEMPOTENCY_KEY_TTL_SECONDS, lock_seconds: int = IDEMPOTENCY_LOCK_SECONDS,
+                 wait_seconds: float = IDEMPOTENCY_WAIT_SECONDS, max_entries: int = IDEMPOTENCY_CACHE_MAX_ENTRIES):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.lock = timedelta(seconds=lock_seconds)
+        self.wait_seconds = wait_seconds
+        self.max_entries = max_entries
+        # identity -> (expires_at, fingerprint, status_code, body)
+        self._responses: "OrderedDict[KeyIdentity, Tuple[datetime, str, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics: Dict[str, int] = {}
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+            self.metrics = {"executed": 0, "replayed": 0, "cache_hits": 0, "waited": 0, "conflicts": 0, "mismatches": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.metrics[name] += 1
+
+    def _cached(self, identity: KeyIdentity) -> Optional[Tuple[datetime, str, int, Any]]:
+        with self._lock:
+            entry = self._responses.get(identity)
+            if entry is not None and entry[0] <= datetime.utcnow():
+                del self._responses[identity]
+                entry = None
+            if entry is not None:
+                self._responses.move_to_end(identity)
+            return entry
+
+    def _remember(self, identity: KeyIdentity, expires_at: datetime, fingerprint: str, status_code: int, body: Any):
+        with self._lock:
+            self._responses[identity] = (expires_at, fingerprint, status_code, body)
+            self._responses.move_to_end(identity)
+            while len(self._responses) > self.max_entries:
+                self._responses.popitem(last=False)
+
+    def _check_fingerprint(self, fingerprint: str, stored_fingerprint: str):
+        if stored_fingerprint != fingerprint:
+            self._count("mismatches")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used with a different request"
+            )
+
+    def _replay(self, status_code: int, body: Any) -> JSONResponse:
+        self._count("replayed")
+        return JSONResponse(status_code=status_code, content=body, headers={REPLAYED_HEADER: "true"})
+
+    def _claim(self, db: Session, identity: KeyIdentity, fingerprint: str) -> Tuple[Optional[datetime], Optional[models.IdempotencyKey]]:
+        """
+        Tries to claim the key for this request. Returns the claim's lock expiry, which
+        identifies the claim, or the row of whichever request holds the key instead.
+        """
+        scope, user_id, key = identity
+        record = models.IdempotencyKey
+        now = datetime.utcnow()
+        values = dict(fingerprint=fingerprint, status=models.IdempotencyStatus.IN_PROGRESS, status_code=None, response=None,
+                      created_at=now, locked_until=now + self.lock, expires_at=now + self.ttl)
+        try:
+            db.execute(insert(record).values(scope=scope, user_id=user_id, key=key, **values))
+            db.commit()
+            return values["locked_until"], None
+        except IntegrityError:
+            db.rollback()
+        # Expired keys, and claims abandoned by a request that never finished, are taken over
+        result = db.execute(
+            update(record)
+            .where(record.scope == scope, record.user_id == user_id, record.key == key,
+                   or_(record.expires_at < now,
+                       and_(record.status == models.IdempotencyStatus.IN_PROGRESS, record.locked_until < now)))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount == 1:
+            return values["locked_until"], None
+        return None, db.get(record, identity, populate_existing=True)
+
+    def _complete(self, db: Session, identity: KeyIdentity, claim: datetime, fingerprint: str, status_code: int, body: Any):
+        scope, user_id, key = identity
+        record = models.IdempotencyKey
+        try:
+            db.execute(
+                update(record)
+                .where(record.scope == scope, record.user_id == user_id, record.key == key, record.locked_until == claim)
+                .values(status=models.IdempotencyStatus.COMPLETED, status_code=status_code, response=body)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception as e:
+            # The request succeeded; only retries after the lock expires can run it again
+            db.rollback()
+            logger.error(f"Could not store idempotent response: {e}", exc_info=True, extra={"scope": scope, "user_id": user_id})
+            return
+        self._remember(identity, claim - self.lock + self.ttl, fingerprint, status_code, body)
+
+    def _release(self, db: Session, identity: KeyIdentity, claim: datetime):
+        scope, user_id, key = identity
+        record = models.IdempotencyKey
+        try:
+            db.rollback()
+            db.execute(
+                delete(record)
+                .where(record.scope == scope, record.user_id == user_id, record.key == key, record.locked_until == claim,
+                       record.status == models.IdempotencyStatus.IN_PROGRESS)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Could not release idempotency key: {e}", exc_info=True, extra={"scope": scope, "user_id": user_id})
+
+    async def run(self, db: Session, identity: KeyIdentity, request_body: Any,
+                  handler: Callable[[], Awaitable[Any]], status_code: int) -> Any:
+        """
+        Returns handler()'s result if this request claims the key, storing it as JSON for
+        `status_code`. Otherwise returns the stored response, waiting for the original if it
+        is still running. Raises 422 if the key was used for a different request body, and
+        409 if the original is still running after the wait. Database work runs in the
+        thread pool, off the event loop.
+        """
+        fingerprint = request_fingerprint(request_body)
+        give_up_at = time.monotonic() + self.wait_seconds
+        delay = 0.01
+        waited = False
+        while True:
+            cached = self._cached(identity)
+            if cached is not None:
+                _, stored_fingerprint, stored_status_code, body = cached
+                self._count("cache_hits")
+                self._check_fingerprint(fingerprint, stored_fingerprint)
+                return self._replay(stored_status_code, body)
+            claim, holder = await run_in_threadpool(self._claim, db, identity, fingerprint)
+            if claim is not None:
+                break
+            # No holder means the original just failed and gave the key up; claim it again
+            if holder is not None:
+                self._check_fingerprint(fingerprint, holder.fingerprint)
+                if holder.status == models.IdempotencyStatus.COMPLETED:
+                    self._remember(identity, holder.expires_at, holder.fingerprint, holder.status_code, holder.response)
+                    return self._replay(holder.status_code, holder.response)
+            if time.monotonic() >= give_up_at:
+                self._count("conflicts")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is still in progress",
+                    headers={"Retry-After": "1"}
+                )
+            if not waited:
+                waited = True
+                self._count("waited")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_POLL_SECONDS)
+
+        try:
+            result = await handler()
+        except BaseException:
+            # Shielded so a cancelled request still gives its key up
+            await asyncio.shield(run_in_threadpool(self._release, db, identity, claim))
+            raise
+        self._count("executed")
+        await run_in_threadpool(self._complete, db, identity, claim, fingerprint, status_code, jsonable_encoder(result))
+        return result
+
+    def purge_expired(self, db: Session) -> int:
+        """
+        Deletes stored keys past their TTL. Returns how many were deleted.
+        """
+        record = models.IdempotencyKey
+        result = db.execute(delete(record).where(record.expires_at < datetime.utcnow()).execution_options(synchronize_session=False))
+        db.commit()
+        return result.rowcount
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {"cached_responses": len(self._responses), "max_entries": self.max_entries, **self.metrics}
+
+idempotency_store = IdempotencyStore()
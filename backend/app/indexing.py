@@ -0,0 +1,127 @@
+# backend/app/indexing.py
+
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Set
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from . import crud, models
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Catch-ups re-read changes this far behind the watermark, so writes committed after the previous
+# catch-up read past them (a long transaction, clock skew between app servers) are still indexed.
+# Re-indexing an unchanged issue is harmless.
+ISSUE_INDEX_WATERMARK_OVERLAP_SECONDS = int(os.getenv("ISSUE_INDEX_WATERMARK_OVERLAP_SECONDS", "300"))
+
+class IssueIndex(ABC):
+    """
+    Base class for in-process indexes over issue rows.
+    Subclasses store whatever they need per issue; this class keeps them in sync with the
+    issues table through crud's issue write hooks, full builds and watermark catch-ups.
+    Indexed rows expose the attributes in row_columns (ORM issues and query rows both do).
+    """
+    name = "issue index"
+    # Issue columns a subclass reads from each row
+    row_columns = ("id", "title", "description", "owner_id")
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Disabled indexes ignore writes, e.g. when the database serves the same queries itself
+        self.enabled = True
+        self.clear()
+
+    # --- Subclass interface ---
+
+    @abstractmethod
+    def _reset(self):
+        ...
+
+    @abstractmethod
+    def _index_row(self, row):
+        ...
+
+    @abstractmethod
+    def _remove(self, issue_id: int):
+        ...
+
+    @abstractmethod
+    def _indexed_ids(self) -> Set[int]:
+        ...
+
+    # --- Synchronization ---
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+            self.indexed_at: Optional[datetime] = None
+
+    def __len__(self):
+        return len(self._indexed_ids())
+
+    def remove(self, issue_id: int):
+        with self._lock:
+            self._remove(issue_id)
+
+    def _index_rows(self, rows: Iterable):
+        for row in rows:
+            self._index_row(row)
+
+    def on_issue_write(self, action: str, db_issue: models.Issue):
+        """
+        Issue write hook keeping the index in sync with crud.create_issue/update_issue/delete_issue.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if action == "deleted":
+                self._remove(db_issue.id)
+            else:
+                self._index_row(db_issue)
+
+    def build(self, db: Session, batch_size: int = 10000):
+        """
+        Rebuilds the index from every issue in the database.
+        """
+        started_at = datetime.utcnow()
+        with self._lock:
+            self.clear()
+            self._index_rows(crud.iter_issues(db, batch_size=batch_size))
+            self.indexed_at = started_at
+        logger.info(f"{self.name.capitalize()} built", extra={"issue_count": len(self)})
+
+    def catch_up(self, db: Session):
+        """
+        Re-indexes issues changed since the index was last synced and drops deleted ones.
+        Write hooks only fire in the process that made the write, so every worker runs this
+        periodically to pick up writes made by the others. Deletions are read from the DELETED
+        rows of issue_events, so neither query grows with the size of the issues table.
+        """
+        if not self.enabled:
+            return
+        if self.indexed_at is None:
+            self.build(db)
+            return
+        started_at = datetime.utcnow()
+        since = self.indexed_at - timedelta(seconds=ISSUE_INDEX_WATERMARK_OVERLAP_SECONDS)
+        event = models.IssueEvent
+        # Read before the changes and applied first: an ID that exists again (SQLite reuses
+        # the highest rowid) is re-indexed, and later deletions are seen by the next catch-up
+        deleted_ids = [issue_id for (issue_id,) in db.query(event.issue_id).filter(
+            event.event_type == models.IssueEventType.DELETED, event.at >= since
+        )]
+        changed = db.query(*(getattr(models.Issue, column) for column in self.row_columns)).filter(
+            models.Issue.updated_at >= since
+        ).all()
+        with self._lock:
+            for issue_id in deleted_ids:
+                self._remove(issue_id)
+            self._index_rows(changed)
+            self.indexed_at = started_at
@@ -0,0 +1,350 @@
+# backend/app/issue_cache.py
+
+import logging
+import os
+import select
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from . import models
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Serve crud.get_issue from an in-process cache of issue rows
+ISSUE_CACHE_ENABLED = os.getenv("ISSUE_CACHE_ENABLED", "true").lower() == "true"
+
+# Memory bound: least recently used rows are dropped beyond either limit
+ISSUE_CACHE_MAX_ENTRIES = int(os.getenv("ISSUE_CACHE_MAX_ENTRIES", "10000"))
+ISSUE_CACHE_MAX_BYTES = int(os.getenv("ISSUE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Rows are reloaded after this long even without an invalidation, in case one was missed
+ISSUE_CACHE_SECONDS = float(os.getenv("ISSUE_CACHE_SECONDS", "300"))
+
+# How invalidations reach other workers: "postgres" (LISTEN/NOTIFY) or "memory" (this process only).
+# Defaults to postgres on Postgres.
+ISSUE_CACHE_NOTIFIER = os.getenv("ISSUE_CACHE_NOTIFIER")
+
+# Postgres channel carrying invalidated issue IDs
+INVALIDATION_CHANNEL = "issue_cache_invalidation"
+
+# Rough per-row overhead of the dict, keys and non-text values, on top of text lengths
+_ROW_OVERHEAD_BYTES = 600
+
+_COLUMNS = [attribute.key for attribute in inspect(models.Issue).column_attrs]
+
+# Callback for invalidated issue IDs; None means anything may have changed
+InvalidationCallback = Callable[[Optional[int]], None]
+
+class InvalidationNotifier(ABC):
+    """
+    Carries issue invalidations between workers. Every subscriber, in every worker, is called
+    with each published issue ID.
+    """
+
+    @abstractmethod
+    def subscribe(self, callback: InvalidationCallback):
+        ...
+
+    @abstractmethod
+    def publish(self, issue_id: int):
+        ...
+
+    # Whether publish_in() delivers invalidations with the writing transaction's commit,
+    # making publish() after the commit unnecessary
+    transactional = False
+
+    def publish_in(self, db: Session, issue_id: int):
+        """
+        Publishes as part of `db`'s open transaction, so other workers hear of the write
+        exactly when, and only if, it commits. Does nothing unless transactional.
+        """
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+class InMemoryNotifier(InvalidationNotifier):
+    """
+    Delivers invalidations to subscribers in this process only. Enough for a single worker,
+    and lets tests stand in several workers' caches with one notifier.
+    """
+
+    def __init__(self):
+        self._subscribers: List[InvalidationCallback] = []
+
+    def subscribe(self, callback: InvalidationCallback):
+        self._subscribers.append(callback)
+
+    def publish(self, issue_id: int):
+        for callback in self._subscribers:
+            callback(issue_id)
+
+class PostgresNotifier(InvalidationNotifier):
+    """
+    Publishes invalidations with pg_notify and receives them on a dedicated LISTEN connection,
+    outside the pool, in a background thread. After losing that connection, subscribers are
+    told everything may have changed, since notifications sent meanwhile are lost.
+    """
+
+    def __init__(self, engine: Engine, channel: str = INVALIDATION_CHANNEL):
+        self.engine = engine
+        self.channel = channel
+        self._subscribers: List[InvalidationCallback] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: InvalidationCallback):
+        self._subscribers.append(callback)
+
+    # NOTIFY is queued by the transaction and sent by Postgres on commit
+    transactional = True
+
+    def publish(self, issue_id: int):
+        with self.engine.connect() as connection:
+            self._notify(connection, issue_id)
+            connection.commit()
+
+    def publish_in(self, db: Session, issue_id: int):
+        self._notify(db, issue_id)
+
+    def _notify(self, connection, issue_id: int):
+        connection.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": str(issue_id)})
+
+    def _deliver(self, issue_id: Optional[int]):
+        for callback in self._subscribers:
+            callback(issue_id)
+
+    def _listen(self):
+        connect_args, connect_kwargs = self.engine.dialect.create_connect_args(self.engine.url)
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = self.engine.dialect.dbapi.connect(*connect_args, **connect_kwargs)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.channel}")
+                self._deliver(None)
+                while not self._stopped.is_set():
+                    if select.select([connection], [], [], 1.0)[0]:
+                        connection.poll()
+                        while connection.notifies:
+                            notification = connection.notifies.pop(0)
+                            self._deliver(int(notification.payload))
+            except Exception as e:
+                logger.warning(f"Issue cache invalidation listener failed, reconnecting: {e}")
+                self._stopped.wait(5)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._listen, name="issue-cache-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+def create_notifier(engine: Engine) -> InvalidationNotifier:
+    kind = ISSUE_CACHE_NOTIFIER or ("postgres" if engine.dialect.name == "postgresql" else "memory")
+    if kind == "postgres":
+        return PostgresNotifier(engine)
+    if kind == "memory":
+        return InMemoryNotifier()
+    raise ValueError("ISSUE_CACHE_NOTIFIER must be postgres or memory")
+
+def _row_bytes(values: Dict) -> int:
+    return _ROW_OVERHEAD_BYTES + sum(len(value) for value in values.values() if isinstance(value, str))
+
+class IssueCache:
+    """
+    LRU read-through cache of issue rows (column values only), bounded by entry count and
+    approximate bytes. Rows are invalidated by issue writes here and, through the notifier,
+    in every other worker.
+    """
+
+    def __init__(self, max_entries: int = ISSUE_CACHE_MAX_ENTRIES, max_bytes: int = ISSUE_CACHE_MAX_BYTES,
+                 ttl_seconds: float = ISSUE_CACHE_SECONDS, notifier: Optional[InvalidationNotifier] = None):
+        self.enabled = True
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, int, Dict]]" = OrderedDict()
+        self._bytes = 0
+        # Bumped by every invalidation, so a load that raced with one is not cached
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.notifier = None
+        self.set_notifier(notifier or InMemoryNotifier())
+
+    def set_notifier(self, notifier: InvalidationNotifier):
+        self.notifier = notifier
+        notifier.subscribe(self._on_notification)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, issue_id: int) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(issue_id)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._drop(issue_id)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(issue_id)
+            return entry[2]
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(self, issue_id: int, values: Dict, generation: int):
+        """
+        Caches a row loaded after generation() returned `generation`, unless an invalidation
+        happened since, in which case the row may already be stale.
+        """
+        size = _row_bytes(values)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._drop(issue_id)
+            self._entries[issue_id] = (time.monotonic() + self.ttl_seconds, size, values)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _drop(self, issue_id: int):
+        entry = self._entries.pop(issue_id, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def invalidate(self, issue_id: Optional[int]):
+        """
+        Drops a row from this worker's cache, or every row when `issue_id` is None.
+        """
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if issue_id is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                self._drop(issue_id)
+
+    def _on_notification(self, issue_id: Optional[int]):
+        self.invalidate(issue_id)
+
+    def before_issue_commit(self, db: Session, issue_id: int):
+        """
+        Called by crud before committing an update or deletion of an issue, to publish the
+        invalidation within that transaction when the notifier supports it.
+        """
+        self.notifier.publish_in(db, issue_id)
+
+    def on_issue_write(self, action: str, db_issue: models.Issue):
+        """
+        Issue write hook: drops the row here, then tells the other workers unless the write's
+        transaction already did. New issues cannot be cached anywhere yet, so they are skipped.
+        """
+        if action == "created":
+            return
+        self.invalidate(db_issue.id)
+        if self.notifier.transactional:
+            return
+        try:
+            self.notifier.publish(db_issue.id)
+        except Exception as e:
+            logger.error(f"Failed to publish issue cache invalidation: {e}", extra={"issue_id": db_issue.id})
+
+    def read_through(self, db: Session, issue_id: int, load: Callable[[], Optional[models.Issue]]) -> Optional[models.Issue]:
+        """
+        Returns the issue as a persistent instance of `db`: from the cache without a query
+        when it holds the row, otherwise from `load()`, caching the result if it was read
+        from the primary.
+        """
+        if not self.enabled:
+            return load()
+        existing = db.identity_map.get(db.identity_key(models.Issue, issue_id))
+        if existing is not None:
+            # Already in the session, maybe with changes merging a cached copy would overwrite
+            return existing
+        values = self.get(issue_id)
+        if values is not None:
+            db_issue = models.Issue(**values)
+            make_transient_to_detached(db_issue)
+            # Attaches the row as if just loaded; load=False skips the SELECT merge would issue
+            db_issue = db.merge(db_issue, load=False)
+            inspect(db_issue).info["from_cache"] = True
+            return db_issue
+        generation = self.generation()
+        # A lagging replica may return the row as it was before a write this cache has already
+        # seen the invalidation for; caching it would serve it until the TTL, not the lag
+        from_replica = getattr(db, "reads_from_replica", False)
+        db_issue = load()
+        if db_issue is not None and not from_replica and not inspect(db_issue).modified:
+            self.put(issue_id, {column: getattr(db_issue, column) for column in _COLUMNS}, generation)
+        return db_issue
+
+    def refresh_if_cached(self, db: Session, db_issue: models.Issue):
+        """
+        Reloads an issue that read_through() served from the cache, so a write starts from the
+        current row rather than a copy that may be a moment stale.
+        """
+        if inspect(db_issue).info.pop("from_cache", False):
+            db.refresh(db_issue)
+
+    def status(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "notifier": type(self.notifier).__name__,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "approximate_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+issue_cache = IssueCache()
+issue_cache.enabled = ISSUE_CACHE_ENABLED
@@ -0,0 +1,176 @@
+# backend/app/issue_ingest.py
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import sessionmaker
+
+from . import crud, models, schemas
+from .database import SessionLocal
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Write issues created through POST /api/v1/issues/ in batches, one transaction per batch,
+# instead of one transaction per request. For high-rate automated reporters.
+ISSUE_INGEST_BATCHING = os.getenv("ISSUE_INGEST_BATCHING", "false").lower() == "true"
+
+# A batch is written as soon as it holds this many issues...
+ISSUE_INGEST_MAX_BATCH = int(os.getenv("ISSUE_INGEST_MAX_BATCH", "500"))
+# ...or this long after its first issue arrived, whichever comes first
+ISSUE_INGEST_FLUSH_MS = float(os.getenv("ISSUE_INGEST_FLUSH_MS", "5"))
+
+# Queued by shutdown() to stop the writer thread
+_STOP = object()
+
+# (issue, owner ID, future resolved with the created row)
+PendingIssue = Tuple[schemas.IssueCreate, int, Future]
+
+class IssueBatcher:
+    """
+    Group commit for issue creation. Callers submit validated issues from any thread or the
+    event loop; a writer thread gathers them for up to flush_ms (or max_batch issues), writes
+    the batch with crud.create_issues, and resolves each caller's future with its row. When a
+    batch fails, its issues are retried one at a time, so a bad row only fails its own caller.
+    """
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal, max_batch: int = ISSUE_INGEST_MAX_BATCH,
+                 flush_ms: float = ISSUE_INGEST_FLUSH_MS):
+        self.enabled = True
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_seconds = flush_ms / 1000
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.batches = 0
+            self.issues = 0
+            self.failures = 0
+            self.largest_batch = 0
+            self.write_seconds = 0.0
+
+    def submit(self, issue: schemas.IssueCreate, owner_id: int) -> Future:
+        """
+        Queues an issue for the next batch. Returns a future of the created issue.
+        """
+        future = Future()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="issue-ingest", daemon=True)
+                self._thread.start()
+        self._queue.put((issue, owner_id, future))
+        return future
+
+    async def create(self, issue: schemas.IssueCreate, owner_id: int) -> models.Issue:
+        """
+        Creates an issue in the next batch, without holding a thread while it waits.
+        A cancelled caller (e.g. the client disconnected) stops waiting, but its issue is still
+        written, as it would be by a request already inside its transaction.
+        """
+        return await asyncio.shield(asyncio.wrap_future(self.submit(issue, owner_id)))
+
+    def _collect(self, first: PendingIssue) -> List[PendingIssue]:
+        batch = [first]
+        flush_at = time.monotonic() + self.flush_seconds
+        while len(batch) < self.max_batch:
+            remaining = flush_at - time.monotonic()
+            try:
+                # Past the flush time, still take whatever is already queued
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP) # Stop once this batch is written
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            try:
+                self._write(self._collect(item))
+            except Exception as e:
+                # Never let one batch stop the writer, or every later caller would wait forever
+                logger.error(f"Issue batch write failed: {e}", exc_info=True)
+
+    def _insert(self, issues: List[Tuple[schemas.IssueCreate, int]]) -> List[models.Issue]:
+        # Rows come back complete from RETURNING; keep them loaded for callers once the session is closed
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            return crud.create_issues(db, issues)
+        finally:
+            db.close()
+
+    def _write(self, batch: List[PendingIssue]):
+        # Futures cancelled while queued are dropped; the rest can no longer be cancelled
+        batch = [pending for pending in batch if pending[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        started = time.perf_counter()
+        failures = 0
+        try:
+            db_issues = self._insert([(issue, owner_id) for issue, owner_id, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                failures = 1
+                batch[0][2].set_exception(e)
+            else:
+                logger.warning(f"Issue batch failed, writing its {len(batch)} issues one at a time: {e}")
+                for issue, owner_id, future in batch:
+                    try:
+                        future.set_result(self._insert([(issue, owner_id)])[0])
+                    except Exception as single_error:
+                        failures += 1
+                        future.set_exception(single_error)
+        else:
+            for (_, _, future), db_issue in zip(batch, db_issues):
+                future.set_result(db_issue)
+        with self._lock:
+            self.batches += 1
+            self.issues += len(batch)
+            self.failures += failures
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.write_seconds += time.perf_counter() - started
+
+    def shutdown(self):
+        """
+        Writes the issues still queued and stops the writer thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout=10)
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_batch": self.max_batch,
+                "flush_ms": self.flush_seconds * 1000,
+                "queued": self._queue.qsize(),
+                "batches": self.batches,
+                "issues": self.issues,
+                "failures": self.failures,
+                "largest_batch": self.largest_batch,
+                "average_batch": round(self.issues / self.batches, 2) if self.batches else 0.0,
+                "average_write_ms": round(self.write_seconds / self.batches * 1000, 3) if self.batches else 0.0,
+            }
+
+issue_batcher = IssueBatcher()
+issue_batcher.enabled = ISSUE_INGEST_BATCHING
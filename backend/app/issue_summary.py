@@ -0,0 +1,99 @@
+# backend/app/issue_summary.py
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from . import crud, models, schemas
+
+load_dotenv()
+
+# How long a cached summary is served. Writes made in this worker invalidate it right away;
+# this bounds how stale it gets after writes made by other workers.
+OWNER_SUMMARY_CACHE_SECONDS = float(os.getenv("OWNER_SUMMARY_CACHE_SECONDS", "30"))
+
+# Users whose summaries are kept; the least recently used are dropped first
+OWNER_SUMMARY_CACHE_SIZE = int(os.getenv("OWNER_SUMMARY_CACHE_SIZE", "10000"))
+
+# Most recent issues a summary can include. Summaries are cached with this many and cut per request.
+MAX_RECENT_ISSUES = 50
+
+class OwnerSummaryCache:
+    """
+    Per-user cache of "my issues" summaries, invalidated by the user's own issue writes.
+    """
+
+    def __init__(self, ttl_seconds: float = OWNER_SUMMARY_CACHE_SECONDS, max_size: int = OWNER_SUMMARY_CACHE_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[float, schemas.OwnerIssueSummary]]" = OrderedDict()
+        # Bumped by every invalidation, so a summary computed while one happened is not cached
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get(self, owner_id: int) -> Optional[schemas.OwnerIssueSummary]:
+        with self._lock:
+            entry = self._entries.get(owner_id)
+            if entry is None:
+                return None
+            expires_at, summary = entry
+            if expires_at <= time.monotonic():
+                del self._entries[owner_id]
+                return None
+            self._entries.move_to_end(owner_id)
+            return summary
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(self, owner_id: int, summary: schemas.OwnerIssueSummary, generation: int):
+        """
+        Caches a summary computed after generation() returned `generation`, unless an
+        invalidation happened since, in which case the summary may already be stale.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[owner_id] = (time.monotonic() + self.ttl_seconds, summary)
+            self._entries.move_to_end(owner_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, owner_id: int):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(owner_id, None)
+
+    def on_issue_write(self, action: str, db_issue: models.Issue):
+        """
+        Issue write hook dropping the summary of the issue's owner.
+        """
+        self.invalidate(db_issue.owner_id)
+
+owner_summary_cache = OwnerSummaryCache()
+crud.issue_write_hooks.append(owner_summary_cache.on_issue_write)
+
+def get_owner_summary(db: Session, owner_id: int, recent_limit: int = 5) -> schemas.OwnerIssueSummary:
+    """
+    Returns the owner's issue counts and newest `recent_limit` issues, from the cache when fresh.
+    """
+    summary = owner_summary_cache.get(owner_id)
+    if summary is None:
+        generation = owner_summary_cache.generation()
+        # Validated into plain schemas so cached copies never touch a closed session
+        summary = schemas.OwnerIssueSummary.model_validate(
+            crud.get_owner_issue_summary(db, owner_id, recent_limit=MAX_RECENT_ISSUES), from_attributes=True
+        )
+        owner_summary_cache.put(owner_id, summary, generation)
+    return summary.model_copy(update={"recent_issues": summary.recent_issues[:recent_limit]})
@@ -0,0 +1,243 @@
+# backend/app/job_queue.py
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session, sessionmaker
+
+from . import models
+from .database import SessionLocal
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Attempts before a failing job is marked FAILED for good
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+# Retry delay after the first failure; doubles with every further attempt up to the maximum
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "10"))
+JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+# A RUNNING job whose worker has not sent a heartbeat within this time is assumed dead and requeued
+JOB_LOCK_TIMEOUT_SECONDS = int(os.getenv("JOB_LOCK_TIMEOUT_SECONDS", "1800"))
+# How often a worker renews the lock of the job it is running. Must be well below the lock timeout.
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "60"))
+# How long an idle worker sleeps before polling the queue again
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "2"))
+
+# Due jobs a worker tries to claim per poll on databases without SKIP LOCKED
+CLAIM_CANDIDATES = 10
+
+# Handlers by job kind. Each runs with its own session and the job's payload; raising fails the attempt.
+job_handlers: Dict[str, Callable[[Session, Dict], None]] = {}
+
+def enqueue_job(db: Session, kind: str, payload: Optional[Dict] = None, priority: int = 0,
+                delay_seconds: float = 0, max_attempts: int = JOB_MAX_ATTEMPTS) -> models.QueuedJob:
+    """
+    Adds a job to the queue. Jobs with a higher priority are claimed first.
+    """
+    db_job = models.QueuedJob(
+        kind=kind,
+        payload=payload or {},
+        priority=priority,
+        max_attempts=max_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay_seconds),
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    logger.info("Job enqueued", extra={"queued_job_id": db_job.id, "kind": kind, "priority": priority})
+    return db_job
+
+def claim_next_job(db: Session, worker_id: str) -> Optional[models.QueuedJob]:
+    """
+    Claims the highest-priority due job for `worker_id`, or returns None if there is none.
+    Postgres workers skip rows locked by other claimers instead of waiting on them; elsewhere
+    each claim is a conditional UPDATE that only one worker can win.
+    """
+    now = datetime.utcnow()
+    job = models.QueuedJob
+    due = db.query(job).filter(job.status == models.QueuedJobStatus.QUEUED, job.run_at <= now).order_by(
+        job.priority.desc(), job.run_at, job.id
+    )
+    claim = {"status": models.QueuedJobStatus.RUNNING, "locked_by": worker_id, "locked_at": now, "attempts": job.attempts + 1}
+
+    if db.get_bind().dialect.name == "postgresql":
+        claimed = due.with_for_update(skip_locked=True).first()
+        if claimed is None:
+            db.rollback()
+            return None
+        db.query(job).filter(job.id == claimed.id).update(claim, synchronize_session=False)
+        db.commit()
+        return db.get(job, claimed.id)
+
+    for (job_id,) in due.with_entities(job.id).limit(CLAIM_CANDIDATES).all():
+        won = db.query(job).filter(job.id == job_id, job.status == models.QueuedJobStatus.QUEUED).update(
+            claim, synchronize_session=False
+        )
+        db.commit()
+        if won:
+            return db.get(job, job_id)
+    return None
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponential backoff after the given number of failed attempts.
+    """
+    return timedelta(seconds=min(JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), JOB_RETRY_MAX_SECONDS))
+
+def _claimed(db: Session, job_id: int, worker_id: str, attempt: int):
+    """
+    Query for the job while it is still held by this claim: requeued jobs may have been
+    claimed again since, by another worker or as a later attempt.
+    """
+    job = models.QueuedJob
+    return db.query(job).filter(job.id == job_id, job.status == models.QueuedJobStatus.RUNNING,
+                                job.locked_by == worker_id, job.attempts == attempt)
+
+def heartbeat_job(db: Session, job_id: int, worker_id: str, attempt: int) -> bool:
+    """
+    Renews the lock of a running job. Returns False if the claim was lost meanwhile.
+    """
+    renewed = _claimed(db, job_id, worker_id, attempt).update({"locked_at": datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return renewed == 1
+
+def complete_job(db: Session, db_job: models.QueuedJob, worker_id: str, attempt: int) -> bool:
+    """
+    Marks the job as succeeded, unless the claim was lost meanwhile. Returns whether it was.
+    """
+    completed = _claimed(db, db_job.id, worker_id, attempt).update(
+        {"status": models.QueuedJobStatus.SUCCEEDED, "finished_at": datetime.utcnow(), "locked_by": None, "last_error": None},
+        synchronize_session=False,
+    )
+    db.commit()
+    return completed == 1
+
+def fail_job(db: Session, db_job: models.QueuedJob, worker_id: str, attempt: int, error: str) -> bool:
+    """
+    Records a failed attempt, scheduling a retry with backoff until attempts run out.
+    Does nothing if the claim was lost meanwhile. Returns whether the attempt was recorded.
+    """
+    now = datetime.utcnow()
+    values = {"last_error": error, "locked_by": None}
+    if attempt >= db_job.max_attempts:
+        values.update(status=models.QueuedJobStatus.FAILED, finished_at=now)
+    else:
+        values.update(status=models.QueuedJobStatus.QUEUED, run_at=now + retry_delay(attempt))
+    failed = _claimed(db, db_job.id, worker_id, attempt).update(values, synchronize_session=False)
+    db.commit()
+    return failed == 1
+
+def requeue_stale_jobs(db: Session, lock_timeout_seconds: int = JOB_LOCK_TIMEOUT_SECONDS) -> int:
+    """
+    Returns RUNNING jobs whose worker died (lock older than the timeout) to the queue,
+    or fails them if they have no attempts left. Returns how many jobs were recovered.
+    """
+    job = models.QueuedJob
+    now = datetime.utcnow()
+    stale = db.query(job).filter(
+        job.status == models.QueuedJobStatus.RUNNING,
+        job.locked_at < now - timedelta(seconds=lock_timeout_seconds),
+    )
+    error = "Worker stopped responding while running the job"
+    failed = stale.filter(job.attempts >= job.max_attempts).update(
+        {"status": models.QueuedJobStatus.FAILED, "finished_at": now, "locked_by": None, "last_error": error},
+        synchronize_session=False,
+    )
+    requeued = stale.update(
+        {"status": models.QueuedJobStatus.QUEUED, "run_at": now, "locked_by": None, "last_error": error},
+        synchronize_session=False,
+    )
+    db.commit()
+    if failed or requeued:
+        logger.warning("Recovered stale queued jobs", extra={"requeued": requeued, "failed": failed})
+    return failed + requeued
+
+class QueueWorker:
+    """
+    Claims and runs queued jobs one at a time. Run several, in threads or processes, to scale out.
+    """
+
+    def __init__(self, worker_id: str, session_factory: sessionmaker = SessionLocal,
+                 poll_interval: float = JOB_POLL_INTERVAL_SECONDS, heartbeat_interval: float = JOB_HEARTBEAT_SECONDS):
+        self.worker_id = worker_id
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+
+    def _heartbeat(self, job_id: int, attempt: int, stop: threading.Event):
+        """
+        Renews the running job's lock until `stop` is set, so long jobs are not requeued.
+        """
+        while not stop.wait(self.heartbeat_interval):
+            db: Session = self.session_factory()
+            try:
+                if not heartbeat_job(db, job_id, self.worker_id, attempt):
+                    logger.warning("Queued job was requeued while still running", extra={"queued_job_id": job_id, "worker": self.worker_id})
+                    return
+            except Exception as e:
+                # The next beat retries; the lock timeout leaves room for several misses
+                logger.warning(f"Could not renew queued job lock: {e}", extra={"queued_job_id": job_id, "worker": self.worker_id})
+            finally:
+                db.close()
+
+    def run_once(self) -> bool:
+        """
+        Claims and runs a single job. Returns False if the queue had nothing due.
+        """
+        db: Session = self.session_factory()
+        try:
+            db_job = claim_next_job(db, self.worker_id)
+            if db_job is None:
+                return False
+
+            attempt = db_job.attempts
+            log_extra = {"queued_job_id": db_job.id, "kind": db_job.kind, "attempt": attempt, "worker": self.worker_id}
+            handler = job_handlers.get(db_job.kind)
+            started = time.perf_counter()
+            stop_heartbeat = threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(db_job.id, attempt, stop_heartbeat),
+                                         name=f"{threading.current_thread().name}-heartbeat", daemon=True)
+            heartbeat.start()
+            try:
+                if handler is None:
+                    raise LookupError(f"No handler registered for job kind '{db_job.kind}'")
+                handler_db: Session = self.session_factory()
+                try:
+                    handler(handler_db, dict(db_job.payload))
+                finally:
+                    handler_db.close()
+            except Exception as e:
+                logger.error(f"Queued job failed: {e}", exc_info=True, extra=log_extra)
+                recorded = fail_job(db, db_job, self.worker_id, attempt, str(e))
+            else:
+                recorded = complete_job(db, db_job, self.worker_id, attempt)
+                logger.info("Queued job succeeded", extra={**log_extra, "duration_seconds": round(time.perf_counter() - started, 3)})
+            finally:
+                stop_heartbeat.set()
+                heartbeat.join()
+            if not recorded:
+                logger.warning("Queued job outcome not recorded; it was claimed again meanwhile", extra=log_extra)
+            return True
+        finally:
+            db.close()
+
+    def run(self, stop):
+        """
+        Runs jobs until `stop` (a threading.Event) is set, sleeping while the queue is empty.
+        """
+        logger.info("Queue worker started", extra={"worker": self.worker_id})
+        while not stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                # Typically the database being unreachable; back off and try again
+                logger.error(f"Queue worker could not poll for jobs: {e}", exc_info=True, extra={"worker": self.worker_id})
+            stop.wait(self.poll_interval)
+        logger.info("Queue worker stopped", extra={"worker": self.worker_id})
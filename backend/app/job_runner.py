@@ -0,0 +1,159 @@
+# backend/app/job_runner.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Threads dedicated to scheduled jobs, separate from the request and event loop default pools
+SCHEDULER_JOB_WORKERS = int(os.getenv("SCHEDULER_JOB_WORKERS", "4"))
+# How long a scheduled job may run. Past it the job is reported as timed out and asked to stop:
+# its next ensure_within_timeout() call raises JobTimedOut.
+SCHEDULER_JOB_TIMEOUT_SECONDS = float(os.getenv("SCHEDULER_JOB_TIMEOUT_SECONDS", "300"))
+
+# Returned by a job that decided not to do any work this time (e.g. not the leader)
+SKIPPED = object()
+
+# The timeout flag of the scheduled job running on this thread, if any
+_current_job = threading.local()
+
+class JobTimedOut(Exception):
+    """
+    Raised by ensure_within_timeout() once the scheduled job calling it has exceeded its timeout.
+    """
+
+def ensure_within_timeout():
+    """
+    Raises JobTimedOut if the scheduled job running on this thread has exceeded its timeout.
+    Long jobs call it between steps, so they stop instead of running on unobserved.
+    Does nothing outside scheduled jobs.
+    """
+    timed_out = getattr(_current_job, "timed_out", None)
+    if timed_out is not None and timed_out.is_set():
+        raise JobTimedOut("Scheduled job exceeded its timeout")
+
+def _call_with_timeout_flag(fn: Callable[[], Any], timed_out: threading.Event) -> Any:
+    _current_job.timed_out = timed_out
+    try:
+        return fn()
+    finally:
+        _current_job.timed_out = None
+
+class JobMetrics:
+    """
+    Per-job run counters and timings for this worker.
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.running = False
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped = 0 # The job returned SKIPPED
+        self.overlaps = 0 # A run was due while the previous one was still going
+        self.last_started_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.max_duration_seconds = 0.0
+        self.total_duration_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+class JobRunner:
+    """
+    Runs synchronous scheduled jobs on a dedicated thread pool so their blocking database
+    work never runs on, or competes for, the threads serving HTTP and WebSocket traffic.
+    A job never overlaps with itself, and runs exceeding their timeout are reported and
+    asked to stop.
+    """
+
+    def __init__(self, max_workers: int = SCHEDULER_JOB_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduled-job")
+        self._running: Set[str] = set()
+        self.metrics: Dict[str, JobMetrics] = {}
+
+    def _metrics_for(self, job_id: str) -> JobMetrics:
+        if job_id not in self.metrics:
+            self.metrics[job_id] = JobMetrics(job_id)
+        return self.metrics[job_id]
+
+    def job(self, job_id: str, fn: Callable[[], Any], timeout_seconds: float = SCHEDULER_JOB_TIMEOUT_SECONDS) -> Callable[[], Awaitable[None]]:
+        """
+        Wraps a synchronous job as a coroutine function for the AsyncIOScheduler.
+        """
+        async def run():
+            await self.run(job_id, fn, timeout_seconds)
+        run.__name__ = job_id
+        self._metrics_for(job_id)
+        return run
+
+    async def run(self, job_id: str, fn: Callable[[], Any], timeout_seconds: float = SCHEDULER_JOB_TIMEOUT_SECONDS):
+        """
+        Runs `fn` in the job thread pool, waiting at most `timeout_seconds` for it.
+        Python threads cannot be killed, so a timed-out job is only flagged: it stops at its
+        next ensure_within_timeout() call, and stays blocked from starting again until then.
+        """
+        metrics = self._metrics_for(job_id)
+        if job_id in self._running:
+            metrics.overlaps += 1
+            logger.warning("Scheduled job still running; skipping this run", extra={"job_id": job_id})
+            return
+
+        self._running.add(job_id)
+        metrics.running = True
+        metrics.last_started_at = datetime.utcnow()
+        started = time.perf_counter()
+        timed_out = threading.Event()
+        future = asyncio.get_running_loop().run_in_executor(self._executor, _call_with_timeout_flag, fn, timed_out)
+        future.add_done_callback(partial(self._finish, job_id, started))
+        # The outcome, including the job's exception, is recorded by _finish. Unlike wait_for,
+        # wait leaves the job's future alone when it times out.
+        done, _ = await asyncio.wait({future}, timeout=timeout_seconds)
+        if not done:
+            timed_out.set()
+            metrics.timeouts += 1
+            logger.error(f"Scheduled job exceeded its {timeout_seconds}s timeout; asking it to stop", extra={"job_id": job_id})
+
+    def _finish(self, job_id: str, started: float, future: asyncio.Future):
+        metrics = self._metrics_for(job_id)
+        self._running.discard(job_id)
+        metrics.running = False
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None and future.result() is SKIPPED:
+            metrics.skipped += 1
+            return
+
+        duration = time.perf_counter() - started
+        metrics.last_duration_seconds = duration
+        metrics.total_duration_seconds += duration
+        metrics.max_duration_seconds = max(metrics.max_duration_seconds, duration)
+        if isinstance(error, JobTimedOut):
+            # Already counted as a timeout when it was flagged
+            metrics.last_error = str(error)
+            logger.warning("Scheduled job stopped after exceeding its timeout", extra={"job_id": job_id, "duration_seconds": round(duration, 3)})
+        elif error is None:
+            metrics.successes += 1
+            metrics.last_error = None
+            logger.info("Scheduled job finished", extra={"job_id": job_id, "duration_seconds": round(duration, 3)})
+        else:
+            metrics.failures += 1
+            metrics.last_error = str(error)
+            logger.error(f"Scheduled job failed: {error}", exc_info=error, extra={"job_id": job_id, "duration_seconds": round(duration, 3)})
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# Runner for this process's scheduled jobs
+job_runner = JobRunner()
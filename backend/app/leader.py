@@ -0,0 +1,194 @@
+# backend/app/leader.py
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import case, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from . import models
+from .database import SessionLocal
+from .job_runner import SKIPPED
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# How long a leader keeps the lease without renewing it. Renewal runs every third of this on
+# its own thread, so a dead leader is replaced within one TTL. Keep it well above clock skew between hosts.
+SCHEDULER_LEASE_TTL_SECONDS = int(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", "60"))
+
+class LeadershipLost(Exception):
+    """
+    Raised by LeaderLease.ensure_leader() once this process no longer holds the lease.
+    """
+
+class LeaderLease:
+    """
+    DB-backed leader election through a single expiring lease row.
+    Every worker calls try_acquire() periodically; the conditional UPDATE only succeeds for the
+    current holder (renewal) or once the lease has expired (failover), on any database.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = SCHEDULER_LEASE_TTL_SECONDS,
+                 session_factory: sessionmaker = SessionLocal, holder_id: Optional[str] = None):
+        self.name = name
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.session_factory = session_factory
+        self.holder_id = holder_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._held_until: Optional[datetime] = None
+        self._renewal_thread: Optional[threading.Thread] = None
+        self._stop_renewal = threading.Event()
+
+    @property
+    def is_leader(self) -> bool:
+        """
+        Whether this process holds the lease, judged by its own clock so a worker that
+        stops renewing (e.g. lost its database) stops acting as leader at expiry.
+        """
+        return self._held_until is not None and datetime.utcnow() < self._held_until
+
+    def try_acquire(self) -> bool:
+        """
+        Acquires the lease if it is free or expired, or renews it if already held.
+        Returns whether this process is the leader afterwards.
+        """
+        now = datetime.utcnow()
+        expires_at = now + self.ttl
+        was_leader = self.is_leader
+        db: Session = self.session_factory()
+        try:
+            lease = models.SchedulerLease
+            result = db.execute(
+                update(lease)
+                .where(lease.name == self.name, or_(lease.holder == self.holder_id, lease.expires_at < now))
+                .values(
+                    holder=self.holder_id,
+                    acquired_at=case((lease.holder == self.holder_id, lease.acquired_at), else_=now),
+                    expires_at=expires_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            acquired = result.rowcount == 1
+            db.commit()
+            if not acquired and db.get(lease, self.name) is None:
+                # First election: whoever inserts the row first wins
+                db.add(lease(name=self.name, holder=self.holder_id, acquired_at=now, expires_at=expires_at))
+                try:
+                    db.commit()
+                    acquired = True
+                except IntegrityError:
+                    db.rollback()
+        except Exception as e:
+            logger.error(f"Could not acquire scheduler lease: {e}", exc_info=True, extra={"lease": self.name})
+            acquired = False
+        finally:
+            db.close()
+
+        self._held_until = expires_at if acquired else None
+        if acquired != was_leader:
+            logger.info(
+                "Became scheduler leader" if acquired else "Lost scheduler leadership",
+                extra={"lease": self.name, "holder": self.holder_id},
+            )
+        return acquired
+
+    def start_renewal(self, interval_seconds: float):
+        """
+        Competes for, and renews, the lease every `interval_seconds` on a dedicated thread,
+        so renewal never waits behind long-running scheduled jobs.
+        """
+        if self._renewal_thread is not None:
+            return
+        self._stop_renewal.clear()
+        self._renewal_thread = threading.Thread(target=self._renew, args=(interval_seconds,), name=f"lease-{self.name}", daemon=True)
+        self._renewal_thread.start()
+
+    def _renew(self, interval_seconds: float):
+        while True:
+            self.try_acquire()
+            if self._stop_renewal.wait(interval_seconds):
+                return
+
+    def stop_renewal(self):
+        """
+        Stops the renewal thread. The lease is kept until release() or expiry.
+        """
+        thread, self._renewal_thread = self._renewal_thread, None
+        if thread is not None:
+            self._stop_renewal.set()
+            thread.join(timeout=10)
+
+    def ensure_leader(self):
+        """
+        Raises LeadershipLost unless this process holds the lease. Long leader-only jobs call
+        it between steps, so they stop once another worker may have taken over.
+        """
+        if not self.is_leader:
+            raise LeadershipLost(f"Lost the {self.name} lease")
+
+    def release(self):
+        """
+        Gives up the lease on shutdown so another worker can take over without waiting for expiry.
+        """
+        if not self.is_leader:
+            return
+        db: Session = self.session_factory()
+        try:
+            lease = models.SchedulerLease
+            db.execute(
+                update(lease)
+                .where(lease.name == self.name, lease.holder == self.holder_id)
+                .values(expires_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception as e:
+            logger.error(f"Could not release scheduler lease: {e}", exc_info=True, extra={"lease": self.name})
+        finally:
+            db.close()
+        self._held_until = None
+
+    def leader_only(self, job_id: str, job: Callable[[], None]) -> Callable[[], object]:
+        """
+        Wraps a scheduled job so it only runs on the leader, recording each successful run.
+        Non-leaders skip the job and return SKIPPED, as do jobs stopped by LeadershipLost.
+        """
+        def run():
+            if not self.is_leader:
+                return SKIPPED
+            try:
+                job()
+                # The new leader may run the job again; don't record a run that overlapped it
+                self.ensure_leader()
+            except LeadershipLost:
+                logger.warning("Lost scheduler leadership while a leader-only job was running", extra={"job_id": job_id})
+                return SKIPPED
+            self._record_run(job_id)
+        run.__name__ = getattr(job, "__name__", job_id)
+        return run
+
+    def _record_run(self, job_id: str):
+        db: Session = self.session_factory()
+        try:
+            state = db.get(models.ScheduledJobState, job_id)
+            if state is None:
+                state = models.ScheduledJobState(job_id=job_id)
+                db.add(state)
+            state.last_run_at = datetime.utcnow()
+            state.last_run_by = self.holder_id
+            db.commit()
+        except Exception as e:
+            logger.error(f"Could not record scheduled job run: {e}", exc_info=True, extra={"job_id": job_id})
+        finally:
+            db.close()
+
+# Lease guarding the cluster-wide scheduled jobs of this process
+scheduler_lease = LeaderLease("scheduler")
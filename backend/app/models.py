@@ -1,6 +1,6 @@
 # backend/app/models.py
 
-from sqlalchemy import Column, Integer, String, Boolean, Enum, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Enum, ForeignKey, Date, DateTime, Text, JSON, Index
 from sqlalchemy.orm import relationship
 # Import Base from the new database module
 from .database import Base
@@ -71,11 +71,18 @@ class Issue(Base):
     severity = Column(Enum(IssueSeverity), default=IssueSeverity.MEDIUM, nullable=False)
     status = Column(Enum(IssueStatus), default=IssueStatus.OPEN, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+    file_path = Column(String, nullable=True) # Legacy single-file path; uploads are stored as issue_attachments
 
     # Foreign key to link to the User who created the issue
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     owner = relationship("User", back_populates="issues")
+    attachments = relationship("IssueAttachment", back_populates="issue", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Covers the dashboard summary's GROUP BY, so it is answered from the index alone
+        Index("ix_issues_owner_status_severity", "owner_id", "status", "severity"),
+    )
 
     def __repr__(self):
         """
@@ -83,6 +90,78 @@ class Issue(Base):
         """
         return f"<Issue(id={self.id}, title='{self.title}', status='{self.status}', owner_id={self.owner_id})>"
 
+class AttachmentStatus(str, enum.Enum):
+    """
+    Defines the processing states of an attachment (type detection, thumbnail, text extraction).
+    """
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+class IssueAttachment(Base):
+    """
+    SQLAlchemy model for the 'issue_attachments' table.
+    A file attached to an issue. Contents are stored once per distinct SHA-256 in blob storage,
+    so attachments with identical contents share a blob.
+    """
+    __tablename__ = "issue_attachments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False, index=True)
+    uploaded_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    filename = Column(String, nullable=False)
+    content_type = Column(String, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False, index=True) # Hex digest; the blob's key in storage
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    status = Column(Enum(AttachmentStatus), default=AttachmentStatus.PENDING, nullable=False)
+    detected_type = Column(String, nullable=True) # MIME type sniffed from the contents
+    artifacts = Column(JSON, nullable=True) # Names of derived files stored next to the blob, e.g. ["thumbnail.png"]
+    stage_timings = Column(JSON, nullable=True) # Milliseconds spent in each processing stage
+    processing_error = Column(Text, nullable=True)
+    processed_at = Column(DateTime, nullable=True)
+
+    issue = relationship("Issue", back_populates="attachments")
+
+    def __repr__(self):
+        return f"<IssueAttachment(id={self.id}, issue_id={self.issue_id}, filename='{self.filename}', size_bytes={self.size_bytes})>"
+
+class IssueEventType(str, enum.Enum):
+    """
+    Defines the kinds of writes recorded in the issue event log.
+    """
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
+
+class IssueEvent(Base):
+    """
+    SQLAlchemy model for the 'issue_events' table.
+    Append-only log of issue writes with the status and severity before and after each one.
+    Rows reference no other table and are ordered by `at`, so old ranges can be archived,
+    deleted or split into time partitions without touching live data.
+    """
+    __tablename__ = "issue_events"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    issue_id = Column(Integer, nullable=False) # No foreign key: events outlive deleted issues
+    event_type = Column(Enum(IssueEventType), nullable=False)
+    actor_id = Column(Integer, nullable=True) # User who made the change, if known
+    at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    old_status = Column(Enum(IssueStatus), nullable=True) # NULL for CREATED
+    new_status = Column(Enum(IssueStatus), nullable=True) # NULL for DELETED
+    old_severity = Column(Enum(IssueSeverity), nullable=True)
+    new_severity = Column(Enum(IssueSeverity), nullable=True)
+
+    __table_args__ = (
+        Index("ix_issue_events_issue_id_at", "issue_id", "at"),
+        Index("ix_issue_events_at", "at"),
+    )
+
+    def __repr__(self):
+        return f"<IssueEvent(id={self.id}, issue_id={self.issue_id}, event_type='{self.event_type}', at='{self.at}')>"
+
 class DailyStats(Base):
     """
     SQLAlchemy model for the 'daily_stats' table.
@@ -93,7 +172,202 @@ class DailyStats(Base):
     id = Column(Integer, primary_key=True, index=True)
     date = Column(DateTime, nullable=False, unique=True) # Date for which stats are aggregated
     issue_counts_by_status = Column(JSON, nullable=False) # Stores a JSON object of counts by status
+    computed_through = Column(DateTime, nullable=True) # Issue changes up to this time are counted; NULL for backfilled days
 
     def __repr__(self):
         return f"<DailyStats(id={self.id}, date='{self.date.strftime('%Y-%m-%d')}', counts={self.issue_counts_by_status})>"
 
+class IssueStatusSnapshot(Base):
+    """
+    SQLAlchemy model for the 'issue_status_snapshots' table.
+    The status each issue was last counted with in daily_stats, so refreshes only apply changes.
+    """
+    __tablename__ = "issue_status_snapshots"
+
+    issue_id = Column(Integer, primary_key=True) # No foreign key: rows outlive deleted issues until counted
+    status = Column(Enum(IssueStatus), nullable=False)
+    severity = Column(Enum(IssueSeverity), nullable=False)
+
+    def __repr__(self):
+        return f"<IssueStatusSnapshot(issue_id={self.issue_id}, status='{self.status}', severity='{self.severity}')>"
+
+class StatsGranularity(str, enum.Enum):
+    """
+    Defines the period lengths issue stats are stored at.
+    """
+    DAY = "DAY"
+    WEEK = "WEEK"
+    MONTH = "MONTH"
+
+class IssueSliceDimension(str, enum.Enum):
+    """
+    Defines the issue attributes dashboard slices can be grouped by.
+    WEEK is the week (starting Monday) the issue was created in.
+    """
+    STATUS = "STATUS"
+    SEVERITY = "SEVERITY"
+    OWNER = "OWNER"
+    WEEK = "WEEK"
+
+class IssueStats(Base):
+    """
+    SQLAlchemy model for the 'issue_stats' table.
+    Issue counts per status and severity at the end of each day, with weekly and monthly rollups.
+    """
+    __tablename__ = "issue_stats"
+
+    id = Column(Integer, primary_key=True)
+    granularity = Column(Enum(StatsGranularity), nullable=False)
+    period_start = Column(Date, nullable=False) # First day of the day, week (Monday) or month
+    status = Column(Enum(IssueStatus), nullable=False)
+    severity = Column(Enum(IssueSeverity), nullable=True) # NULL for days migrated from daily_stats, which had no severity
+    count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Range queries are served from this index alone, without visiting the table
+        Index("ix_issue_stats_period", "granularity", "period_start", "status", "severity", "count"),
+    )
+
+    def __repr__(self):
+        return f"<IssueStats(granularity='{self.granularity}', period_start='{self.period_start}', status='{self.status}', severity='{self.severity}', count={self.count})>"
+
+
+class ExportDataset(str, enum.Enum):
+    """
+    Defines the tables that can be exported for analytics.
+    """
+    ISSUES = "ISSUES"
+    DAILY_STATS = "DAILY_STATS"
+
+class ExportFileFormat(str, enum.Enum):
+    """
+    Defines the columnar file formats an export can be written in.
+    """
+    PARQUET = "PARQUET"
+    ARROW = "ARROW"
+
+class ExportStatus(str, enum.Enum):
+    """
+    Defines the lifecycle states of an export job.
+    """
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+class ExportJob(Base):
+    """
+    SQLAlchemy model for the 'export_jobs' table.
+    Tracks a columnar export running in the background and where its file was written.
+    """
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    dataset = Column(Enum(ExportDataset), nullable=False)
+    format = Column(Enum(ExportFileFormat), default=ExportFileFormat.PARQUET, nullable=False)
+    status = Column(Enum(ExportStatus), default=ExportStatus.PENDING, nullable=False)
+    file_path = Column(String, nullable=True) # Set once the export file has been written
+    row_count = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    requested_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    def __repr__(self):
+        return f"<ExportJob(id={self.id}, dataset='{self.dataset}', format='{self.format}', status='{self.status}')>"
+
+class SchedulerLease(Base):
+    """
+    SQLAlchemy model for the 'scheduler_leases' table.
+    A named, expiring lease; the process holding it is the leader that runs cluster-wide jobs.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False) # Identifier of the worker process holding the lease
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<SchedulerLease(name='{self.name}', holder='{self.holder}', expires_at='{self.expires_at}')>"
+
+class ScheduledJobState(Base):
+    """
+    SQLAlchemy model for the 'scheduled_jobs' table.
+    Records when each leader-only scheduled job last ran and on which worker.
+    """
+    __tablename__ = "scheduled_jobs"
+
+    job_id = Column(String, primary_key=True)
+    last_run_at = Column(DateTime, nullable=True)
+    last_run_by = Column(String, nullable=True)
+
+    def __repr__(self):
+        return f"<ScheduledJobState(job_id='{self.job_id}', last_run_at='{self.last_run_at}', last_run_by='{self.last_run_by}')>"
+
+class QueuedJobStatus(str, enum.Enum):
+    """
+    Defines the lifecycle states of a job in the durable background queue.
+    """
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+class QueuedJob(Base):
+    """
+    SQLAlchemy model for the 'job_queue' table.
+    A unit of background work claimed and run by `python -m app.worker` processes.
+    """
+    __tablename__ = "job_queue"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False) # Name of the registered handler that runs the job
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(Enum(QueuedJobStatus), default=QueuedJobStatus.QUEUED, nullable=False)
+    priority = Column(Integer, default=0, nullable=False) # Higher runs first
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    run_at = Column(DateTime, default=datetime.utcnow, nullable=False) # Not claimed before this time
+    locked_by = Column(String, nullable=True) # Worker running the job
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Serves the claim query: queued jobs that are due, highest priority first
+        Index("ix_job_queue_claim", "status", "priority", "run_at"),
+    )
+
+    def __repr__(self):
+        return f"<QueuedJob(id={self.id}, kind='{self.kind}', status='{self.status}', attempts={self.attempts})>"
+
+class IdempotencyStatus(str, enum.Enum):
+    """
+    Defines whether the request that claimed an idempotency key has finished.
+    """
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+class IdempotencyKey(Base):
+    """
+    SQLAlchemy model for the 'idempotency_keys' table.
+    The first response to a request carrying an Idempotency-Key header, replayed to retries of it.
+    """
+    __tablename__ = "idempotency_keys"
+
+    scope = Column(String, primary_key=True) # Endpoint the key was used with, e.g. "issues.create"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String, primary_key=True) # Client-chosen Idempotency-Key header value
+    fingerprint = Column(String, nullable=False) # Hash of the request body, to catch keys reused for other requests
+    status = Column(Enum(IdempotencyStatus), default=IdempotencyStatus.IN_PROGRESS, nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_until = Column(DateTime, nullable=False) # An unfinished claim older than this was abandoned
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(scope='{self.scope}', user_id={self.user_id}, key='{self.key}', status='{self.status}')>"
@@ -0,0 +1,144 @@
+# backend/app/replicas.py
+
+import itertools
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import Delete, Insert, Update, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+class Replica:
+    """
+    A read replica's engine and its last known health.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.healthy = True
+        self.last_checked_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        event.listen(engine, "handle_error", self._on_error)
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+    def _on_error(self, context):
+        # Lost connections take the replica out of rotation until a health check passes
+        if context.is_disconnect and self.healthy:
+            self.mark_unhealthy(str(context.original_exception))
+
+    def mark_unhealthy(self, error: str):
+        self.healthy = False
+        self.last_error = error
+        logger.warning("Read replica marked unhealthy", extra={"replica": self.name, "error": error})
+
+    def check(self) -> bool:
+        """
+        Pings the replica and updates its health. Returns whether it is healthy.
+        """
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            if self.healthy:
+                self.mark_unhealthy(str(e))
+            else:
+                self.last_error = str(e)
+        else:
+            if not self.healthy:
+                logger.info("Read replica is healthy again", extra={"replica": self.name})
+            self.healthy = True
+            self.last_error = None
+        self.last_checked_at = datetime.utcnow()
+        return self.healthy
+
+class ReplicaSet:
+    """
+    Read replicas handed out in round-robin order, skipping those that failed their last
+    health check. Empty when no replicas are configured.
+    """
+
+    def __init__(self, engines: List[Engine]):
+        self.replicas = [Replica(engine) for engine in engines]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Returns the next healthy replica's engine, or None when none is healthy.
+        """
+        with self._lock:
+            start = next(self._counter)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    def check(self) -> int:
+        """
+        Health-checks every replica. Returns how many are healthy.
+        """
+        return sum(replica.check() for replica in self.replicas)
+
+    def status(self) -> List[Dict]:
+        return [{
+            "replica": replica.name,
+            "healthy": replica.healthy,
+            "last_checked_at": replica.last_checked_at,
+            "last_error": replica.last_error,
+        } for replica in self.replicas]
+
+    def dispose(self):
+        for replica in self.replicas:
+            replica.engine.dispose()
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a read replica and everything else to its own bind, the primary.
+    Once it writes, or after use_primary(), it reads from the primary too, so the request
+    sees its own writes.
+    """
+
+    def __init__(self, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is not None and (self._flushing or isinstance(clause, (Insert, Update, Delete))):
+            self.replica = None
+        if self.replica is not None:
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    @property
+    def reads_from_replica(self) -> bool:
+        return self.replica is not None
+
+    def use_primary(self) -> bool:
+        """
+        Switches later reads to the primary, e.g. to retry a lookup a lagging replica missed.
+        Returns False if the session already reads from the primary.
+        """
+        if self.replica is None:
+            return False
+        # Ends the replica transaction; nothing was written there
+        self.rollback()
+        self.replica = None
+        return True
+
+def use_primary(db: Session) -> bool:
+    """
+    Switches `db` to the primary if it is reading from a replica. Returns whether it did,
+    i.e. whether repeating a lookup could give a different answer.
+    """
+    return isinstance(db, RoutingSession) and db.use_primary()
@@ -0,0 +1,193 @@
+# backend/app/routers/attachments.py
+
+import os
+from typing import List
+from urllib.parse import quote
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import crud, models, schemas
+from ..attachments import (
+    ATTACHMENT_ACCEL_REDIRECT_PREFIX, ATTACHMENT_CACHE_CONTROL, ATTACHMENT_CHUNK_SIZE, ATTACHMENT_MAX_BYTES,
+    AttachmentEmpty, AttachmentTooLarge, store_upload,
+)
+from ..attachment_processing import THUMBNAIL_ARTIFACT, run_attachment_processing
+from ..storage import blob_storage
+from ..auth import get_current_user
+from ..database import get_db, SessionLocal
+from ..replicas import use_primary
+
+# Create an APIRouter instance for issue attachment endpoints
+router = APIRouter(
+    prefix="/api/v1/issues",
+    tags=["Attachments"],
+    responses={404: {"description": "Issue not found"}},
+)
+
+def _get_visible_issue(db: Session, issue_id: int, current_user: models.User) -> models.Issue:
+    """
+    Returns the issue if the caller may see it, following the read_issue rules:
+    - ADMINs and MAINTAINERs can access any issue.
+    - REPORTERs can access only issues they created.
+    """
+    db_issue = crud.get_issue(db, issue_id=issue_id)
+    if db_issue is None and use_primary(db):
+        # The issue may have just been created and not reached the replica yet
+        db_issue = crud.get_issue(db, issue_id=issue_id)
+    if db_issue is None:
+        raise HTTPException(status_code=404, detail="Issue not found")
+    if current_user.role == models.UserRole.ADMIN or current_user.role == models.UserRole.MAINTAINER:
+        return db_issue
+    if current_user.role == models.UserRole.REPORTER and db_issue.owner_id == current_user.id:
+        return db_issue
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not enough permissions to access this issue"
+    )
+
+def _get_attachment(db: Session, issue_id: int, attachment_id: int) -> models.IssueAttachment:
+    db_attachment = crud.get_attachment(db, issue_id, attachment_id)
+    if db_attachment is None and use_primary(db):
+        # The attachment may have just been uploaded and not reached the replica yet
+        db_attachment = crud.get_attachment(db, issue_id, attachment_id)
+    if db_attachment is None:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+    return db_attachment
+
+@router.post("/{issue_id}/attachments", response_model=schemas.Attachment, status_code=status.HTTP_201_CREATED)
+async def upload_attachment(
+    issue_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    filename: str = Query(..., min_length=1, max_length=255),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Attach a file to an issue. The request body is the raw file contents, with its
+    Content-Type header as the file's type; it is streamed to storage, never held in memory.
+    Files with identical contents are stored once. The attachment is then processed in the
+    background (type detection, thumbnail, text extraction); an `attachment_processed`
+    WebSocket event is sent when it is done.
+    - ADMINs and MAINTAINERs can attach files to any issue.
+    - REPORTERs can attach files only to issues they created.
+    """
+    _get_visible_issue(db, issue_id, current_user)
+    uploaded_by_id = current_user.id
+    # Return the request's connection to the pool while the body streams in, which can take
+    # minutes; slow clients must not hold connections the rest of the API needs
+    db.commit()
+
+    # Reject declared oversize uploads before reading any of the body
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > ATTACHMENT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Attachments are limited to {ATTACHMENT_MAX_BYTES} bytes"
+        )
+    try:
+        sha256, size_bytes = await store_upload(request.stream())
+    except AttachmentTooLarge as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except AttachmentEmpty as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Recorded in a fresh session, holding a connection only for the insert
+    upload_db = SessionLocal(bind=db.get_bind())
+    try:
+        db_attachment = crud.create_attachment(
+            upload_db,
+            issue_id=issue_id,
+            filename=os.path.basename(filename),
+            content_type=request.headers.get("content-type") or "application/octet-stream",
+            size_bytes=size_bytes,
+            sha256=sha256,
+            uploaded_by_id=uploaded_by_id,
+        )
+    except IntegrityError:
+        # The issue was deleted during the upload; the unreferenced blob is pruned later
+        raise HTTPException(status_code=404, detail="Issue not found")
+    finally:
+        upload_db.close()
+    # The background task outlives the request session, so give it its own.
+    background_tasks.add_task(run_attachment_processing, SessionLocal(bind=db.get_bind()), db_attachment.id)
+    return db_attachment
+
+@router.get("/{issue_id}/attachments", response_model=List[schemas.Attachment])
+async def read_attachments(
+    issue_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    List an issue's attachments, oldest first. Uses the same permissions as viewing the issue.
+    """
+    _get_visible_issue(db, issue_id, current_user)
+    return crud.get_attachments(db, issue_id)
+
+@router.get("/{issue_id}/attachments/{attachment_id}/download")
+async def download_attachment(
+    issue_id: int,
+    attachment_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Download an attachment. Supports Range requests (206 Partial Content) and conditional
+    requests against the ETag, which is the SHA-256 of the contents.
+    Uses the same permissions as viewing the issue.
+    """
+    _get_visible_issue(db, issue_id, current_user)
+    db_attachment = _get_attachment(db, issue_id, attachment_id)
+
+    headers = {"ETag": f'"{db_attachment.sha256}"', "Cache-Control": ATTACHMENT_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    path = blob_storage.path(db_attachment.sha256)
+    if ATTACHMENT_ACCEL_REDIRECT_PREFIX:
+        # The proxy serves the file itself, ranges included; only the headers come from here
+        return Response(headers={
+            "X-Accel-Redirect": ATTACHMENT_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + os.path.relpath(path, blob_storage.root),
+            "Content-Type": db_attachment.content_type,
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(db_attachment.filename)}",
+            **headers,
+        })
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Attachment contents are no longer stored")
+    response = FileResponse(path, media_type=db_attachment.content_type, filename=db_attachment.filename, headers=headers)
+    # Reads larger blocks than the default 64 KiB, off the event loop, so memory stays flat for any size
+    response.chunk_size = ATTACHMENT_CHUNK_SIZE
+    return response
+
+@router.get("/{issue_id}/attachments/{attachment_id}/artifacts/{name}")
+async def download_attachment_artifact(
+    issue_id: int,
+    attachment_id: int,
+    name: str,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Download a file derived from an attachment during processing, e.g. `thumbnail.png`
+    or `text.txt`; the attachment's `artifacts` lists those available.
+    Uses the same permissions as viewing the issue.
+    """
+    _get_visible_issue(db, issue_id, current_user)
+    db_attachment = _get_attachment(db, issue_id, attachment_id)
+    if name not in (db_attachment.artifacts or []) and use_primary(db):
+        # Processing may have just finished, with the replica still behind
+        db.refresh(db_attachment)
+    if name not in (db_attachment.artifacts or []):
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    path = blob_storage.artifact_path(db_attachment.sha256, name)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Artifact is no longer stored")
+    media_type = "image/png" if name == THUMBNAIL_ARTIFACT else "text/plain; charset=utf-8"
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": ATTACHMENT_CACHE_CONTROL})
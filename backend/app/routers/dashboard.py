@@ -1,11 +1,27 @@
 # backend/app/routers/dashboard.py
 
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
 from ..database import get_db
 from ..auth import require_maintainer_or_admin
+from ..stats import count_periods, get_stats_history
+from ..sla import SLA_CACHE_DAYS, sla_report
+from ..snapshot import slice_issues
+from ..single_flight import single_flight
+
+# Days covered by the SLA report when no range is given
+DEFAULT_SLA_DAYS = 84
+
+# Most points a history request may return
+MAX_HISTORY_POINTS = 1000
+
+# Single-flight scope of dashboard results: every caller (MAINTAINER or ADMIN) sees the same data
+STAFF_SCOPE = "staff"
 
 # Create an APIRouter instance for dashboard endpoints
 router = APIRouter(
@@ -22,6 +38,87 @@ async def get_dashboard_status_counts(
     Retrieve aggregated issue counts by status for the dashboard.
     Requires MAINTAINER or ADMIN role.
     """
-    status_counts = crud.get_issue_status_counts(db)
+    status_counts = await single_flight.run(("dashboard.status_counts", STAFF_SCOPE), crud.get_issue_status_counts, db)
     return schemas.DashboardData(status_counts=status_counts)
 
+@router.get("/summary", response_model=schemas.DashboardSummary)
+async def get_dashboard_summary(
+    reporters: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Retrieve issue counts by status, by severity, by status and severity, and for the
+    reporters with the most issues, all from one query.
+    Requires MAINTAINER or ADMIN role.
+    """
+    return await single_flight.run(("dashboard.summary", STAFF_SCOPE, reporters), crud.get_issue_summary, db, reporters)
+
+@router.get("/history", response_model=schemas.StatsHistory)
+async def get_dashboard_history(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    granularity: models.StatsGranularity = models.StatsGranularity.DAY,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Retrieve end-of-period issue counts by status and severity for a date range,
+    per day, week or month, for at most MAX_HISTORY_POINTS periods.
+    Requires MAINTAINER or ADMIN role.
+    """
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+    if count_periods(start, end, granularity) > MAX_HISTORY_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range covers more than {MAX_HISTORY_POINTS} periods; use a shorter range or a coarser granularity"
+        )
+    points = await single_flight.run(("dashboard.history", STAFF_SCOPE, start, end, granularity), get_stats_history, db, start, end, granularity)
+    return schemas.StatsHistory(granularity=granularity, points=points)
+
+@router.get("/sla", response_model=schemas.SlaReport)
+def get_dashboard_sla(
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Retrieve p50/p90/p99 time-to-triage and time-to-done, overall, by severity and by week,
+    for issues triaged or resolved in a date range (default: the last 12 weeks) of at most
+    SLA_CACHE_DAYS days.
+    Requires MAINTAINER or ADMIN role.
+    """
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=DEFAULT_SLA_DAYS - 1)
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+    # Longer ranges would evict their own days from the per-day cache while loading them
+    if (end - start).days + 1 > SLA_CACHE_DAYS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"The range may cover at most {SLA_CACHE_DAYS} days")
+    return single_flight.do(("dashboard.sla", STAFF_SCOPE, start, end), sla_report, db, start, end)
+
+@router.get("/slices", response_model=schemas.IssueSlice)
+def get_dashboard_slices(
+    group_by: List[models.IssueSliceDimension] = Query([]),
+    issue_status: Optional[List[models.IssueStatus]] = Query(None, alias="status"),
+    severity: Optional[List[models.IssueSeverity]] = Query(None),
+    owner_id: Optional[int] = None,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Retrieve issue counts grouped by any combination of status, severity, owner and creation week,
+    optionally filtered by status, severity, owner and creation date.
+    Requires MAINTAINER or ADMIN role.
+    """
+    if start and end and end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+    if len(set(group_by)) != len(group_by):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Each 'group_by' dimension may only be given once")
+    key = ("dashboard.slices", STAFF_SCOPE, tuple(group_by), tuple(sorted(issue_status or [])), tuple(sorted(severity or [])), owner_id, start, end)
+    return single_flight.do(key, lambda: slice_issues(db, group_by, statuses=issue_status, severities=severity, owner_id=owner_id,
+                                                      created_from=start, created_to=end))
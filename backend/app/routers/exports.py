@@ -0,0 +1,96 @@
+# backend/app/routers/exports.py
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+import os
+
+from .. import crud, models, schemas
+from ..database import get_db
+from ..auth import require_maintainer_or_admin
+from ..exports import COLUMNAR_FILE_EXTENSIONS, start_export_job
+from ..replicas import use_primary
+
+# Create an APIRouter instance for analytics export endpoints
+router = APIRouter(
+    prefix="/api/v1/exports",
+    tags=["Exports"],
+    responses={404: {"description": "Export job not found"}},
+)
+
+COLUMNAR_MEDIA_TYPES = {
+    models.ExportFileFormat.PARQUET: "application/vnd.apache.parquet",
+    models.ExportFileFormat.ARROW: "application/vnd.apache.arrow.file",
+}
+
+def _export_job_response(db_job: models.ExportJob) -> schemas.ExportJob:
+    """
+    Builds the export job response, adding the download link once the file is ready.
+    """
+    job = schemas.ExportJob.model_validate(db_job)
+    if db_job.status == models.ExportStatus.COMPLETED:
+        job.download_url = f"{router.prefix}/{db_job.id}/download"
+    return job
+
+def _get_visible_export_job(db: Session, job_id: int, current_user: models.User) -> models.ExportJob:
+    """
+    Fetches an export job, only letting ADMINs see jobs requested by someone else.
+    """
+    db_job = crud.get_export_job(db, job_id=job_id)
+    if db_job is None and use_primary(db):
+        # The job may have just been created and not reached the replica yet
+        db_job = crud.get_export_job(db, job_id=job_id)
+    if db_job is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if current_user.role != models.UserRole.ADMIN and db_job.requested_by_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to view this export"
+        )
+    return db_job
+
+@router.post("/", response_model=schemas.ExportJob, status_code=status.HTTP_202_ACCEPTED)
+async def create_export(
+    export: schemas.ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Start a Parquet or Arrow export of issues or daily stats.
+    The file is written in the background, by the job queue workers or a dedicated executor
+    (EXPORT_RUNNER); poll the job until it has a download_url.
+    Requires MAINTAINER or ADMIN role.
+    """
+    db_job = crud.create_export_job(db, job=export, requested_by_id=current_user.id)
+    start_export_job(db, db_job)
+    return _export_job_response(db_job)
+
+@router.get("/{job_id}", response_model=schemas.ExportJob)
+async def read_export(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Retrieve the status of an export job.
+    """
+    return _export_job_response(_get_visible_export_job(db, job_id, current_user))
+
+@router.get("/{job_id}/download")
+async def download_export(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(require_maintainer_or_admin)
+):
+    """
+    Download the file produced by a completed export job.
+    """
+    db_job = _get_visible_export_job(db, job_id, current_user)
+    if db_job.status != models.ExportStatus.COMPLETED and use_primary(db):
+        # The job may have just completed, with the replica still behind
+        db.refresh(db_job)
+    if db_job.status != models.ExportStatus.COMPLETED or not db_job.file_path or not os.path.exists(db_job.file_path):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Export is not ready for download")
+
+    file_name = f"{db_job.dataset.value.lower()}.{COLUMNAR_FILE_EXTENSIONS[db_job.format]}"
+    return FileResponse(db_job.file_path, media_type=COLUMNAR_MEDIA_TYPES[db_job.format], filename=file_name)
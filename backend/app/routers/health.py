@@ -0,0 +1,71 @@
+# backend/app/routers/health.py
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+
+from .. import schemas
+from ..database import engine, get_pool_status
+
+# Load balancer and orchestrator probes; unauthenticated and outside the versioned API
+router = APIRouter(tags=["Health"])
+
+# A worker whose checkouts timed out this recently is reported unready even if connections freed up since
+READY_AFTER_POOL_TIMEOUT_SECONDS = 10
+
+# A database ping still running after this long marks the worker unready
+READY_PING_TIMEOUT_SECONDS = 2
+
+# Pings run on their own thread, one at a time: a hung ping is awaited again by the next
+# probe rather than piling up threads behind it
+_ping_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness-ping")
+_ping: Optional[Future] = None
+
+def _ping_database():
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+async def _ping_database_within(timeout_seconds: float):
+    global _ping
+    if _ping is None or _ping.done():
+        _ping = _ping_executor.submit(_ping_database)
+    # Threads cannot be cancelled; a timed-out ping keeps running, and the next probe waits on it
+    await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(_ping)), timeout=timeout_seconds)
+
+@router.get("/healthz", response_model=schemas.HealthStatus)
+async def healthz():
+    """
+    Liveness probe: the worker is up and serving requests. Never touches the database, and
+    reports pool saturation without failing, since restarting a busy worker would not help.
+    """
+    pool = get_pool_status()
+    return schemas.HealthStatus(status="saturated" if pool["saturated"] else "ok", database_pool=pool)
+
+@router.get("/readyz", response_model=schemas.HealthStatus, responses={503: {"model": schemas.HealthStatus}})
+async def readyz(response: Response):
+    """
+    Readiness probe: 503 while this worker's database pool is exhausted (or recently timed out
+    checkouts) or the database is unreachable or slower than READY_PING_TIMEOUT_SECONDS, so the
+    load balancer routes requests elsewhere. Every worker pings the same database, so an outage
+    of it marks all of them unready at once.
+    """
+    pool = get_pool_status()
+    detail = None
+    if pool["saturated"]:
+        detail = "Database connection pool is exhausted"
+    elif pool.get("seconds_since_last_timeout") is not None and pool["seconds_since_last_timeout"] < READY_AFTER_POOL_TIMEOUT_SECONDS:
+        detail = "Database connection checkouts timed out recently"
+    else:
+        try:
+            await _ping_database_within(READY_PING_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            detail = f"Database did not answer within {READY_PING_TIMEOUT_SECONDS}s"
+        except Exception as e:
+            detail = f"Database is unreachable: {type(e).__name__}"
+    if detail is not None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return schemas.HealthStatus(status="unready", detail=detail, database_pool=pool)
+    return schemas.HealthStatus(status="ready", database_pool=get_pool_status())
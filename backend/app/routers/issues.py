@@ -1,12 +1,22 @@
 # backend/app/routers/issues.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import json
 
 from .. import crud, models, schemas
-from ..database import get_db
+from ..database import get_db, SessionLocal
+from ..replicas import use_primary
+from ..single_flight import single_flight
+from ..idempotency import idempotency_store
+from ..issue_ingest import issue_batcher
+from ..exports import EXPORT_MEDIA_TYPES, stream_issue_export
+from ..search import search_issues
+from ..dedup import duplicate_index
+from ..suggest import MAX_SUGGESTIONS, suggest_titles
+from ..issue_summary import MAX_RECENT_ISSUES, get_owner_summary
 from ..auth import get_current_user
 from ..websockets import manager # Import the WebSocket manager from the new websockets module
 
@@ -17,39 +27,86 @@ router = APIRouter(
     responses={404: {"description": "Issue not found"}},
 )
 
-@router.post("/", response_model=schemas.Issue, status_code=status.HTTP_201_CREATED)
+def _owner_scope(current_user: models.User, action: str) -> Optional[int]:
+    """
+    Returns the owner ID that issue queries must be restricted to, following the issue list rules:
+    - ADMINs and MAINTAINERs see all issues (no restriction).
+    - REPORTERs see only issues they created.
+    """
+    if current_user.role == models.UserRole.ADMIN or current_user.role == models.UserRole.MAINTAINER:
+        return None
+    if current_user.role == models.UserRole.REPORTER:
+        return current_user.id
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Not enough permissions to {action}"
+    )
+
+@router.post("/", response_model=schemas.IssueCreated, status_code=status.HTTP_201_CREATED)
 async def create_issue(
     issue: schemas.IssueCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: models.User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, min_length=1, max_length=255)
 ):
     """
     Create a new issue. Reporters can create their own issues.
+    Returns likely duplicates among the issues the caller can see.
     Broadcasts a message on creation.
+    With an Idempotency-Key header, retries of the request get the first response replayed
+    instead of creating the issue again.
     """
-    db_issue = crud.create_issue(db=db, issue=issue, owner_id=current_user.id)
-
-    # Convert SQLAlchemy model to a dictionary that matches the Pydantic schema
-    # This explicitly extracts the attributes needed by schemas.Issue
-    issue_data_for_websocket = {
-        "id": db_issue.id,
-        "title": db_issue.title,
-        "description": db_issue.description,
-        "severity": db_issue.severity.value, # Send enum value as string
-        "status": db_issue.status.value,     # Send enum value as string
-        "created_at": db_issue.created_at.isoformat(), # Convert datetime to ISO format string
-        "updated_at": db_issue.updated_at.isoformat(), # Convert datetime to ISO format string
-        "owner_id": db_issue.owner_id
-    }
-    
-    # Now, validate this dictionary with the Pydantic schema and dump to JSON
-    message = {
-        "type": "issue_created",
-        "issue": schemas.Issue(**issue_data_for_websocket).model_dump_json()
-    }
-    await manager.broadcast(message)
+    owner_id = _owner_scope(current_user, "create issues")
 
-    return db_issue
+    async def create() -> schemas.IssueCreated:
+        # Look up duplicates before the new issue is indexed, so it doesn't match itself
+        possible_duplicates = duplicate_index.find_duplicates(issue.title, issue.description, owner_id=owner_id)
+        if issue_batcher.enabled:
+            # Group commit: written in one transaction with the other issues submitted meanwhile
+            db_issue = await issue_batcher.create(issue, current_user.id)
+        else:
+            db_issue = crud.create_issue(db=db, issue=issue, owner_id=current_user.id)
+
+        # Convert SQLAlchemy model to a dictionary that matches the Pydantic schema
+        # This explicitly extracts the attributes needed by schemas.Issue
+        issue_data_for_websocket = {
+            "id": db_issue.id,
+            "title": db_issue.title,
+            "description": db_issue.description,
+            "severity": db_issue.severity.value, # Send enum value as string
+            "status": db_issue.status.value,     # Send enum value as string
+            "created_at": db_issue.created_at.isoformat(), # Convert datetime to ISO format string
+            "updated_at": db_issue.updated_at.isoformat(), # Convert datetime to ISO format string
+            "owner_id": db_issue.owner_id
+        }
+
+        # Now, validate this dictionary with the Pydantic schema and dump to JSON
+        message = {
+            "type": "issue_created",
+            "issue": schemas.Issue(**issue_data_for_websocket).model_dump_json()
+        }
+        await manager.broadcast(message)
+
+        return schemas.IssueCreated(**issue_data_for_websocket, possible_duplicates=possible_duplicates)
+
+    if idempotency_key is None:
+        return await create()
+    return await idempotency_store.run(
+        db, ("issues.create", current_user.id, idempotency_key), issue, create, status.HTTP_201_CREATED
+    )
+
+@router.post("/duplicates", response_model=List[schemas.DuplicateCandidate])
+async def preview_duplicates(
+    issue: schemas.IssueCreate,
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Preview likely duplicates of an issue before submitting it.
+    - ADMINs and MAINTAINERs are matched against all issues.
+    - REPORTERs are matched only against issues they created.
+    """
+    owner_id = _owner_scope(current_user, "view issues")
+    return duplicate_index.find_duplicates(issue.title, issue.description, owner_id=owner_id)
 
 
 @router.get("/", response_model=List[schemas.Issue])
@@ -63,17 +120,103 @@ async def read_issues(
     Retrieve a list of issues.
     - ADMINs and MAINTAINERs can view all issues.
     - REPORTERs can view only issues they created.
+    Concurrent identical requests within the same scope share one query, unless an issue in
+    that scope was written after the query started.
     """
-    if current_user.role == models.UserRole.ADMIN or current_user.role == models.UserRole.MAINTAINER:
-        issues = crud.get_issues(db, skip=skip, limit=limit)
-    elif current_user.role == models.UserRole.REPORTER:
-        issues = crud.get_issues_by_owner(db, owner_id=current_user.id, skip=skip, limit=limit)
-    else:
+    owner_id = _owner_scope(current_user, "view issues")
+
+    def load_issues():
+        if owner_id is None:
+            issues = crud.get_issues(db, skip=skip, limit=limit)
+        else:
+            issues = crud.get_issues_by_owner(db, owner_id=owner_id, skip=skip, limit=limit)
+        # Plain schemas, as the result is shared with requests holding other sessions
+        return [schemas.Issue.model_validate(issue, from_attributes=True) for issue in issues]
+
+    return await single_flight.run(("issues.list", owner_id, skip, limit), load_issues)
+
+def _forget_issue_lists(action: str, db_issue: models.Issue):
+    """
+    Issue write hook: lists of the written issue's scopes computed from here on start a new
+    query, so the writer's next list includes its write. Only this worker's lists are affected;
+    a list on another worker may still predate the write by the duration of one query.
+    """
+    single_flight.forget("issues.list", lambda key: key[1] is None or key[1] == db_issue.owner_id)
+
+crud.issue_write_hooks.append(_forget_issue_lists)
+
+@router.get("/export")
+async def export_issues(
+    format: str = "csv",
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Stream every visible issue as CSV or NDJSON.
+    Uses the same scoping as the issue list:
+    - ADMINs and MAINTAINERs export all issues.
+    - REPORTERs export only issues they created.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to view issues"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format. Choose one of: {', '.join(EXPORT_MEDIA_TYPES)}"
         )
-    return issues
+
+    owner_id = _owner_scope(current_user, "export issues")
+
+    # The request session is closed before the body is streamed,
+    # so the export gets its own session on the same engine.
+    export_db = SessionLocal(bind=db.get_bind())
+    return StreamingResponse(
+        stream_issue_export(export_db, format, owner_id=owner_id),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="issues.{format}"'}
+    )
+
+@router.get("/search", response_model=List[schemas.Issue])
+async def search(
+    q: str = Query(..., min_length=1),
+    skip: int = 0,
+    limit: int = Query(20, le=100),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Full-text search over issue titles and descriptions, best matches first.
+    Uses the same scoping as the issue list:
+    - ADMINs and MAINTAINERs search all issues.
+    - REPORTERs search only issues they created.
+    """
+    owner_id = _owner_scope(current_user, "search issues")
+    return search_issues(db, q, owner_id=owner_id, skip=skip, limit=limit)
+
+@router.get("/suggest", response_model=List[schemas.TitleSuggestion])
+async def suggest(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Suggest issue titles containing the typed text, for autocomplete.
+    - ADMINs and MAINTAINERs get suggestions from all issues.
+    - REPORTERs get suggestions only from issues they created.
+    """
+    owner_id = _owner_scope(current_user, "view issues")
+    return suggest_titles(db, prefix, owner_id=owner_id, limit=limit)
+
+@router.get("/me/summary", response_model=schemas.OwnerIssueSummary)
+async def read_my_issue_summary(
+    recent: int = Query(5, ge=0, le=MAX_RECENT_ISSUES),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Retrieve the caller's issue counts by status and severity and their newest issues.
+    Available to every role; only counts issues the caller created.
+    """
+    return get_owner_summary(db, current_user.id, recent_limit=recent)
 
 @router.get("/{issue_id}", response_model=schemas.Issue)
 async def read_issue(
@@ -87,6 +230,9 @@ async def read_issue(
     - REPORTERs can view only issues they created.
     """
     db_issue = crud.get_issue(db, issue_id=issue_id)
+    if db_issue is None and use_primary(db):
+        # The issue may have just been created and not reached the replica yet
+        db_issue = crud.get_issue(db, issue_id=issue_id)
     if db_issue is None:
         raise HTTPException(status_code=404, detail="Issue not found")
 
@@ -154,7 +300,7 @@ async def update_issue(
             detail="Not enough permissions to update issues"
         )
 
-    updated_issue = crud.update_issue(db, issue_id=issue_id, issue_update=issue_update_data)
+    updated_issue = crud.update_issue(db, issue_id=issue_id, issue_update=issue_update_data, actor_id=current_user.id)
     if updated_issue is None:
         raise HTTPException(status_code=404, detail="Issue not found after update attempt")
 
@@ -201,7 +347,7 @@ async def delete_issue(
             detail="Not enough permissions to delete issues"
         )
 
-    result = crud.delete_issue(db, issue_id=issue_id)
+    result = crud.delete_issue(db, issue_id=issue_id, actor_id=current_user.id)
     if result is None:
         raise HTTPException(status_code=404, detail="Issue not found after delete attempt")
 
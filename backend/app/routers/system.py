@@ -0,0 +1,122 @@
+# backend/app/routers/system.py
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+
+from .. import models, schemas
+from ..database import get_db, get_pool_status, get_replica_status
+from ..auth import require_admin
+from ..leader import scheduler_lease
+from ..job_runner import job_runner
+from ..snapshot import snapshot_status
+from ..deadlines import deadline_metrics
+from ..issue_cache import issue_cache
+from ..single_flight import single_flight
+from ..idempotency import idempotency_store
+from ..issue_ingest import issue_batcher
+
+# Create an APIRouter instance for operational endpoints
+router = APIRouter(
+    prefix="/api/v1/system",
+    tags=["System"],
+)
+
+@router.get("/scheduler", response_model=schemas.SchedulerStatus, dependencies=[Depends(require_admin)])
+async def get_scheduler_status(db: Session = Depends(get_db)):
+    """
+    Show which worker leads the scheduler and when each cluster-wide job last ran.
+    Requires ADMIN role.
+    """
+    lease = db.get(models.SchedulerLease, scheduler_lease.name)
+    lease_active = lease is not None and lease.expires_at > datetime.utcnow()
+    jobs = db.query(models.ScheduledJobState).order_by(models.ScheduledJobState.job_id).all()
+    return schemas.SchedulerStatus(
+        lease_name=scheduler_lease.name,
+        leader=lease.holder if lease_active else None,
+        lease_acquired_at=lease.acquired_at if lease_active else None,
+        lease_expires_at=lease.expires_at if lease_active else None,
+        worker=scheduler_lease.holder_id,
+        is_leader=scheduler_lease.is_leader,
+        jobs=jobs,
+    )
+
+@router.get("/jobs", response_model=List[schemas.JobMetrics], dependencies=[Depends(require_admin)])
+async def get_job_metrics():
+    """
+    Show run counts, failures, timeouts and durations of scheduled jobs on this worker.
+    Requires ADMIN role.
+    """
+    return [job_runner.metrics[job_id] for job_id in sorted(job_runner.metrics)]
+
+@router.get("/issue_snapshot", response_model=schemas.IssueSnapshotStatus, dependencies=[Depends(require_admin)])
+async def get_issue_snapshot_status():
+    """
+    Show how many issues this worker's in-memory issue snapshot holds and its memory footprint.
+    Requires ADMIN role.
+    """
+    return snapshot_status()
+
+@router.get("/db_pool", response_model=schemas.DatabasePoolStatus, dependencies=[Depends(require_admin)])
+async def get_db_pool_status():
+    """
+    Show this worker's database connection pool: connections in use, overflow, checkout
+    wait times and timeouts.
+    Requires ADMIN role.
+    """
+    return get_pool_status()
+
+@router.get("/db_replicas", response_model=List[schemas.ReplicaStatus], dependencies=[Depends(require_admin)])
+async def get_db_replica_status():
+    """
+    Show the read replicas this worker routes read-only requests to, their last health
+    check and their connection pools.
+    Requires ADMIN role.
+    """
+    return get_replica_status()
+
+@router.get("/deadlines", response_model=List[schemas.RouteDeadlineMetrics], dependencies=[Depends(require_admin)])
+async def get_deadline_metrics():
+    """
+    Show which routes on this worker ran past their deadline (504) or found no free
+    database connection (503), and how often.
+    Requires ADMIN role.
+    """
+    return deadline_metrics.snapshot()
+
+@router.get("/issue_cache", response_model=schemas.IssueCacheStatus, dependencies=[Depends(require_admin)])
+async def get_issue_cache_status():
+    """
+    Show this worker's hot-issue cache: size, hit ratio, evictions and invalidations.
+    Requires ADMIN role.
+    """
+    return issue_cache.status()
+
+@router.get("/single_flight", response_model=List[schemas.SingleFlightMetrics], dependencies=[Depends(require_admin)])
+async def get_single_flight_metrics():
+    """
+    Show, per coalesced endpoint on this worker, how many computations ran and how many
+    requests shared one already in flight instead.
+    Requires ADMIN role.
+    """
+    return single_flight.status()
+
+@router.get("/idempotency", response_model=schemas.IdempotencyMetrics, dependencies=[Depends(require_admin)])
+async def get_idempotency_metrics():
+    """
+    Show how many Idempotency-Key requests this worker ran, replayed (from memory or the
+    database), made wait for an in-flight original, or rejected.
+    Requires ADMIN role.
+    """
+    return idempotency_store.status()
+
+@router.get("/issue_ingest", response_model=schemas.IssueIngestStatus, dependencies=[Depends(require_admin)])
+async def get_issue_ingest_status():
+    """
+    Show this worker's issue ingestion batcher: issues waiting, batches written, their
+    average size and write time, and issues that failed.
+    Requires ADMIN role.
+    """
+    return issue_batcher.status()
@@ -1,9 +1,9 @@
 # backend/app/schemas.py
 
 from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime, date # Import date for DailyStats schema
-from .models import UserRole, IssueStatus, IssueSeverity # Import new Enums
+from .models import UserRole, IssueStatus, IssueSeverity, ExportDataset, ExportFileFormat, ExportStatus, StatsGranularity, IssueSliceDimension, AttachmentStatus # Import new Enums
 
 # Pydantic model for creating a new user
 class UserCreate(BaseModel):
@@ -96,6 +96,63 @@ class Issue(BaseModel):
     class Config:
         model_config = ConfigDict(from_attributes=True)
 
+# Pydantic model for a likely duplicate of a new issue
+class DuplicateCandidate(BaseModel):
+    """
+    Schema for an existing issue that looks like a duplicate.
+    similarity is the estimated Jaccard similarity of title and description (0-1).
+    """
+    issue_id: int
+    title: str
+    similarity: float
+
+# Pydantic model for the issue creation response
+class IssueCreated(Issue):
+    """
+    Schema for a newly created issue, with existing issues it probably duplicates.
+    """
+    possible_duplicates: List[DuplicateCandidate] = []
+
+# Pydantic model for displaying attachment metadata
+class Attachment(BaseModel):
+    """
+    Schema for a file attached to an issue. `sha256` is the hex digest of its contents.
+    """
+    id: int
+    issue_id: int
+    uploaded_by_id: Optional[int] = None
+    filename: str
+    content_type: str
+    size_bytes: int
+    sha256: str
+    created_at: datetime
+    status: AttachmentStatus
+    detected_type: Optional[str] = None
+    artifacts: Optional[List[str]] = None
+    stage_timings: Optional[Dict[str, float]] = None
+    processing_error: Optional[str] = None
+    processed_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Pydantic model for a reporter's own issue summary
+class OwnerIssueSummary(BaseModel):
+    """
+    Schema for the caller's issue counts by status and severity and their newest issues.
+    """
+    total: int
+    status_counts: Dict[IssueStatus, int]
+    severity_counts: Dict[IssueSeverity, int]
+    recent_issues: List[Issue]
+
+# Pydantic model for a title autocomplete suggestion
+class TitleSuggestion(BaseModel):
+    """
+    Schema for an issue title suggested while typing.
+    """
+    id: int
+    title: str
+
 # Pydantic model for Dashboard data (issue counts by status)
 class DashboardData(BaseModel):
     """
@@ -104,6 +161,117 @@ class DashboardData(BaseModel):
     """
     status_counts: Dict[IssueStatus, int] # Dictionary mapping IssueStatus to count
 
+# Pydantic model for one period of the dashboard history
+class StatsHistoryPoint(BaseModel):
+    """
+    Schema for issue counts at the end of a day, week or month.
+    Severity counts only cover days recorded with a severity split.
+    """
+    period_start: date
+    status_counts: Dict[IssueStatus, int]
+    severity_counts: Dict[IssueSeverity, int]
+
+# Pydantic models for the dashboard summary
+class ReporterIssueCounts(BaseModel):
+    """
+    Schema for the number of issues one reporter has, in total and by status.
+    """
+    owner_id: int
+    total: int
+    status_counts: Dict[IssueStatus, int]
+
+class DashboardSummary(BaseModel):
+    """
+    Schema for issue counts broken down by status, severity, both, and by reporter.
+    """
+    total: int
+    status_counts: Dict[IssueStatus, int]
+    severity_counts: Dict[IssueSeverity, int]
+    status_severity_counts: Dict[IssueStatus, Dict[IssueSeverity, int]]
+    reporter_count: int
+    top_reporters: List[ReporterIssueCounts]
+
+# Pydantic model for the dashboard history
+class StatsHistory(BaseModel):
+    """
+    Schema for issue counts over a date range, oldest period first.
+    """
+    granularity: StatsGranularity
+    points: List[StatsHistoryPoint]
+
+# Pydantic models for the SLA report
+class SlaStats(BaseModel):
+    """
+    Schema for the number of issues and their duration percentiles, in hours.
+    """
+    count: int
+    p50_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p99_hours: Optional[float] = None
+
+class SlaWeekStats(SlaStats):
+    """
+    Schema for SLA stats of issues completed in the week starting on `week_start` (a Monday).
+    """
+    week_start: date
+
+class SlaHistogramBucket(BaseModel):
+    """
+    Schema for the number of issues taking between `min_hours` and `max_hours` (open-ended if null).
+    """
+    min_hours: float
+    max_hours: Optional[float] = None
+    count: int
+
+class SlaMetric(BaseModel):
+    """
+    Schema for one SLA duration broken down overall, by severity and by week of completion.
+    """
+    overall: SlaStats
+    by_severity: Dict[IssueSeverity, SlaStats]
+    by_week: List[SlaWeekStats]
+    histogram: List[SlaHistogramBucket]
+
+class SlaReport(BaseModel):
+    """
+    Schema for time-to-triage and time-to-done of issues triaged or resolved in a date range.
+    """
+    start: date
+    end: date
+    time_to_triage: SlaMetric
+    time_to_done: SlaMetric
+
+# Pydantic models for ad-hoc dashboard slices
+class IssueSliceRow(BaseModel):
+    """
+    Schema for the number of issues in one group of a slice. Only the grouped-by fields are set.
+    """
+    status: Optional[IssueStatus] = None
+    severity: Optional[IssueSeverity] = None
+    owner_id: Optional[int] = None
+    week_start: Optional[date] = None
+    count: int
+
+class IssueSlice(BaseModel):
+    """
+    Schema for issue counts grouped by any of status, severity, owner and creation week.
+    `source` tells whether the in-memory snapshot or the database answered.
+    """
+    group_by: List[IssueSliceDimension]
+    total: int
+    source: str
+    rows: List[IssueSliceRow]
+
+class IssueSnapshotStatus(BaseModel):
+    """
+    Schema for the size of this worker's in-memory issue snapshot.
+    """
+    enabled: bool
+    issue_count: int
+    memory_bytes: int
+    bytes_per_million_issues: int
+    indexed_at: Optional[datetime] = None
+
 # Pydantic model for DailyStats data
 class DailyStats(BaseModel):
     """
@@ -115,3 +283,182 @@ class DailyStats(BaseModel):
 
     class Config:
         model_config = ConfigDict(from_attributes=True)
+
+# Pydantic model for requesting a columnar export
+class ExportJobCreate(BaseModel):
+    """
+    Schema for starting a columnar export of issues or daily stats.
+    """
+    dataset: ExportDataset
+    format: ExportFileFormat = ExportFileFormat.PARQUET
+
+# Pydantic model for displaying export job state
+class ExportJob(BaseModel):
+    """
+    Schema for displaying an export job.
+    download_url is only set once the export has completed.
+    """
+    id: int
+    dataset: ExportDataset
+    format: ExportFileFormat
+    status: ExportStatus
+    row_count: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    download_url: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Pydantic model for a leader-only scheduled job
+class ScheduledJobState(BaseModel):
+    """
+    Schema for when a cluster-wide scheduled job last ran, and on which worker.
+    """
+    job_id: str
+    last_run_at: Optional[datetime] = None
+    last_run_by: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Pydantic model for scheduler leadership
+class SchedulerStatus(BaseModel):
+    """
+    Schema for the scheduler leader lease as seen from the worker answering the request.
+    """
+    lease_name: str
+    leader: Optional[str] = None # Worker currently holding the lease, if any
+    lease_acquired_at: Optional[datetime] = None
+    lease_expires_at: Optional[datetime] = None
+    worker: str # Worker answering this request
+    is_leader: bool
+    jobs: List[ScheduledJobState] = []
+
+# Pydantic model for per-job scheduler metrics
+class JobMetrics(BaseModel):
+    """
+    Schema for run counters and timings of a scheduled job on the answering worker.
+    """
+    job_id: str
+    running: bool
+    successes: int
+    failures: int
+    timeouts: int
+    skipped: int
+    overlaps: int
+    last_started_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    max_duration_seconds: float
+    total_duration_seconds: float
+    last_error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Pydantic model for database connection pool statistics
+class DatabasePoolStatus(BaseModel):
+    """
+    Schema for the answering worker's database connection pool: occupancy, and checkout
+    counts and wait times since the worker started.
+    """
+    pool_class: str
+    pre_ping: str
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_out: Optional[int] = None
+    checked_in: Optional[int] = None
+    overflow: Optional[int] = None
+    capacity: Optional[int] = None
+    saturated: bool
+    checkouts: Optional[int] = None
+    timeouts: Optional[int] = None
+    seconds_since_last_timeout: Optional[float] = None
+    wait_ms_avg: Optional[float] = None
+    wait_ms_p95: Optional[float] = None
+    wait_ms_max: Optional[float] = None
+
+# Pydantic model for read replica health
+class ReplicaStatus(BaseModel):
+    """
+    Schema for a read replica as seen from the answering worker. `replica` is its URL without the password.
+    """
+    replica: str
+    healthy: bool
+    last_checked_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    database_pool: DatabasePoolStatus
+
+# Pydantic model for health and readiness checks
+class HealthStatus(BaseModel):
+    """
+    Schema for /healthz and /readyz responses.
+    """
+    status: str
+    detail: Optional[str] = None
+    database_pool: DatabasePoolStatus
+
+# Pydantic model for per-route deadline counters
+class RouteDeadlineMetrics(BaseModel):
+    """
+    Schema for how often a route's requests hit their deadline or an exhausted pool on the answering worker.
+    """
+    route: str
+    timeout_seconds: float
+    deadline_exceeded: int
+    pool_timeouts: int
+
+# Pydantic model for the hot-issue cache
+class IssueCacheStatus(BaseModel):
+    """
+    Schema for the answering worker's hot-issue cache.
+    """
+    enabled: bool
+    notifier: str
+    entries: int
+    max_entries: int
+    approximate_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+
+# Pydantic model for single-flight request coalescing
+class SingleFlightMetrics(BaseModel):
+    """
+    Schema for an endpoint's coalesced computations on the answering worker.
+    """
+    name: str
+    in_flight: int
+    executions: int
+    coalesced: int
+
+# Pydantic model for Idempotency-Key handling
+class IdempotencyMetrics(BaseModel):
+    """
+    Schema for the answering worker's Idempotency-Key counters and in-memory stored responses.
+    """
+    cached_responses: int
+    max_entries: int
+    executed: int
+    replayed: int
+    cache_hits: int
+    waited: int
+    conflicts: int
+    mismatches: int
+
+# Pydantic model for batched issue ingestion
+class IssueIngestStatus(BaseModel):
+    """
+    Schema for the answering worker's group-commit issue batcher.
+    """
+    enabled: bool
+    max_batch: int
+    flush_ms: float
+    queued: int
+    batches: int
+    issues: int
+    failures: int
+    largest_batch: int
+    average_batch: float
+    average_write_ms: float
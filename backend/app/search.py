@@ -0,0 +1,98 @@
+# backend/app/search.py
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import DDL, column, event, func, literal_column, or_, table
+from sqlalchemy.orm import Session
+
+from . import models
+
+# Text search configuration used for the Postgres tsvector column
+SEARCH_LANGUAGE = "english"
+
+# --- Index DDL ---
+# The search index lives outside the ORM model because its shape depends on the dialect:
+# a generated tsvector column with a GIN index on Postgres, an FTS5 table kept in sync
+# by triggers on SQLite. Both are created right after the issues table.
+
+POSTGRES_SEARCH_DDL = [
+    f"""ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_LANGUAGE}', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_issues_search_vector ON issues USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts
+    USING fts5(title, description, content='issues', content_rowid='id')""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_ad AFTER DELETE ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(models.Issue.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(models.Issue.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+# The FTS5 table is not dropped together with issues, so remove it explicitly
+event.listen(models.Issue.__table__, "before_drop", DDL("DROP TABLE IF EXISTS issues_fts").execute_if(dialect="sqlite"))
+
+# --- Queries ---
+
+ISSUES_FTS = table("issues_fts", column("rowid"))
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+def _fts5_match_expression(q: str) -> Optional[str]:
+    """
+    Turns free text into an FTS5 query that matches documents containing every word.
+    Each word is quoted so user input can never be parsed as FTS5 syntax.
+    """
+    tokens = _TOKEN_PATTERN.findall(q)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens)
+
+def search_issues(db: Session, q: str, owner_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> List[models.Issue]:
+    """
+    Full-text searches issue titles and descriptions, best matches first.
+    Title matches rank above description matches.
+    Restricts results to a single owner when `owner_id` is given.
+    """
+    dialect = db.get_bind().dialect.name
+    query = db.query(models.Issue)
+
+    if dialect == "postgresql":
+        ts_query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+        search_vector = literal_column("issues.search_vector")
+        query = query.filter(search_vector.op("@@")(ts_query)).order_by(
+            func.ts_rank_cd(search_vector, ts_query).desc(), models.Issue.id.desc()
+        )
+    elif dialect == "sqlite":
+        match = _fts5_match_expression(q)
+        if match is None:
+            return []
+        fts = literal_column("issues_fts") # FTS5 addresses the whole table in MATCH and bm25()
+        query = query.join(ISSUES_FTS, ISSUES_FTS.c.rowid == models.Issue.id).filter(
+            fts.op("MATCH")(match)
+        ).order_by(func.bm25(fts, 10.0, 1.0), models.Issue.id.desc())
+    else:
+        # No full-text index for this dialect; fall back to a substring scan
+        pattern = f"%{q}%"
+        query = query.filter(or_(models.Issue.title.ilike(pattern), models.Issue.description.ilike(pattern))).order_by(
+            models.Issue.id.desc()
+        )
+
+    if owner_id is not None:
+        query = query.filter(models.Issue.owner_id == owner_id)
+    return query.offset(skip).limit(limit).all()
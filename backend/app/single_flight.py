@@ -0,0 +1,112 @@
+# backend/app/single_flight.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+
+load_dotenv()
+
+# Collapse identical concurrent reads of expensive endpoints into one computation
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time in this worker. Callers arriving while a
+    computation for their key is in flight wait for it and share its result (or exception)
+    instead of starting their own. Nothing is kept once it completes: this is not a cache.
+
+    Keys must capture everything the result depends on, including the caller's access scope,
+    and results must not be tied to the session that computed them (e.g. validated schemas
+    rather than ORM instances), since they are handed to requests with other sessions.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.metrics: Dict[str, Dict[str, int]] = {}
+
+    def _join(self, key: Tuple) -> Tuple[Future, bool]:
+        """
+        Returns the in-flight future for `key` and whether the caller must compute it.
+        """
+        with self._lock:
+            counts = self.metrics.setdefault(key[0], {"executions": 0, "coalesced": 0})
+            future = self._in_flight.get(key)
+            if future is not None:
+                counts["coalesced"] += 1
+                return future, False
+            counts["executions"] += 1
+            future = Future()
+            # Running futures cannot be cancelled, so no single waiter can cancel it for everyone
+            future.set_running_or_notify_cancel()
+            self._in_flight[key] = future
+            return future, True
+
+    def _finish(self, key: Tuple, future: Future, compute: Callable[[], Any]):
+        try:
+            result = compute()
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            with self._lock:
+                # forget() may have replaced it with a newer computation meanwhile
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    def do(self, key: Tuple, fn: Callable[..., Any], *args) -> Any:
+        """
+        Returns fn(*args), shared with concurrent callers using the same key.
+        `key[0]` names the endpoint in the metrics. For synchronous callers.
+        """
+        if not self.enabled:
+            return fn(*args)
+        future, leader = self._join(key)
+        if leader:
+            self._finish(key, future, lambda: fn(*args))
+        return future.result()
+
+    async def run(self, key: Tuple, fn: Callable[..., Any], *args) -> Any:
+        """
+        Like do(), for async callers: the blocking fn runs in the threadpool, and waiting
+        callers do not hold a thread. A cancelled caller stops waiting without affecting the
+        others sharing its computation.
+        """
+        if not self.enabled:
+            return await run_in_threadpool(fn, *args)
+        future, leader = self._join(key)
+        if leader:
+            await asyncio.shield(run_in_threadpool(self._finish, key, future, lambda: fn(*args)))
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def forget(self, name: str, match: Optional[Callable[[Tuple], bool]] = None):
+        """
+        Stops callers from joining in-flight computations named `name` (those whose key
+        `match` accepts, if given): later callers start a fresh one. For writes that those
+        computations may have read past, so writers see their own writes afterwards.
+        Callers already waiting still get the older result.
+        """
+        with self._lock:
+            for key in [key for key in self._in_flight if key[0] == name and (match is None or match(key))]:
+                del self._in_flight[key]
+
+    def status(self):
+        with self._lock:
+            return [{"name": name, "in_flight": sum(1 for key in self._in_flight if key[0] == name), **counts}
+                    for name, counts in sorted(self.metrics.items())]
+
+    def clear(self):
+        with self._lock:
+            self.metrics.clear()
+
+single_flight = SingleFlight()
+single_flight.enabled = SINGLE_FLIGHT_ENABLED
@@ -0,0 +1,173 @@
+# backend/app/sla.py
+
+import threading
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from . import models
+
+# Percentiles reported for every group
+SLA_PERCENTILES = (50, 90, 99)
+
+# Histogram bucket edges in hours; the last bucket is open-ended
+HISTOGRAM_EDGES_HOURS = np.array([0, 1, 4, 8, 24, 72, 168, 336, 720, np.inf])
+
+# Issue rows fetched per round trip when loading durations
+SLA_CHUNK_SIZE = 10000
+
+# Closed days kept in the per-day cache
+SLA_CACHE_DAYS = 800
+
+SLA_METRICS = ("time_to_triage", "time_to_done")
+
+_SEVERITIES = list(models.IssueSeverity)
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(_SEVERITIES)}
+
+# Durations of one metric: (completion days as datetime64[D], hours as float64, severity codes as int8)
+Durations = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+def _empty_durations() -> Durations:
+    return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64), np.array([], dtype=np.int8)
+
+def _concat(parts: List[Durations]) -> Durations:
+    if not parts:
+        return _empty_durations()
+    return tuple(np.concatenate([part[i] for part in parts]) for i in range(3))
+
+def _transition_times():
+    """
+    Returns SQL expressions for when each issue was first triaged (left OPEN) and first marked DONE,
+    from the event log. Issues that got there before the log existed fall back on updated_at.
+    """
+    issue, event = models.Issue, models.IssueEvent
+    first_triaged = select(func.min(event.at)).where(
+        event.issue_id == issue.id,
+        event.event_type == models.IssueEventType.UPDATED,
+        event.old_status == models.IssueStatus.OPEN,
+        event.new_status != models.IssueStatus.OPEN,
+    ).scalar_subquery()
+    first_done = select(func.min(event.at)).where(
+        event.issue_id == issue.id,
+        event.event_type == models.IssueEventType.UPDATED,
+        event.old_status != models.IssueStatus.DONE,
+        event.new_status == models.IssueStatus.DONE,
+    ).scalar_subquery()
+    triaged_at = func.coalesce(first_triaged, case(
+        (issue.status != models.IssueStatus.OPEN, issue.updated_at)
+    ))
+    done_at = func.coalesce(first_done, case((issue.status == models.IssueStatus.DONE, issue.updated_at)))
+    return triaged_at, done_at
+
+def load_durations(db: Session, start: date, end: date) -> Dict[str, Durations]:
+    """
+    Loads time-to-triage and time-to-done of issues triaged or resolved on days in [start, end].
+    Rows are read as plain columns in chunks and converted to NumPy arrays per chunk.
+    """
+    range_start = datetime.combine(start, time.min)
+    range_end = np.datetime64(datetime.combine(end + timedelta(days=1), time.min), "s")
+    triaged_at, done_at = _transition_times()
+    # An issue triaged or resolved in the range was updated no earlier than the start of the range,
+    # so the updated_at index bounds the scan
+    query = db.query(models.Issue.created_at, models.Issue.severity, triaged_at, done_at).filter(
+        models.Issue.updated_at >= range_start
+    ).yield_per(SLA_CHUNK_SIZE)
+
+    parts: Dict[str, List[Durations]] = {metric: [] for metric in SLA_METRICS}
+    rows = iter(query)
+    while True:
+        chunk = list(islice(rows, SLA_CHUNK_SIZE))
+        if not chunk:
+            break
+        created, severities, triaged, done = zip(*chunk)
+        created = np.array(created, dtype="datetime64[s]")
+        codes = np.fromiter((_SEVERITY_CODES[severity] for severity in severities), dtype=np.int8, count=len(chunk))
+        for metric, completed in zip(SLA_METRICS, (triaged, done)):
+            completed = np.array(completed, dtype="datetime64[s]")
+            in_range = ~np.isnat(completed) & (completed >= np.datetime64(range_start, "s")) & (completed < range_end)
+            hours = (completed[in_range] - created[in_range]) / np.timedelta64(1, "h")
+            parts[metric].append((completed[in_range].astype("datetime64[D]"), np.maximum(hours, 0.0), codes[in_range]))
+    return {metric: _concat(parts[metric]) for metric in SLA_METRICS}
+
+class SlaDayCache:
+    """
+    Durations per completion day for days that are over. Only today, whose numbers still
+    change, is read from the database on every request.
+    """
+
+    def __init__(self, max_days: int = SLA_CACHE_DAYS):
+        self.max_days = max_days
+        self._days: Dict[date, Dict[str, Durations]] = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._days.clear()
+
+    def get_range(self, db: Session, start: date, end: date, today: date) -> Dict[str, Durations]:
+        closed_end = min(end, today - timedelta(days=1))
+        days = [start + timedelta(days=offset) for offset in range((closed_end - start).days + 1)]
+        with self._lock:
+            missing = [day for day in days if day not in self._days]
+        if missing:
+            self._store(load_durations(db, missing[0], missing[-1]), missing)
+
+        with self._lock:
+            parts = {metric: [self._days[day][metric] for day in days if day in self._days] for metric in SLA_METRICS}
+        if end >= today:
+            for metric, durations in load_durations(db, max(start, today), today).items():
+                parts[metric].append(durations)
+        return {metric: _concat(parts[metric]) for metric in SLA_METRICS}
+
+    def _store(self, loaded: Dict[str, Durations], days: List[date]):
+        by_day: Dict[date, Dict[str, Durations]] = {day: {} for day in days}
+        day_values = np.array(days, dtype="datetime64[D]")
+        for metric, durations in loaded.items():
+            order = np.argsort(durations[0], kind="stable")
+            completed_days, hours, codes = (array[order] for array in durations)
+            bounds = zip(np.searchsorted(completed_days, day_values, "left"), np.searchsorted(completed_days, day_values, "right"))
+            for day, (low, high) in zip(days, bounds):
+                by_day[day][metric] = (completed_days[low:high], hours[low:high], codes[low:high])
+        with self._lock:
+            self._days.update(by_day)
+            # Evict the oldest days beyond the limit
+            for day in sorted(self._days)[:max(0, len(self._days) - self.max_days)]:
+                del self._days[day]
+
+sla_cache = SlaDayCache()
+
+def _stats(hours: np.ndarray) -> Dict:
+    if hours.size == 0:
+        return {"count": 0, **{f"p{p}_hours": None for p in SLA_PERCENTILES}}
+    values = np.percentile(hours, SLA_PERCENTILES)
+    return {"count": int(hours.size), **{f"p{p}_hours": round(float(v), 2) for p, v in zip(SLA_PERCENTILES, values)}}
+
+def _metric_report(durations: Durations) -> Dict:
+    completed_days, hours, codes = durations
+    # 1970-01-01 was a Thursday; shift so weeks start on Monday
+    weeks = completed_days - ((completed_days.astype(np.int64) + 3) % 7).astype("timedelta64[D]")
+    counts, _ = np.histogram(hours, bins=HISTOGRAM_EDGES_HOURS)
+    return {
+        "overall": _stats(hours),
+        "by_severity": {severity: _stats(hours[codes == code]) for severity, code in _SEVERITY_CODES.items()},
+        "by_week": [
+            {"week_start": week.item(), **_stats(hours[weeks == week])} for week in np.unique(weeks)
+        ],
+        "histogram": [
+            {"min_hours": float(low), "max_hours": None if np.isinf(high) else float(high), "count": int(count)}
+            for low, high, count in zip(HISTOGRAM_EDGES_HOURS[:-1], HISTOGRAM_EDGES_HOURS[1:], counts)
+        ],
+    }
+
+def sla_report(db: Session, start: date, end: date, today: Optional[date] = None) -> Dict:
+    """
+    Computes time-to-triage and time-to-done percentiles and histograms, overall, per severity
+    and per week of completion, for issues triaged or resolved between `start` and `end`.
+    """
+    today = today or datetime.utcnow().date()
+    durations = sla_cache.get_range(db, start, min(end, today), today)
+    return {"start": start, "end": end, **{metric: _metric_report(durations[metric]) for metric in SLA_METRICS}}
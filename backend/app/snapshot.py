@@ -0,0 +1,278 @@
+# backend/app/snapshot.py
+
+import os
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from . import crud, models
+from .indexing import IssueIndex
+
+load_dotenv()
+
+# Keep a columnar copy of issue metadata in every worker to answer dashboard slices.
+# When disabled, each slice loads the matching rows from the database instead.
+ISSUE_SNAPSHOT_ENABLED = os.getenv("ISSUE_SNAPSHOT_ENABLED", "true").lower() == "true"
+
+# Rows appended per step when loading issues in ID order
+SNAPSHOT_CHUNK_SIZE = 10000
+
+# Snapshot column dtypes. Timestamps are seconds since the epoch (UTC).
+COLUMNS = {
+    "id": np.int32,
+    "owner_id": np.int32,
+    "status": np.int8,
+    "severity": np.int8,
+    "created": np.int64,
+    "updated": np.int64,
+}
+
+# Bytes each issue takes in the snapshot, including its live flag
+BYTES_PER_ISSUE = sum(np.dtype(dtype).itemsize for dtype in COLUMNS.values()) + 1
+
+_STATUSES = list(models.IssueStatus)
+_SEVERITIES = list(models.IssueSeverity)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(_SEVERITIES)}
+_EPOCH = datetime(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+
+def _epoch_seconds(value: datetime) -> int:
+    return int((value - _EPOCH).total_seconds())
+
+def _day_start(day: date) -> int:
+    return (day - _EPOCH.date()).days * _SECONDS_PER_DAY
+
+class IssueColumnSnapshot(IssueIndex):
+    """
+    In-memory columnar copy of issue metadata (no text) for ad-hoc group-by/filter queries.
+    Each column is a NumPy array with rows sorted by issue ID, so lookups are binary searches.
+    Deleted rows are flagged dead and compacted away once they make up a quarter of the rows.
+    """
+    name = "issue snapshot"
+    row_columns = ("id", "owner_id", "status", "severity", "created_at", "updated_at")
+
+    def _reset(self):
+        self._columns: Dict[str, np.ndarray] = {name: np.empty(0, dtype) for name, dtype in COLUMNS.items()}
+        self._live = np.empty(0, dtype=bool)
+        self._size = 0 # Rows in use, dead ones included
+        self._dead = 0
+
+    def __len__(self):
+        return self._size - self._dead
+
+    def _indexed_ids(self):
+        return set(self._columns["id"][:self._size][self._live[:self._size]].tolist())
+
+    def memory_bytes(self) -> int:
+        """
+        Bytes allocated for the columns, including room reserved for growth.
+        """
+        return sum(column.nbytes for column in self._columns.values()) + self._live.nbytes
+
+    def _arrays(self) -> List[np.ndarray]:
+        return [*self._columns.values(), self._live]
+
+    def _position(self, issue_id: int) -> Tuple[int, bool]:
+        """
+        Returns where the issue's row is, or would be inserted, and whether it is there.
+        """
+        ids = self._columns["id"][:self._size]
+        position = int(np.searchsorted(ids, issue_id))
+        return position, position < self._size and ids[position] == issue_id
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= len(self._live):
+            return
+        capacity = max(needed, 2 * len(self._live), 1024)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+        live = np.zeros(capacity, dtype=bool)
+        live[:self._size] = self._live[:self._size]
+        self._live = live
+
+    @staticmethod
+    def _values(row) -> Dict[str, int]:
+        return {
+            "id": row.id,
+            "owner_id": row.owner_id,
+            "status": _STATUS_CODES[row.status],
+            "severity": _SEVERITY_CODES[row.severity],
+            "created": _epoch_seconds(row.created_at),
+            "updated": _epoch_seconds(row.updated_at),
+        }
+
+    def _index_row(self, row):
+        self._put(self._values(row))
+
+    def _put(self, values: Dict[str, int]):
+        position, found = self._position(values["id"])
+        if not found:
+            self._reserve(1)
+            for array in self._arrays():
+                # Shifts later rows up by one; a no-op when appending
+                array[position + 1:self._size + 1] = array[position:self._size]
+            self._size += 1
+        elif not self._live[position]:
+            self._dead -= 1
+        for name, value in values.items():
+            self._columns[name][position] = value
+        self._live[position] = True
+
+    def _index_rows(self, rows: Iterable):
+        # Builds stream rows in ID order, so whole chunks can usually be appended at once
+        rows = iter(rows)
+        while True:
+            chunk = [self._values(row) for row in islice(rows, SNAPSHOT_CHUNK_SIZE)]
+            if not chunk:
+                return
+            ids = np.fromiter((values["id"] for values in chunk), dtype=np.int64, count=len(chunk))
+            appendable = (self._size == 0 or ids[0] > self._columns["id"][self._size - 1]) and bool(np.all(np.diff(ids) > 0))
+            if not appendable:
+                for values in chunk:
+                    self._put(values)
+                continue
+            self._reserve(len(chunk))
+            end = self._size + len(chunk)
+            for name, column in self._columns.items():
+                column[self._size:end] = np.fromiter((values[name] for values in chunk), dtype=column.dtype, count=len(chunk))
+            self._live[self._size:end] = True
+            self._size = end
+
+    def _remove(self, issue_id: int):
+        position, found = self._position(issue_id)
+        if not found or not self._live[position]:
+            return
+        self._live[position] = False
+        self._dead += 1
+        if self._dead * 4 > self._size:
+            self._compact()
+
+    def _compact(self):
+        keep = self._live[:self._size].copy()
+        kept = int(keep.sum())
+        for array in self._arrays():
+            array[:kept] = array[:self._size][keep]
+        self._live[kept:self._size] = False
+        self._size, self._dead = kept, 0
+
+    def aggregate(self, group_by: Sequence[models.IssueSliceDimension],
+                  statuses: Optional[Sequence[models.IssueStatus]] = None,
+                  severities: Optional[Sequence[models.IssueSeverity]] = None,
+                  owner_id: Optional[int] = None,
+                  created_from: Optional[date] = None, created_to: Optional[date] = None) -> List[Dict]:
+        """
+        Counts issues matching the filters per distinct combination of the `group_by` dimensions,
+        ordered by those dimensions. Creation dates are inclusive.
+        """
+        with self._lock:
+            columns = {name: column[:self._size] for name, column in self._columns.items()}
+            mask = self._live[:self._size].copy()
+            if statuses:
+                mask &= np.isin(columns["status"], [_STATUS_CODES[status] for status in statuses])
+            if severities:
+                mask &= np.isin(columns["severity"], [_SEVERITY_CODES[severity] for severity in severities])
+            if owner_id is not None:
+                mask &= columns["owner_id"] == owner_id
+            if created_from is not None:
+                mask &= columns["created"] >= _day_start(created_from)
+            if created_to is not None:
+                mask &= columns["created"] < _day_start(created_to + timedelta(days=1))
+            # Boolean indexing copies, so grouping can run without the lock
+            selected = {name: column[mask] for name, column in columns.items() if name in ("status", "severity", "owner_id", "created")}
+
+        if not group_by:
+            return [{"count": int(mask.sum())}]
+        if not mask.any():
+            return []
+        # Each dimension becomes a dense code; codes are combined into one int64 key per issue,
+        # so grouping is a single 1-D sort whose order follows the dimensions
+        values_by_dimension, combined = [], np.zeros(int(mask.sum()), dtype=np.int64)
+        for dimension in group_by:
+            if dimension == models.IssueSliceDimension.STATUS:
+                values, codes = _STATUSES, selected["status"]
+            elif dimension == models.IssueSliceDimension.SEVERITY:
+                values, codes = _SEVERITIES, selected["severity"]
+            else:
+                if dimension == models.IssueSliceDimension.OWNER:
+                    keys = selected["owner_id"]
+                else:
+                    days = selected["created"] // _SECONDS_PER_DAY
+                    # 1970-01-01 was a Thursday; shift so weeks start on Monday
+                    keys = days - (days + 3) % 7
+                values, codes = np.unique(keys, return_inverse=True)
+                values = values.tolist()
+            values_by_dimension.append(values)
+            combined = combined * len(values) + codes
+        groups, counts = np.unique(combined, return_counts=True)
+        shape = [len(values) for values in values_by_dimension]
+        group_codes = np.unravel_index(groups, shape)
+
+        rows = [{"count": count} for count in counts.tolist()]
+        for dimension, values, codes in zip(group_by, values_by_dimension, group_codes):
+            field = _DIMENSION_FIELDS[dimension]
+            for row, code in zip(rows, codes.tolist()):
+                value = values[code]
+                row[field] = _EPOCH.date() + timedelta(days=value) if dimension == models.IssueSliceDimension.WEEK else value
+        return rows
+
+_DIMENSION_FIELDS = {
+    models.IssueSliceDimension.STATUS: "status",
+    models.IssueSliceDimension.SEVERITY: "severity",
+    models.IssueSliceDimension.OWNER: "owner_id",
+    models.IssueSliceDimension.WEEK: "week_start",
+}
+
+issue_snapshot = IssueColumnSnapshot()
+issue_snapshot.enabled = ISSUE_SNAPSHOT_ENABLED
+crud.issue_write_hooks.append(issue_snapshot.on_issue_write)
+
+def slice_issues(db: Session, group_by: Sequence[models.IssueSliceDimension],
+                 statuses: Optional[Sequence[models.IssueStatus]] = None,
+                 severities: Optional[Sequence[models.IssueSeverity]] = None,
+                 owner_id: Optional[int] = None,
+                 created_from: Optional[date] = None, created_to: Optional[date] = None) -> Dict:
+    """
+    Counts issues per group, from this worker's snapshot when enabled. Otherwise the filtered
+    rows are read from the database into a throwaway snapshot and aggregated the same way.
+    """
+    filters = dict(statuses=statuses, severities=severities, owner_id=owner_id, created_from=created_from, created_to=created_to)
+    if issue_snapshot.enabled:
+        snapshot, source = issue_snapshot, "snapshot"
+    else:
+        issue = models.Issue
+        query = db.query(*(getattr(issue, column) for column in IssueColumnSnapshot.row_columns))
+        if statuses:
+            query = query.filter(issue.status.in_(statuses))
+        if severities:
+            query = query.filter(issue.severity.in_(severities))
+        if owner_id is not None:
+            query = query.filter(issue.owner_id == owner_id)
+        if created_from is not None:
+            query = query.filter(issue.created_at >= datetime.combine(created_from, datetime.min.time()))
+        if created_to is not None:
+            query = query.filter(issue.created_at < datetime.combine(created_to + timedelta(days=1), datetime.min.time()))
+        snapshot, source = IssueColumnSnapshot(), "database"
+        snapshot._index_rows(query.order_by(issue.id).yield_per(SNAPSHOT_CHUNK_SIZE))
+
+    rows = snapshot.aggregate(group_by, **filters)
+    return {"group_by": list(group_by), "total": sum(row["count"] for row in rows), "source": source, "rows": rows}
+
+def snapshot_status() -> Dict:
+    """
+    Reports the size of this worker's snapshot and what a million issues cost in it.
+    """
+    return {
+        "enabled": issue_snapshot.enabled,
+        "issue_count": len(issue_snapshot),
+        "memory_bytes": issue_snapshot.memory_bytes(),
+        "bytes_per_million_issues": BYTES_PER_ISSUE * 1_000_000,
+        "indexed_at": issue_snapshot.indexed_at,
+    }
@@ -0,0 +1,346 @@
+# backend/app/stats.py
+"""
+Maintains the daily_stats table and the normalized issue_stats counts with their rollups.
+
+    python -m app.stats refresh
+    python -m app.stats backfill [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+
+import argparse
+import logging
+import os
+import zlib
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import func, insert, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal
+from .logging_config import configure_logging
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Changes are re-read this far behind the watermark, so writes committed late (a transaction
+# open across a refresh, clock skew between app servers) are still counted. Re-reading a
+# change is harmless: it is compared against the status already counted for that issue.
+STATS_WATERMARK_OVERLAP_SECONDS = int(os.getenv("STATS_WATERMARK_OVERLAP_SECONDS", "300"))
+
+# Transaction-level advisory lock serializing refreshes on Postgres
+STATS_LOCK_KEY = zlib.crc32(b"daily_stats")
+
+# Issue ids looked up per query when comparing changes with the snapshot
+_LOOKUP_CHUNK = 500
+
+# Issue counts keyed by (status, severity)
+Counts = Dict[Tuple[models.IssueStatus, models.IssueSeverity], int]
+
+# Periods that issue_stats is rolled up into besides days
+ROLLUP_GRANULARITIES = (models.StatsGranularity.WEEK, models.StatsGranularity.MONTH)
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+def period_start(day: date, granularity: models.StatsGranularity) -> date:
+    """
+    Returns the first day of the period containing `day`. Weeks start on Monday.
+    """
+    if granularity == models.StatsGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == models.StatsGranularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+def count_periods(start: date, end: date, granularity: models.StatsGranularity) -> int:
+    """
+    Returns how many periods of `granularity` overlap [start, end].
+    """
+    first = period_start(start, granularity)
+    if granularity == models.StatsGranularity.WEEK:
+        return (end - first).days // 7 + 1
+    if granularity == models.StatsGranularity.MONTH:
+        return (end.year - first.year) * 12 + end.month - first.month + 1
+    return (end - first).days + 1
+
+def _period_end(start: date, granularity: models.StatsGranularity) -> date:
+    if granularity == models.StatsGranularity.WEEK:
+        return start + timedelta(days=6)
+    if granularity == models.StatsGranularity.MONTH:
+        return (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start
+
+def _status_totals(counts: Counts) -> Dict[str, int]:
+    totals = {status.value: 0 for status in models.IssueStatus}
+    for (status, _), count in counts.items():
+        totals[status.value] += count
+    return totals
+
+def _upsert(db: Session, model, rows: List[Dict], key: str):
+    """
+    Inserts rows, updating the existing row on a conflict on `key`.
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        statement = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(model).values(rows)
+        updated = {name: statement.excluded[name] for name in rows[0] if name != key}
+        db.execute(statement.on_conflict_do_update(index_elements=[key], set_=updated))
+        return
+    for row in rows:
+        existing = db.query(model).filter(getattr(model, key) == row[key]).first()
+        if existing is None:
+            db.add(model(**row))
+        else:
+            for name, value in row.items():
+                setattr(existing, name, value)
+    db.flush()
+
+def _roll_up(db: Session, day: date):
+    """
+    Recomputes the week and month rows containing `day`. Counts are end-of-period values:
+    each period repeats the counts of its latest day that has stats.
+    """
+    stats = models.IssueStats
+    for granularity in ROLLUP_GRANULARITIES:
+        start = period_start(day, granularity)
+        latest_day = db.query(func.max(models.DailyStats.date)).filter(
+            models.DailyStats.date >= _day_start(start),
+            models.DailyStats.date <= _day_start(_period_end(start, granularity)),
+        ).scalar()
+        db.query(stats).filter(stats.granularity == granularity, stats.period_start == start).delete(synchronize_session=False)
+        if latest_day is None:
+            continue
+        db.execute(insert(stats).from_select(
+            ["granularity", "period_start", "status", "severity", "count"],
+            select(literal(granularity, stats.granularity.type), literal(start, stats.period_start.type), stats.status, stats.severity, stats.count).filter(
+                stats.granularity == models.StatsGranularity.DAY, stats.period_start == latest_day.date()
+            ),
+        ))
+
+def _write_day(db: Session, day: date, counts: Counts, computed_through: Optional[datetime]):
+    """
+    Replaces the stored counts of a day, in daily_stats and issue_stats, and its rollups.
+    """
+    _upsert(db, models.DailyStats, [
+        {"date": _day_start(day), "issue_counts_by_status": _status_totals(counts), "computed_through": computed_through}
+    ], key="date")
+    stats = models.IssueStats
+    db.query(stats).filter(stats.granularity == models.StatsGranularity.DAY, stats.period_start == day).delete(
+        synchronize_session=False
+    )
+    rows = [
+        {"granularity": models.StatsGranularity.DAY, "period_start": day, "status": status, "severity": severity, "count": count}
+        for (status, severity), count in sorted(counts.items()) if count
+    ]
+    if rows:
+        db.execute(insert(stats), rows)
+    _roll_up(db, day)
+
+def _load_day_counts(db: Session, day: date) -> Counts:
+    stats = models.IssueStats
+    return Counter({
+        (status, severity): count for status, severity, count in db.query(stats.status, stats.severity, stats.count).filter(
+            stats.granularity == models.StatsGranularity.DAY, stats.period_start == day, stats.severity.isnot(None)
+        )
+    })
+
+def _lock(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": STATS_LOCK_KEY})
+
+def _rebuild_snapshot(db: Session) -> Counts:
+    """
+    Replaces the per-issue snapshot with the current statuses and severities and returns their counts.
+    """
+    snapshot = models.IssueStatusSnapshot
+    db.query(snapshot).delete(synchronize_session=False)
+    db.execute(insert(snapshot).from_select(
+        ["issue_id", "status", "severity"], select(models.Issue.id, models.Issue.status, models.Issue.severity)
+    ))
+    return Counter({
+        (status, severity): count
+        for status, severity, count in db.query(snapshot.status, snapshot.severity, func.count()).group_by(snapshot.status, snapshot.severity)
+    })
+
+def _apply_changes(db: Session, counts: Counts, since: datetime, until: datetime) -> int:
+    """
+    Moves issues whose status or severity changed in [since, until) between counts and records
+    their new values in the snapshot. Returns how many issues changed.
+    """
+    changed = db.query(models.Issue.id, models.Issue.status, models.Issue.severity).filter(
+        models.Issue.updated_at >= since, models.Issue.updated_at < until
+    ).all()
+    snapshot = models.IssueStatusSnapshot
+    updates = []
+    for start in range(0, len(changed), _LOOKUP_CHUNK):
+        chunk = changed[start:start + _LOOKUP_CHUNK]
+        known = {
+            issue_id: (status, severity) for issue_id, status, severity in db.query(snapshot.issue_id, snapshot.status, snapshot.severity).filter(
+                snapshot.issue_id.in_([row.id for row in chunk])
+            )
+        }
+        for issue_id, status, severity in chunk:
+            previous = known.get(issue_id)
+            if previous == (status, severity):
+                continue
+            if previous is not None:
+                counts[previous] -= 1
+            counts[(status, severity)] += 1
+            updates.append({"issue_id": issue_id, "status": status, "severity": severity})
+    _upsert(db, snapshot, updates, key="issue_id")
+    return len(updates)
+
+def _apply_deletions(db: Session, counts: Counts, since: datetime, until: datetime) -> int:
+    """
+    Removes issues deleted in [since, until), going by their DELETED events, from counts and the
+    snapshot. Issues already removed, or whose ID belongs to an issue again, are left alone, so
+    re-reading an event is harmless. Returns how many were removed.
+    """
+    event = models.IssueEvent
+    deleted_ids = [issue_id for (issue_id,) in db.query(event.issue_id).filter(
+        event.event_type == models.IssueEventType.DELETED, event.at >= since, event.at < until
+    ).distinct()]
+    snapshot = models.IssueStatusSnapshot
+    removed = 0
+    for start in range(0, len(deleted_ids), _LOOKUP_CHUNK):
+        deleted = db.query(snapshot.issue_id, snapshot.status, snapshot.severity).outerjoin(
+            models.Issue, models.Issue.id == snapshot.issue_id
+        ).filter(snapshot.issue_id.in_(deleted_ids[start:start + _LOOKUP_CHUNK]), models.Issue.id.is_(None)).all()
+        for _, status, severity in deleted:
+            counts[(status, severity)] -= 1
+        db.query(snapshot).filter(snapshot.issue_id.in_([row.issue_id for row in deleted])).delete(synchronize_session=False)
+        removed += len(deleted)
+    return removed
+
+def refresh_daily_stats(db: Session, now: Optional[datetime] = None) -> models.DailyStats:
+    """
+    Brings the daily_stats rows up to date: today's row is upserted with the current counts, and
+    the last computed day plus any days skipped since are closed with their end-of-day counts.
+    Only issues changed since the previous refresh are read, so repeated runs are cheap.
+    """
+    now = now or datetime.utcnow()
+    today = now.date()
+    _lock(db)
+    latest = db.query(models.DailyStats).filter(models.DailyStats.computed_through.isnot(None)).order_by(
+        models.DailyStats.date.desc()
+    ).first()
+
+    if latest is None or latest.date.date() > today:
+        # No incremental state yet: count everything once
+        counts = _rebuild_snapshot(db)
+        _write_day(db, today, counts, now)
+        logger.info("Daily stats rebuilt from a full recount", extra={"date": str(today), "counts": _status_totals(counts)})
+    else:
+        counts = _load_day_counts(db, latest.date.date())
+        watermark = latest.computed_through
+        day = latest.date.date()
+        while day <= today:
+            # Changes are attributed to the day of their last update
+            until = min(_day_start(day + timedelta(days=1)), now)
+            since = watermark - timedelta(seconds=STATS_WATERMARK_OVERLAP_SECONDS)
+            # Deletions first: an ID reused by a new issue (SQLite) then counts as that issue
+            deleted = _apply_deletions(db, counts, since, until)
+            changed = _apply_changes(db, counts, since, until)
+            _write_day(db, day, counts, until)
+            logger.info("Daily stats refreshed", extra={"date": str(day), "changed": changed, "deleted": deleted})
+            watermark = until
+            day += timedelta(days=1)
+
+    db.commit()
+    return db.query(models.DailyStats).filter(models.DailyStats.date == _day_start(today)).one()
+
+def backfill_daily_stats(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """
+    Creates rows for days in [start, end] that have none, defaulting to the day of the first issue
+    through yesterday. Existing rows are left alone, so it is safe to run repeatedly.
+    Past statuses are not stored: issues last updated before the end of a day are counted with
+    their current status and severity, and issues updated later are counted as OPEN, the status
+    they were created with; deleted issues are not counted. Returns how many days were filled.
+    """
+    if start is None:
+        first_created = db.query(func.min(models.Issue.created_at)).scalar()
+        if first_created is None:
+            return 0
+        start = first_created.date()
+    end = end or (datetime.utcnow().date() - timedelta(days=1))
+
+    existing = {
+        row.date.date() for row in db.query(models.DailyStats.date).filter(
+            models.DailyStats.date >= _day_start(start), models.DailyStats.date <= _day_start(end)
+        )
+    }
+    filled = 0
+    day = start
+    while day <= end:
+        if day not in existing:
+            end_of_day = _day_start(day + timedelta(days=1))
+            counts: Counts = Counter()
+            for status, severity, count in db.query(models.Issue.status, models.Issue.severity, func.count()).filter(
+                models.Issue.updated_at < end_of_day
+            ).group_by(models.Issue.status, models.Issue.severity):
+                counts[(status, severity)] += count
+            for severity, count in db.query(models.Issue.severity, func.count()).filter(
+                models.Issue.created_at < end_of_day, models.Issue.updated_at >= end_of_day
+            ).group_by(models.Issue.severity):
+                counts[(models.IssueStatus.OPEN, severity)] += count
+            _write_day(db, day, counts, None)
+            filled += 1
+        day += timedelta(days=1)
+
+    db.commit()
+    logger.info("Daily stats backfilled", extra={"start": str(start), "end": str(end), "days_filled": filled})
+    return filled
+
+def get_stats_history(db: Session, start: date, end: date,
+                      granularity: models.StatsGranularity = models.StatsGranularity.DAY) -> List[Dict]:
+    """
+    Returns issue counts for each period of `granularity` overlapping [start, end], oldest first,
+    from one range scan of the issue_stats index.
+    """
+    stats = models.IssueStats
+    rows = db.query(stats.period_start, stats.status, stats.severity, stats.count).filter(
+        stats.granularity == granularity,
+        stats.period_start >= period_start(start, granularity),
+        stats.period_start <= end,
+    ).order_by(stats.period_start).all()
+
+    history: Dict[date, Dict] = {}
+    for day, status, severity, count in rows:
+        point = history.setdefault(day, {
+            "period_start": day,
+            "status_counts": {status: 0 for status in models.IssueStatus},
+            "severity_counts": {severity: 0 for severity in models.IssueSeverity},
+        })
+        point["status_counts"][status] += count
+        if severity is not None: # Days migrated from the JSON daily stats have no severity split
+            point["severity_counts"][severity] += count
+    return list(history.values())
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the daily issue stats tables.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("refresh", help="update today's row and close any days since the last refresh")
+    backfill = commands.add_parser("backfill", help="fill in days that have no row")
+    backfill.add_argument("--start", type=date.fromisoformat, help="first day (default: day of the first issue)")
+    backfill.add_argument("--end", type=date.fromisoformat, help="last day (default: yesterday)")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        if args.command == "refresh":
+            refresh_daily_stats(db)
+        else:
+            backfill_daily_stats(db, args.start, args.end)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
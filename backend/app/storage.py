@@ -0,0 +1,186 @@
+# backend/app/storage.py
+
+import glob
+import hashlib
+import os
+import re
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Iterator, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Root directory of the local attachment blob store
+ATTACHMENT_STORAGE_DIR = os.getenv("ATTACHMENT_STORAGE_DIR", "attachments")
+
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+class BlobWriter(ABC):
+    """
+    Receives a blob's contents in order, hashing them as they are written.
+    Nothing is visible in storage until commit() succeeds; abort() discards the partial blob.
+    """
+
+    @abstractmethod
+    def write(self, data: bytes):
+        ...
+
+    @abstractmethod
+    def commit(self) -> Tuple[str, int]:
+        """
+        Stores the blob under its SHA-256 and returns (hex digest, size in bytes).
+        If a blob with the same contents already exists, the new copy is discarded.
+        """
+
+    @abstractmethod
+    def abort(self):
+        ...
+
+class BlobStorage(ABC):
+    """
+    Content-addressed blob storage: blobs are immutable and keyed by the SHA-256 of their contents.
+    """
+
+    @abstractmethod
+    def writer(self) -> BlobWriter:
+        ...
+
+    @abstractmethod
+    def path(self, digest: str) -> str:
+        """
+        Returns the blob's local file path, so it can be served straight from disk.
+        """
+
+    @abstractmethod
+    def artifact_path(self, digest: str, name: str) -> str:
+        """
+        Returns the local file path of an artifact derived from the blob, e.g. its thumbnail.
+        Artifacts are deleted along with their blob.
+        """
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, digest: str):
+        ...
+
+    @abstractmethod
+    def delete_unless(self, digest: str, keep: Callable[[datetime], bool]) -> bool:
+        """
+        Deletes the blob unless keep(stored at) returns True. keep() runs once no commit of the
+        same contents can slip past it: a commit either refreshed the blob's stored-at time
+        before, or stores its own copy. Returns whether the blob was deleted.
+        """
+
+    @abstractmethod
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        """
+        Yields (digest, stored at) for every blob.
+        """
+
+class LocalFileWriter(BlobWriter):
+    def __init__(self, storage: "LocalBlobStorage"):
+        self.storage = storage
+        os.makedirs(storage.temp_dir, exist_ok=True)
+        self.temp_path = os.path.join(storage.temp_dir, uuid.uuid4().hex)
+        self._file = open(self.temp_path, "wb")
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes):
+        self._file.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def commit(self) -> Tuple[str, int]:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        digest = self._hash.hexdigest()
+        path = self.storage.path(digest)
+        try:
+            # Marks the blob as recently stored, so the orphan sweep leaves it alone until it is referenced
+            os.utime(path)
+        except FileNotFoundError:
+            # New contents, or a blob the orphan sweep just moved aside
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Atomic on the same filesystem, so readers never see a partial blob
+            os.replace(self.temp_path, path)
+        else:
+            os.remove(self.temp_path)
+        return digest, self.size
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+class LocalBlobStorage(BlobStorage):
+    """
+    Stores blobs as files under `root`, at ab/cd/<digest> to keep directories small, with their
+    artifacts next to them as <digest>.<name>. Uploads are written to root/tmp first, on the same filesystem, and renamed into place.
+    """
+
+    def __init__(self, root: str = ATTACHMENT_STORAGE_DIR):
+        self.root = root
+
+    @property
+    def temp_dir(self) -> str:
+        return os.path.join(self.root, "tmp")
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def artifact_path(self, digest: str, name: str) -> str:
+        return f"{self.path(digest)}.{name}"
+
+    def writer(self) -> LocalFileWriter:
+        return LocalFileWriter(self)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def delete(self, digest: str):
+        for path in [self.path(digest), *glob.glob(glob.escape(self.path(digest)) + ".*")]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def delete_unless(self, digest: str, keep: Callable[[datetime], bool]) -> bool:
+        path = self.path(digest)
+        os.makedirs(self.temp_dir, exist_ok=True)
+        # Moved out of the way first: a commit of the same contents from now on stores a new copy
+        aside = os.path.join(self.temp_dir, f"{digest}.{uuid.uuid4().hex}.pruning")
+        try:
+            os.replace(path, aside)
+        except FileNotFoundError:
+            return False
+        if keep(datetime.utcfromtimestamp(os.path.getmtime(aside))):
+            # Any copy stored meanwhile has the same contents
+            os.replace(aside, path)
+            return False
+        os.remove(aside)
+        if not os.path.exists(path):
+            for artifact in glob.glob(glob.escape(path) + ".*"):
+                try:
+                    os.remove(artifact)
+                except FileNotFoundError:
+                    pass
+        return True
+
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        for directory, subdirectories, files in os.walk(self.root):
+            if directory == self.root and "tmp" in subdirectories:
+                subdirectories.remove("tmp")
+            for name in files:
+                if not _DIGEST.fullmatch(name):
+                    continue # Artifacts and partial writes
+                yield name, datetime.utcfromtimestamp(os.path.getmtime(os.path.join(directory, name)))
+
+blob_storage = LocalBlobStorage()
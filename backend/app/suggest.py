@@ -0,0 +1,184 @@
+# backend/app/suggest.py
+
+import bisect
+import heapq
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import DDL, event, func
+from sqlalchemy.orm import Session
+
+from . import crud, models
+from .indexing import IssueIndex
+
+# Hard cap on suggestions per request
+MAX_SUGGESTIONS = 20
+
+# Titles merely containing a prefix that the in-memory index ranks per request. Titles starting
+# with it are always found in order; past this many other matches, only a subset is ranked.
+MAX_RANKED_CANDIDATES = 1000
+
+# --- Postgres trigram index ---
+
+POSTGRES_SUGGEST_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_issues_title_trgm ON issues USING GIN (title gin_trgm_ops)",
+    # Trigrams cannot serve prefixes under 3 characters; these match title starts from this index
+    "CREATE INDEX IF NOT EXISTS ix_issues_title_lower_pattern ON issues (lower(title) text_pattern_ops)",
+]
+
+# Prefixes shorter than this only match the start of titles
+MIN_TRIGRAM_PREFIX = 3
+
+for statement in POSTGRES_SUGGEST_DDL:
+    event.listen(models.Issue.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+# --- Portable in-memory index ---
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _discard(postings: Dict, key, issue_id: int):
+    posting = postings.get(key)
+    if posting is not None:
+        posting.discard(issue_id)
+        if not posting:
+            del postings[key]
+
+class TitleSuggestIndex(IssueIndex):
+    """
+    In-memory trigram index over issue titles for as-you-type suggestions.
+    Used where the database has no trigram index (SQLite locally and in tests).
+    """
+    name = "title suggest index"
+
+    def _reset(self):
+        self._titles: Dict[int, Tuple[int, str, str]] = {} # issue_id -> (owner_id, title, lowercased title)
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        # (lowercased title, -issue_id), sorted: titles starting with a prefix are a contiguous run,
+        # in the order Postgres reads them from ix_issues_title_lower_pattern
+        self._sorted: List[Tuple[str, int]] = []
+        # Per-owner postings let scoped lookups intersect instead of filtering matches
+        self._by_owner: Dict[int, Set[int]] = defaultdict(set)
+
+    def _indexed_ids(self) -> Set[int]:
+        return set(self._titles)
+
+    def _index_row(self, row):
+        self._remove(row.id)
+        lowered = row.title.lower()
+        self._titles[row.id] = (row.owner_id, row.title, lowered)
+        for key in _trigrams(lowered):
+            self._postings[key].add(row.id)
+        bisect.insort(self._sorted, (lowered, -row.id))
+        self._by_owner[row.owner_id].add(row.id)
+
+    def _remove(self, issue_id: int):
+        entry = self._titles.pop(issue_id, None)
+        if entry is None:
+            return
+        owner_id, _, lowered = entry
+        for key in _trigrams(lowered):
+            _discard(self._postings, key, issue_id)
+        del self._sorted[bisect.bisect_left(self._sorted, (lowered, -issue_id))]
+        _discard(self._by_owner, owner_id, issue_id)
+
+    def suggest(self, prefix: str, owner_id: Optional[int] = None, limit: int = 10) -> List[Dict]:
+        """
+        Returns titles starting with `prefix`, in the same order as Postgres does for short
+        prefixes; then, for prefixes of MIN_TRIGRAM_PREFIX or more characters, titles with a word
+        starting with it, then other titles containing it, shorter and newer titles first.
+        """
+        query = prefix.lower().strip()
+        if not query:
+            return []
+        with self._lock:
+            starts = self._title_starts(query, owner_id, limit)
+            if len(starts) == limit or len(query) < MIN_TRIGRAM_PREFIX:
+                return [{"id": issue_id, "title": self._titles[issue_id][1]} for issue_id in starts]
+            titles = [(issue_id, self._titles[issue_id]) for issue_id in starts]
+            taken = set(starts)
+            candidates = (issue_id for issue_id in self._containing(query, owner_id) if issue_id not in taken)
+            others = [(issue_id, self._titles[issue_id]) for issue_id in islice(candidates, MAX_RANKED_CANDIDATES)]
+
+        # Ranked outside the lock so writes are not held up behind a common prefix
+        best = heapq.nsmallest(limit - len(titles), self._ranked(query, others))
+        return [{"id": issue_id, "title": title} for issue_id, (_, title, _) in titles] + [
+            {"id": -negated_id, "title": title} for _, _, negated_id, title in best
+        ]
+
+    def _title_starts(self, query: str, owner_id: Optional[int], limit: int) -> List[int]:
+        start = bisect.bisect_left(self._sorted, (query,))
+        end = bisect.bisect_left(self._sorted, (query + "\U0010ffff",), lo=start)
+        owned = self._by_owner.get(owner_id, set()) if owner_id is not None else None
+        if owned is not None and len(owned) < end - start:
+            # Fewer issues of this owner than matching titles: sort the owner's matches instead
+            matches = [(self._titles[issue_id][2], -issue_id) for issue_id in owned]
+            matches = heapq.nsmallest(limit, (match for match in matches if match[0].startswith(query)))
+            return [-negated_id for _, negated_id in matches]
+        matches = []
+        for position in range(start, end):
+            issue_id = -self._sorted[position][1]
+            if owned is None or issue_id in owned:
+                matches.append(issue_id)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def _containing(self, query: str, owner_id: Optional[int]) -> Set[int]:
+        postings = [self._postings.get(key, set()) for key in _trigrams(query)]
+        if owner_id is not None:
+            postings.append(self._by_owner.get(owner_id, set()))
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:]) if len(postings) > 1 else postings[0]
+
+    @staticmethod
+    def _ranked(query: str, candidates: List[Tuple[int, Tuple[int, str, str]]]) -> Iterator[Tuple[int, int, int, str]]:
+        for issue_id, (_, title, lowered) in candidates:
+            position = lowered.find(query)
+            if position < 0:
+                continue
+            # Titles starting with the query were taken in order already
+            rank = 1 if lowered[position - 1] == " " else 2
+            yield rank, len(title), -issue_id, title
+
+title_suggest_index = TitleSuggestIndex()
+crud.issue_write_hooks.append(title_suggest_index.on_issue_write)
+
+def uses_database_index(db: Session) -> bool:
+    """
+    Whether suggestions for this session's database come from pg_trgm rather than the in-memory index.
+    """
+    return db.get_bind().dialect.name == "postgresql"
+
+def suggest_titles(db: Session, prefix: str, owner_id: Optional[int] = None, limit: int = 10) -> List[Dict]:
+    """
+    Suggests issue titles containing `prefix`, capped at MAX_SUGGESTIONS. Prefixes shorter than
+    MIN_TRIGRAM_PREFIX only match titles starting with them, on every database.
+    Restricts suggestions to a single owner when `owner_id` is given.
+    """
+    limit = min(limit, MAX_SUGGESTIONS)
+    if not uses_database_index(db):
+        return title_suggest_index.suggest(prefix, owner_id=owner_id, limit=limit)
+
+    rows = _database_suggest_query(db, prefix, owner_id, limit).all()
+    return [{"id": row.id, "title": row.title} for row in rows]
+
+def _database_suggest_query(db: Session, prefix: str, owner_id: Optional[int], limit: int):
+    query = db.query(models.Issue.id, models.Issue.title)
+    if owner_id is not None:
+        query = query.filter(models.Issue.owner_id == owner_id)
+    if len(prefix) < MIN_TRIGRAM_PREFIX:
+        # A 1-2 character substring match would scan and sort every title containing it. Anchored
+        # to the start and ordered like ix_issues_title_lower_pattern, the index serves both.
+        lowered_title = func.lower(models.Issue.title)
+        return query.filter(lowered_title.like(f"{_escape_like(prefix.lower())}%", escape="\\")).order_by(
+            lowered_title, models.Issue.id.desc()
+        ).limit(limit)
+    return query.filter(models.Issue.title.ilike(f"%{_escape_like(prefix)}%", escape="\\")).order_by(
+        func.similarity(models.Issue.title, prefix).desc(), models.Issue.id.desc()
+    ).limit(limit)
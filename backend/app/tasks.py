@@ -1,9 +1,17 @@
 # backend/app/tasks.py
 
-from datetime import datetime
+from datetime import date
 from sqlalchemy.orm import Session
 from .database import SessionLocal # Import SessionLocal to get a new session for the task
-from . import crud
+from .stats import backfill_daily_stats, refresh_daily_stats
+from .dedup import duplicate_index
+from .suggest import title_suggest_index
+from .snapshot import issue_snapshot
+from .job_queue import job_handlers
+from .attachments import prune_orphan_blobs
+from .idempotency import idempotency_store
+from .leader import scheduler_lease
+from .job_runner import ensure_within_timeout
 import logging
 
 # Configure logging for tasks
@@ -12,33 +20,80 @@ logger = logging.getLogger(__name__)
 
 def aggregate_daily_issue_stats():
     """
-    Aggregates issue counts by status and saves them to the daily_stats table.
-    This function runs as a background task.
+    Upserts today's issue counts by status into the daily_stats table, counting only issues
+    changed since the previous run.
+    This function runs as a background task; errors are logged and re-raised for the job runner.
     """
     logger.info("Starting daily issue stats aggregation task...")
     db: Session = SessionLocal() # Get a new database session for the task
     try:
-        # Get today's date (or yesterday's if running late at night for previous day's stats)
-        today = datetime.utcnow().date()
+        daily_stats = refresh_daily_stats(db)
+        logger.info(f"Successfully aggregated and saved daily stats for {daily_stats.date.date()}: {daily_stats.issue_counts_by_status}")
 
-        # Check if stats for today already exist to prevent duplicates
-        existing_stats = crud.get_daily_stats_by_date(db, today)
-        if existing_stats:
-            logger.info(f"Daily stats for {today} already exist. Skipping aggregation.")
-            return
+    except Exception as e:
+        logger.error(f"Error during daily issue stats aggregation: {e}", exc_info=True)
+        raise
+    finally:
+        db.close() # Ensure the session is closed
 
-        # Get current issue counts by status
-        issue_counts = crud.get_issue_status_counts(db)
 
-        # Convert Enum keys to string values for JSON storage
-        stringified_counts = {status.value: count for status, count in issue_counts.items()}
+def _ensure_leader_within_timeout():
+    scheduler_lease.ensure_leader()
+    ensure_within_timeout()
 
-        # Save to DailyStats table
-        crud.create_daily_stats(db, today, stringified_counts)
-        logger.info(f"Successfully aggregated and saved daily stats for {today}: {stringified_counts}")
+def prune_attachment_blobs():
+    """
+    Deletes attachment blobs that no attachment refers to anymore, stopping if this worker
+    loses the scheduler lease or the job exceeds its timeout meanwhile.
+    This function runs as a background task; errors are logged and re-raised for the job runner.
+    """
+    db: Session = SessionLocal()
+    try:
+        prune_orphan_blobs(db, check=_ensure_leader_within_timeout)
+    except Exception as e:
+        logger.error(f"Error pruning attachment blobs: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
 
+def purge_idempotency_keys():
+    """
+    Deletes stored Idempotency-Key responses past their TTL.
+    This function runs as a background task; errors are logged and re-raised for the job runner.
+    """
+    db: Session = SessionLocal()
+    try:
+        purged = idempotency_store.purge_expired(db)
+        logger.info(f"Purged {purged} expired idempotency keys")
     except Exception as e:
-        logger.error(f"Error during daily issue stats aggregation: {e}", exc_info=True)
+        logger.error(f"Error purging idempotency keys: {e}", exc_info=True)
+        raise
     finally:
-        db.close() # Ensure the session is closed
+        db.close()
+
+def refresh_issue_indexes():
+    """
+    Brings this worker's in-memory issue indexes up to date with writes made by other workers.
+    This function runs as a background task; errors are logged and re-raised for the job runner.
+    """
+    db: Session = SessionLocal()
+    try:
+        for index in (duplicate_index, title_suggest_index, issue_snapshot):
+            index.catch_up(db)
+    except Exception as e:
+        logger.error(f"Error refreshing in-memory issue indexes: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+def _run_queued_daily_stats(db: Session, payload: dict):
+    refresh_daily_stats(db)
+
+def _run_queued_daily_stats_backfill(db: Session, payload: dict):
+    start, end = payload.get("start"), payload.get("end")
+    backfill_daily_stats(db, date.fromisoformat(start) if start else None, date.fromisoformat(end) if end else None)
 
+# Lets the stats aggregation run on queue workers as well as on the scheduler leader
+job_handlers["daily_stats"] = _run_queued_daily_stats
+job_handlers["daily_stats_backfill"] = _run_queued_daily_stats_backfill
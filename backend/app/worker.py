@@ -0,0 +1,69 @@
+# backend/app/worker.py
+"""
+Runs background queue workers outside the web processes:
+
+    python -m app.worker --concurrency 4
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+
+from dotenv import load_dotenv
+
+from .logging_config import configure_logging
+from .database import SessionLocal
+from .job_queue import JOB_LOCK_TIMEOUT_SECONDS, QueueWorker, job_handlers, requeue_stale_jobs
+# Importing these modules registers their job handlers
+from . import attachment_processing, exports, tasks  # noqa: F401
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Worker threads per process when --concurrency is not given
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "2"))
+
+def recover_stale_jobs():
+    db = SessionLocal()
+    try:
+        requeue_stale_jobs(db)
+    except Exception as e:
+        logger.error(f"Could not recover stale queued jobs: {e}", exc_info=True)
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job queue workers.")
+    parser.add_argument("--concurrency", type=int, default=JOB_WORKER_CONCURRENCY,
+                        help="number of jobs this process runs at the same time")
+    args = parser.parse_args()
+
+    configure_logging()
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    process_id = f"{socket.gethostname()}:{os.getpid()}"
+    threads = [
+        threading.Thread(target=QueueWorker(f"{process_id}:{n}").run, args=(stop,), name=f"queue-worker-{n}")
+        for n in range(max(1, args.concurrency))
+    ]
+    logger.info("Starting queue workers", extra={"concurrency": len(threads), "job_kinds": sorted(job_handlers)})
+    for thread in threads:
+        thread.start()
+
+    # The main thread recovers jobs left RUNNING by workers that died
+    while not stop.is_set():
+        recover_stale_jobs()
+        stop.wait(max(1, JOB_LOCK_TIMEOUT_SECONDS // 4))
+
+    logger.info("Stopping queue workers; waiting for running jobs to finish")
+    for thread in threads:
+        thread.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# backend/benchmarks/bench_attachment_download.py
+"""
+Benchmark for attachment downloads.
+
+Stores a few large attachments (100 MB by default) in a throwaway database and
+blob directory, starts the API under uvicorn in a separate process, and downloads
+them concurrently, full and as 1 MB ranges. Reports aggregate throughput,
+per-download latency and the server's peak resident memory, which should stay
+flat regardless of file size.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_attachment_download.py --size-mb 100 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from common import summarize
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models, schemas
+from app.auth import create_access_token
+from app.database import Base
+from app.storage import LocalBlobStorage
+
+
+def seed_attachments(database_url: str, storage_root: str, files: int, size: int):
+    """
+    Creates an admin, one issue and `files` attachments of `size` random bytes each.
+    Returns (token, [download path, ...]).
+    """
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    storage = LocalBlobStorage(storage_root)
+    try:
+        admin = crud.create_user(db, schemas.UserCreate(email="bench-admin@example.com", password="password", role=models.UserRole.ADMIN))
+        issue = crud.create_issue(db, schemas.IssueCreate(title="Large logs", severity="LOW"), owner_id=admin.id)
+        paths = []
+        for n in range(files):
+            writer = storage.writer()
+            block = os.urandom(1024 * 1024)
+            for _ in range(size // len(block)):
+                writer.write(block)
+            writer.write(n.to_bytes(4, "big")) # Distinct contents per file
+            digest, stored = writer.commit()
+            attachment = crud.create_attachment(db, issue.id, f"log-{n}.txt", "text/plain", stored, digest, admin.id)
+            paths.append(f"/api/v1/issues/{issue.id}/attachments/{attachment.id}/download")
+        return create_access_token({"sub": admin.email}), paths
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def peak_rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status_file:
+        for line in status_file:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+async def download(client: httpx.AsyncClient, path: str, headers: dict) -> int:
+    received = 0
+    async with client.stream("GET", path, headers=headers) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_raw():
+            received += len(chunk)
+    return received
+
+
+async def run_downloads(base_url: str, token: str, jobs, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=600, limits=httpx.Limits(max_connections=concurrency)) as client:
+        async def one(path, extra_headers):
+            async with semaphore:
+                started = time.perf_counter()
+                received = await download(client, path, {"Authorization": f"Bearer {token}", **extra_headers})
+                latencies.append((time.perf_counter() - started) * 1000)
+                return received
+
+        started = time.perf_counter()
+        total = sum(await asyncio.gather(*(one(path, extra_headers) for path, extra_headers in jobs)))
+        return total, time.perf_counter() - started, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--files", type=int, default=2)
+    parser.add_argument("--downloads", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        storage_root = os.path.join(tmp, "blobs")
+        size = args.size_mb * 1024 * 1024
+        token, paths = seed_attachments(database_url, storage_root, args.files, size)
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        env = {**os.environ, "DATABASE_URL": database_url, "ATTACHMENT_STORAGE_DIR": storage_root}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(f"{base_url}/api/docs", timeout=1)
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.2)
+            baseline_rss = peak_rss_mb(server.pid)
+
+            full_jobs = [(rng.choice(paths), {}) for _ in range(args.downloads)]
+            total, elapsed, latencies = asyncio.run(run_downloads(base_url, token, full_jobs, args.concurrency))
+            print(f"full downloads: {total / 1e6 / elapsed:,.0f} MB/s aggregate "
+                  f"({args.downloads} x {args.size_mb} MB, concurrency {args.concurrency})")
+            summarize("full download", latencies)
+
+            range_jobs = []
+            for _ in range(args.downloads * 20):
+                start = rng.randrange(0, size - 1024 * 1024)
+                range_jobs.append((rng.choice(paths), {"Range": f"bytes={start}-{start + 1024 * 1024 - 1}"}))
+            total, elapsed, latencies = asyncio.run(run_downloads(base_url, token, range_jobs, args.concurrency))
+            print(f"1 MB ranges: {total / 1e6 / elapsed:,.0f} MB/s aggregate ({len(range_jobs)} requests)")
+            summarize("range download", latencies)
+
+            print(f"server peak RSS: {peak_rss_mb(server.pid):,.0f} MB (after startup: {baseline_rss:,.0f} MB)")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# backend/benchmarks/bench_dashboard_summary.py
+"""
+Benchmark for the dashboard summary.
+
+Seeds a throwaway database and reports the summary's latency and number of
+statements, next to the separate status, severity and per-reporter GROUP BY
+queries it replaces. Also prints the query plan, which should read only
+ix_issues_owner_status_severity (an index-only scan on Postgres, a covering
+index scan on SQLite; run VACUUM ANALYZE after seeding on Postgres).
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_dashboard_summary.py --rows 1000000
+    PYTHONPATH=. python benchmarks/bench_dashboard_summary.py --rows 1000000 --database-url postgresql://...
+"""
+
+import argparse
+
+from common import benchmark_engine, seed, summarize, time_calls
+from sqlalchemy import event, func, text
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+
+
+def separate_queries(db):
+    issue = models.Issue
+    db.query(issue.status, func.count()).group_by(issue.status).all()
+    db.query(issue.severity, func.count()).group_by(issue.severity).all()
+    db.query(issue.owner_id, issue.status, func.count()).group_by(issue.owner_id, issue.status).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *_: statements.append(statement))
+        db = sessionmaker(bind=engine)()
+        try:
+            crud.get_issue_summary(db)
+            sql = statements[-1]
+            print(f"summary: {len(statements)} statement(s) per call")
+            explain = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+            for row in db.execute(text(explain + sql)):
+                print("  plan:", " ".join(str(value) for value in row))
+
+            summarize("summary (one query)", time_calls(lambda: crud.get_issue_summary(db), [()] * args.queries))
+            summarize("separate GROUP BYs (three queries)", time_calls(lambda: separate_queries(db), [()] * args.queries))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# backend/benchmarks/bench_dedup.py
+"""
+Benchmark for duplicate-issue detection.
+
+Seeds a throwaway database, builds the MinHash/LSH index and reports build time,
+snapshot save/load time and per-lookup latency.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_dedup.py --rows 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import benchmark_engine, seed, summarize, time_calls
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.dedup import DuplicateIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        db = sessionmaker(bind=engine)()
+        try:
+            index = DuplicateIndex()
+            started = time.perf_counter()
+            index.build(db)
+            print(f"build: {time.perf_counter() - started:.1f} s for {len(index):,} issues")
+
+            samples = db.query(models.Issue.title, models.Issue.description).limit(args.queries).all()
+        finally:
+            db.close()
+
+    summarize("lookup (title + description)", time_calls(index.find_duplicates, [(title, description) for title, description in samples]))
+    summarize("lookup (title only)", time_calls(index.find_duplicates, [(title,) for title, _ in samples]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.npz")
+        started = time.perf_counter()
+        index.save_snapshot(path)
+        print(f"snapshot save: {time.perf_counter() - started:.1f} s, {os.path.getsize(path) / 1e6:,.1f} MB")
+        started = time.perf_counter()
+        DuplicateIndex().load_snapshot(path)
+        print(f"snapshot load: {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# backend/benchmarks/bench_issue_cache.py
+"""
+Benchmark for the hot-issue cache behind crud.get_issue.
+
+Seeds a throwaway database, then reads issues the way GET /api/v1/issues/{id}
+does (a fresh session per request), with most reads going to a handful of hot
+issues and the rest spread over the table. Reports latency with the cache
+disabled and enabled, plus the cache's hit ratio.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_issue_cache.py --rows 100000 --reads 20000
+    PYTHONPATH=. python benchmarks/bench_issue_cache.py --database-url postgresql://...
+"""
+
+import argparse
+import random
+
+from common import benchmark_engine, seed, summarize, time_calls
+from sqlalchemy.orm import sessionmaker
+
+from app import crud
+from app.issue_cache import issue_cache
+
+
+def read_issue(Session, issue_id: int):
+    db = Session()
+    try:
+        issue = crud.get_issue(db, issue_id)
+        return issue.title, issue.status # What the response serializes
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--hot", type=int, default=10, help="Issues receiving most of the reads")
+    parser.add_argument("--hot-share", type=float, default=0.9, help="Share of reads going to hot issues")
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    hot = rng.sample(range(1, args.rows + 1), args.hot)
+    reads = [(rng.choice(hot) if rng.random() < args.hot_share else rng.randint(1, args.rows),) for _ in range(args.reads)]
+
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        Session = sessionmaker(bind=engine)
+
+        issue_cache.enabled = False
+        summarize("get_issue, no cache", time_calls(lambda issue_id: read_issue(Session, issue_id), reads))
+
+        issue_cache.enabled = True
+        issue_cache.clear()
+        summarize("get_issue, cache", time_calls(lambda issue_id: read_issue(Session, issue_id), reads))
+        status = issue_cache.status()
+        print(f"cache: hit ratio {status['hit_ratio']:.1%}, {status['entries']} rows, ~{status['approximate_bytes'] / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
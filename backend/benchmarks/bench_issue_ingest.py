@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_issue_ingest.py
+"""
+Benchmark for group-commit issue ingestion.
+
+Seeds a throwaway database, then has many concurrent reporters create issues
+the two ways POST /api/v1/issues/ can: one transaction per issue
+(crud.create_issue in its own session) or through the batcher, which writes
+everything submitted within a few milliseconds in one INSERT ... RETURNING
+and one commit. Reports throughput and per-issue latency for both.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_issue_ingest.py --issues 5000 --concurrency 64
+    PYTHONPATH=. python benchmarks/bench_issue_ingest.py --database-url postgresql://...
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common import OWNER_COUNT, benchmark_engine, seed, summarize
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, schemas
+from app.issue_ingest import IssueBatcher
+
+
+def create_per_request(Session, issue: schemas.IssueCreate, owner_id: int):
+    db = Session()
+    try:
+        crud.create_issue(db, issue, owner_id)
+    finally:
+        db.close()
+
+
+def run(label: str, create, issues, concurrency: int):
+    latencies = []
+
+    def timed(args):
+        started = time.perf_counter()
+        create(*args)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, issues))
+    elapsed = time.perf_counter() - started
+    print(f"{label}: {len(issues) / elapsed:,.0f} issues/s")
+    summarize(f"{label}", latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=5000, help="Issues created by each path")
+    parser.add_argument("--concurrency", type=int, default=64, help="Reporters submitting at once")
+    parser.add_argument("--flush-ms", type=float, default=5)
+    parser.add_argument("--max-batch", type=int, default=500)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    issues = [(schemas.IssueCreate(title=f"Alert {n}: disk usage above 90%", description="Raised by monitoring"), n % OWNER_COUNT + 1)
+              for n in range(args.issues)]
+
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, 0)
+        # One connection per reporter, so the pool is not what limits the per-request path.
+        # SQLite writers wait for the database lock rather than failing after the default 5 s.
+        connect_args = {"timeout": 120} if engine.dialect.name == "sqlite" else {}
+        app_engine = create_engine(engine.url, pool_size=args.concurrency, max_overflow=0, connect_args=connect_args)
+        Session = sessionmaker(bind=app_engine)
+
+        run("per-request commit", lambda issue, owner_id: create_per_request(Session, issue, owner_id), issues, args.concurrency)
+
+        batcher = IssueBatcher(session_factory=Session, max_batch=args.max_batch, flush_ms=args.flush_ms)
+        run("group commit", lambda issue, owner_id: batcher.submit(issue, owner_id).result(), issues, args.concurrency)
+        batcher.shutdown()
+        status = batcher.status()
+        print(f"batches: {status['batches']}, average {status['average_batch']} issues, {status['average_write_ms']} ms each")
+        app_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# backend/benchmarks/bench_search.py
+"""
+Benchmark for full-text issue search.
+
+Seeds a throwaway database (SQLite FTS5 by default, or Postgres tsvector/GIN via
+--database-url) and reports search latency percentiles for admin-wide and
+reporter-scoped queries.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_search.py --rows 1000000
+    PYTHONPATH=. python benchmarks/bench_search.py --rows 1000000 --database-url postgresql://...
+"""
+
+import argparse
+import random
+
+from common import OWNER_COUNT, WORDS, benchmark_engine, seed, summarize, time_calls
+from sqlalchemy.orm import sessionmaker
+
+from app.search import search_issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    queries = [" ".join(rng.sample(WORDS, 2)) for _ in range(args.queries)]
+
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        db = sessionmaker(bind=engine)()
+        try:
+            summarize("search (all issues)", time_calls(
+                lambda q: search_issues(db, q, limit=20), [(q,) for q in queries]
+            ))
+            summarize("search (one reporter)", time_calls(
+                lambda q, owner_id: search_issues(db, q, owner_id=owner_id, limit=20),
+                [(q, rng.randrange(1, OWNER_COUNT + 1)) for q in queries]
+            ))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
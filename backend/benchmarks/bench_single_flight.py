@@ -0,0 +1,95 @@
+# backend/benchmarks/bench_single_flight.py
+"""
+Load test for single-flight coalescing of expensive reads.
+
+Seeds a throwaway database and fires bursts of concurrent identical requests at
+the dashboard status counts and the issue list, in-process through the ASGI
+app, the way an incident stampede looks. Counts the SQL statements each burst
+runs and its latency, with coalescing disabled and enabled.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_single_flight.py --rows 200000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from common import benchmark_engine, seed, summarize
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models, schemas
+from app.auth import create_access_token
+from app.database import get_db
+from app.single_flight import single_flight
+from main import app
+
+ENDPOINTS = ["/api/v1/dashboard/status_counts", "/api/v1/issues/?limit=100"]
+
+
+async def burst(client: httpx.AsyncClient, path: str, headers: dict, concurrency: int):
+    latencies = []
+
+    async def one():
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+    return latencies
+
+
+async def run(headers: dict, concurrency: int, bursts: int, statements: list):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ENDPOINTS:
+            statements.clear()
+            latencies = []
+            for _ in range(bursts):
+                latencies += await burst(client, path, headers, concurrency)
+            # Every request also loads the current user; only the endpoint's own queries can coalesce
+            endpoint_statements = [statement for statement in statements if "FROM users" not in statement]
+            print(f"  {path}: {len(endpoint_statements) / bursts:,.1f} queries per burst of {concurrency}")
+            summarize(f"  {path}", latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--bursts", type=int, default=3)
+    args = parser.parse_args()
+
+    with benchmark_engine() as engine:
+        seed(engine, args.rows)
+        # One connection per concurrent request, so the pool is not what limits the burst
+        app_engine = create_engine(engine.url, pool_size=args.concurrency, max_overflow=0)
+        Session = sessionmaker(bind=app_engine)
+        db = Session()
+        admin = crud.create_user(db, schemas.UserCreate(email="bench-admin@example.com", password="password", role=models.UserRole.ADMIN))
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': admin.email})}"}
+        db.close()
+
+        def bench_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+        app.dependency_overrides[get_db] = bench_db
+
+        statements = []
+        event.listen(app_engine, "before_cursor_execute", lambda conn, cursor, statement, *_: statements.append(statement))
+        for enabled in (False, True):
+            single_flight.enabled = enabled
+            print(f"single-flight {'enabled' if enabled else 'disabled'}:")
+            asyncio.run(run(headers, args.concurrency, args.bursts, statements))
+        app.dependency_overrides.clear()
+        app_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# backend/benchmarks/bench_snapshot.py
+"""
+Benchmark for dashboard slices.
+
+Seeds a throwaway database and reports the in-memory issue snapshot's build
+time and memory, then slice latency from the snapshot and, for comparison,
+with the snapshot disabled (rows loaded from the database per request).
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_snapshot.py --rows 1000000
+    PYTHONPATH=. python benchmarks/bench_snapshot.py --rows 1000000 --database-url postgresql://...
+"""
+
+import argparse
+import random
+import time
+
+from common import OWNER_COUNT, benchmark_engine, seed, summarize, time_calls
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.models import IssueSliceDimension
+from app.snapshot import BYTES_PER_ISSUE, issue_snapshot, slice_issues
+
+SLICES = [
+    [IssueSliceDimension.STATUS],
+    [IssueSliceDimension.STATUS, IssueSliceDimension.SEVERITY],
+    [IssueSliceDimension.OWNER, IssueSliceDimension.WEEK],
+    [IssueSliceDimension.STATUS, IssueSliceDimension.SEVERITY, IssueSliceDimension.OWNER, IssueSliceDimension.WEEK],
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        db = sessionmaker(bind=engine)()
+        try:
+            started = time.perf_counter()
+            issue_snapshot.build(db)
+            elapsed = time.perf_counter() - started
+            print(f"snapshot build: {elapsed:.1f} s, {issue_snapshot.memory_bytes() / 1e6:,.1f} MB allocated "
+                  f"for {len(issue_snapshot):,} issues ({BYTES_PER_ISSUE * 1_000_000 / 1e6:,.0f} MB per million)")
+
+            queries = []
+            for _ in range(args.queries):
+                filters = {}
+                if rng.random() < 0.5:
+                    filters["statuses"] = [rng.choice(list(models.IssueStatus))]
+                if rng.random() < 0.3:
+                    filters["owner_id"] = rng.randrange(1, OWNER_COUNT + 1)
+                queries.append((rng.choice(SLICES), filters))
+
+            summarize("slice (snapshot)", time_calls(
+                lambda group_by, filters: slice_issues(db, group_by, **filters), queries
+            ))
+            issue_snapshot.enabled = False
+            summarize("slice (database)", time_calls(
+                lambda group_by, filters: slice_issues(db, group_by, **filters), queries[:max(1, args.queries // 10)]
+            ))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# backend/benchmarks/bench_suggest.py
+"""
+Benchmark for title autocomplete.
+
+Seeds a throwaway database and reports suggestion latency for 1-6 character
+prefixes, for all issues and for a single reporter. With the default SQLite
+database this measures the in-memory trigram index (including its build time
+and memory); with a Postgres --database-url it measures the pg_trgm query.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/bench_suggest.py --rows 1000000
+    PYTHONPATH=. python benchmarks/bench_suggest.py --rows 1000000 --database-url postgresql://...
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from common import OWNER_COUNT, benchmark_engine, seed, summarize, time_calls
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.suggest import suggest_titles, title_suggest_index, uses_database_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--database-url", help="Benchmark against this database instead of a temporary SQLite file")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    with benchmark_engine(args.database_url) as engine:
+        seed(engine, args.rows)
+        db = sessionmaker(bind=engine)()
+        try:
+            if not uses_database_index(db):
+                started = time.perf_counter()
+                title_suggest_index.build(db)
+                elapsed = time.perf_counter() - started
+                # Build a second time under tracemalloc, which slows allocation considerably
+                tracemalloc.start()
+                title_suggest_index.build(db)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"in-memory index build: {elapsed:.1f} s, ~{peak / 1e6:,.0f} MB for {len(title_suggest_index):,} titles")
+
+            titles = [title for (title,) in db.query(models.Issue.title).limit(args.queries)]
+            prefixes = []
+            for title in titles:
+                word = rng.choice(title.split())
+                prefixes.append(word[:rng.randint(1, min(6, len(word)))])
+
+            summarize("suggest (all issues)", time_calls(
+                lambda prefix: suggest_titles(db, prefix, limit=10), [(prefix,) for prefix in prefixes]
+            ))
+            summarize("suggest (one reporter)", time_calls(
+                lambda prefix, owner_id: suggest_titles(db, prefix, owner_id=owner_id, limit=10),
+                [(prefix, rng.randrange(1, OWNER_COUNT + 1)) for prefix in prefixes]
+            ))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# backend/benchmarks/common.py
+"""
+Shared helpers for the benchmark scripts: environment defaults, a throwaway
+database and synthetic issue data.
+"""
+
+import os
+import random
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+
+from app import models, search  # noqa: E402,F401 - search registers the full-text index DDL
+from app.database import Base  # noqa: E402
+
+WORDS = (
+    "login page crash timeout dashboard export invoice payment upload image "
+    "report slow error server database email password reset button layout "
+    "mobile android ios safari chrome firefox api token expired session "
+    "notification search filter sort chart pdf csv attachment permission"
+).split()
+
+OWNER_COUNT = 100
+
+# Common words plus a long tail of synthetic ones, so texts are not all near-identical
+_vocabulary_rng = random.Random(0)
+VOCABULARY = WORDS + [
+    "".join(_vocabulary_rng.choices("abcdefghijklmnopqrstuvwxyz", k=_vocabulary_rng.randint(4, 9)))
+    for _ in range(5000)
+]
+
+
+@contextmanager
+def benchmark_engine(database_url=None):
+    """
+    Yields an engine with a fresh schema. Defaults to a temporary SQLite file.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(database_url or f"sqlite:///{tmp}/bench.db")
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+
+
+def seed(engine, rows: int, batch: int = 10000, seed_value: int = 42):
+    """
+    Inserts `rows` synthetic issues spread over OWNER_COUNT reporters and the last year.
+    """
+    rng = random.Random(seed_value)
+    now = datetime.utcnow()
+    severities = list(models.IssueSeverity)
+    statuses = list(models.IssueStatus)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            {"id": owner_id, "email": f"bench{owner_id}@example.com", "hashed_password": "x", "role": models.UserRole.REPORTER}
+            for owner_id in range(1, OWNER_COUNT + 1)
+        ])
+        for start in range(0, rows, batch):
+            values = []
+            for _ in range(start, min(start + batch, rows)):
+                created_at = now - timedelta(minutes=rng.randrange(365 * 24 * 60))
+                values.append({
+                    "title": " ".join(rng.choices(VOCABULARY, k=5)),
+                    "description": " ".join(rng.choices(VOCABULARY, k=30)),
+                    "severity": rng.choice(severities),
+                    "status": rng.choice(statuses),
+                    "created_at": created_at,
+                    "updated_at": created_at + timedelta(minutes=rng.randrange(30 * 24 * 60)),
+                    "owner_id": rng.randrange(1, OWNER_COUNT + 1),
+                })
+            conn.execute(insert(models.Issue), values)
+
+
+def time_calls(fn, args_list):
+    """
+    Calls `fn` once per argument tuple and returns per-call latencies in milliseconds.
+    """
+    latencies = []
+    for args in args_list:
+        started = time.perf_counter()
+        fn(*args)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def summarize(label: str, latencies):
+    """
+    Prints p50/p95/p99 latencies for a benchmark run.
+    """
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label}: p50 {statistics.median(ordered):.2f} ms, p95 {p95:.2f} ms, p99 {p99:.2f} ms ({len(ordered)} calls)")
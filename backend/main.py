@@ -14,19 +14,33 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.logging_config import configure_logging
 
 # Import database components
-from app.database import Base, engine, SessionLocal, get_db
+from app.database import Base, engine, SessionLocal, get_db, replicas, DB_REPLICA_HEALTH_CHECK_SECONDS
 
-# Import the user, issues, and dashboard routers
-from app.routers import users, issues, dashboard
+# Import the user, issues, attachments, dashboard, exports, and system routers
+from app.routers import users, issues, attachments, dashboard, exports, system, health
 
 # Import the WebSocket manager from the new websockets module
 from app.websockets import manager
 
 # Import background tasks
-from app.tasks import aggregate_daily_issue_stats
+from app.tasks import aggregate_daily_issue_stats, prune_attachment_blobs, purge_idempotency_keys, refresh_issue_indexes
 
 from app.init_db import init_db
 
+# Import the scheduler leader lease and job runner
+from app.leader import scheduler_lease, SCHEDULER_LEASE_TTL_SECONDS
+from app.job_runner import job_runner
+
+# Import the in-memory issue indexes
+from app.dedup import duplicate_index, DUPLICATE_INDEX_SNAPSHOT
+from app.suggest import title_suggest_index, uses_database_index
+from app.snapshot import issue_snapshot
+from app.deadlines import deadline_middleware
+from app.issue_cache import issue_cache, create_notifier
+from app.attachment_processing import shutdown_process_pool
+from app.exports import shutdown_export_executor
+from app.issue_ingest import issue_batcher
+
 # Python's built-in logging
 import logging
 logger = logging.getLogger(__name__)
@@ -48,16 +62,55 @@ async def lifespan(app: FastAPI):
     configure_logging()
 
     # Startup event
+    logger.info("Application startup: Loading in-memory issue indexes...")
+    db = SessionLocal()
+    try:
+        duplicate_index.load_or_build(db, DUPLICATE_INDEX_SNAPSHOT)
+        # Postgres serves title suggestions from its trigram index
+        title_suggest_index.enabled = not uses_database_index(db)
+        if title_suggest_index.enabled:
+            title_suggest_index.build(db)
+        if issue_snapshot.enabled:
+            issue_snapshot.build(db)
+    finally:
+        db.close()
+    # Issue writes in other workers reach this worker's issue cache through the notifier
+    issue_cache.set_notifier(create_notifier(engine))
+    issue_cache.notifier.start()
+
     logger.info("Application startup: Starting scheduler...")
-    scheduler.add_job(aggregate_daily_issue_stats, IntervalTrigger(
-        minutes=30), id='daily_issue_stats_job')
+    # Jobs are synchronous; the job runner executes them off the event loop on its own threads
+    lease_renewal_seconds = max(1, SCHEDULER_LEASE_TTL_SECONDS // 3)
+    # Every worker competes for the lease on its own thread; only the leader runs cluster-wide jobs
+    scheduler_lease.start_renewal(lease_renewal_seconds)
+    scheduler.add_job(job_runner.job('daily_issue_stats_job', scheduler_lease.leader_only('daily_issue_stats_job', aggregate_daily_issue_stats)),
+        IntervalTrigger(minutes=30), id='daily_issue_stats_job')
+    scheduler.add_job(job_runner.job('attachment_blob_prune_job', scheduler_lease.leader_only('attachment_blob_prune_job', prune_attachment_blobs), timeout_seconds=3600),
+        IntervalTrigger(hours=24), id='attachment_blob_prune_job')
+    scheduler.add_job(job_runner.job('idempotency_key_purge_job', scheduler_lease.leader_only('idempotency_key_purge_job', purge_idempotency_keys), timeout_seconds=600),
+        IntervalTrigger(hours=1), id='idempotency_key_purge_job')
+    # In-memory indexes live in every worker, so every worker refreshes its own
+    scheduler.add_job(job_runner.job('issue_index_refresh_job', refresh_issue_indexes, timeout_seconds=60),
+        IntervalTrigger(minutes=1), id='issue_index_refresh_job')
+    if replicas:
+        # Each worker routes its own reads, so each checks its own view of the replicas
+        scheduler.add_job(job_runner.job('replica_health_check_job', replicas.check, timeout_seconds=DB_REPLICA_HEALTH_CHECK_SECONDS),
+            IntervalTrigger(seconds=DB_REPLICA_HEALTH_CHECK_SECONDS), id='replica_health_check_job')
     scheduler.start()
     logger.info("Scheduler started.")
     yield
     # Shutdown event
     logger.info("Application shutdown: Shutting down scheduler...")
     scheduler.shutdown()
+    issue_batcher.shutdown()
+    job_runner.shutdown()
+    shutdown_process_pool()
+    shutdown_export_executor()
+    issue_cache.notifier.stop()
+    scheduler_lease.stop_renewal()
+    scheduler_lease.release()
     logger.info("Scheduler shut down.")
+    duplicate_index.save_snapshot(DUPLICATE_INDEX_SNAPSHOT)
 
 # Initialize the FastAPI application with lifespan
 app = FastAPI(
@@ -79,6 +132,9 @@ async def log_requests(request: Request, call_next):
         f"Response: {request.method} {request.url} - Status: {response.status_code} - Headers: {dict(response.headers)}")
     return response
 
+# Request deadlines, enforced on database statements by get_db
+app.middleware("http")(deadline_middleware)
+
 # --- Add the CORS middleware LAST so it becomes the outermost layer ---
 origins = [
     "http://localhost",
@@ -98,7 +154,11 @@ app.add_middleware(
 # --- Include all your routers AFTER the middleware is configured ---
 app.include_router(users.router)
 app.include_router(issues.router)
+app.include_router(attachments.router)
 app.include_router(dashboard.router)
+app.include_router(exports.router)
+app.include_router(system.router)
+app.include_router(health.router)
 
 # Example endpoint on the main app
 @app.get("/api/v1/hello")
@@ -6,6 +6,30 @@ from main import app
 from app.database import Base, get_db
 from .database_test import override_get_db, engine as test_engine
 from app import schemas, crud
+from app.dedup import duplicate_index
+from app.suggest import title_suggest_index
+from app.snapshot import issue_snapshot
+from app.sla import sla_cache
+from app.issue_summary import owner_summary_cache
+from app.deadlines import deadline_metrics
+from app.issue_cache import issue_cache
+from app.single_flight import single_flight
+from app.idempotency import idempotency_store
+from app.issue_ingest import issue_batcher
+
+@pytest.fixture(autouse=True)
+def clear_issue_indexes():
+    # In-memory issue indexes are process-wide, while each test database reuses issue IDs
+    for index in (duplicate_index, title_suggest_index, issue_snapshot):
+        index.clear()
+    sla_cache.clear()
+    owner_summary_cache.clear()
+    deadline_metrics.clear()
+    issue_cache.clear()
+    single_flight.clear()
+    idempotency_store.clear()
+    issue_batcher.clear()
+    yield
 
 @pytest.fixture(scope="function")
 def db_session():
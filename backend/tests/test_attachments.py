@@ -0,0 +1,267 @@
+# backend/tests/test_attachments.py
+import asyncio
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app import attachment_processing, attachments, crud, models
+from app.attachments import AttachmentTooLarge, prune_orphan_blobs, store_upload
+from app.routers import attachments as attachments_router
+from app.storage import LocalBlobStorage, blob_storage
+
+@pytest.fixture(autouse=True)
+def attachment_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_storage, "root", str(tmp_path / "blobs"))
+    return blob_storage
+
+def stored_files(storage: LocalBlobStorage):
+    return sorted(name for _, _, files in os.walk(storage.root) for name in files)
+
+async def single_chunk(data: bytes):
+    yield data
+
+def create_issue(test_client: TestClient, headers) -> int:
+    return test_client.post("/api/v1/issues/", json={"title": "Crash on save", "severity": "HIGH"}, headers=headers).json()["id"]
+
+def test_upload_deduplicates_identical_contents(test_client: TestClient, reporter_auth_token: str, attachment_storage):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    contents = os.urandom(3 * 1024 * 1024 + 17)
+
+    first = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "../crash.log"},
+                             content=contents, headers={**headers, "Content-Type": "text/plain"})
+    assert first.status_code == 201
+    body = first.json()
+    assert body["filename"] == "crash.log"
+    assert body["content_type"] == "text/plain"
+    assert body["size_bytes"] == len(contents)
+    assert body["sha256"] == hashlib.sha256(contents).hexdigest()
+
+    # Sent chunked, without a Content-Length
+    second = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "again.log"},
+                              content=(contents[i:i + 70000] for i in range(0, len(contents), 70000)), headers=headers)
+    assert second.status_code == 201
+    assert second.json()["sha256"] == body["sha256"]
+    assert stored_files(attachment_storage) == [body["sha256"]]
+    with open(attachment_storage.path(body["sha256"]), "rb") as f:
+        assert f.read() == contents
+
+    listed = test_client.get(f"/api/v1/issues/{issue_id}/attachments", headers=headers).json()
+    assert [attachment["filename"] for attachment in listed] == ["crash.log", "again.log"]
+
+def test_upload_limits_and_permissions(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str,
+                                       attachment_storage, monkeypatch):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    monkeypatch.setattr(attachments_router, "ATTACHMENT_MAX_BYTES", 10)
+    response = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "big.bin"},
+                                content=b"x" * 11, headers=headers)
+    assert response.status_code == 413
+    response = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "empty.bin"},
+                                content=b"", headers=headers)
+    assert response.status_code == 400
+
+    admin_issue_id = create_issue(test_client, {"Authorization": f"Bearer {admin_auth_token}"})
+    response = test_client.post(f"/api/v1/issues/{admin_issue_id}/attachments", params={"filename": "a.txt"},
+                                content=b"hello", headers=headers)
+    assert response.status_code == 403
+    assert stored_files(attachment_storage) == []
+
+def test_upload_holds_no_connection_while_streaming(test_client: TestClient, db_session: Session, reporter_auth_token: str,
+                                                    monkeypatch):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    transaction_open = []
+
+    async def observed_store_upload(chunks):
+        transaction_open.append(db_session.in_transaction())
+        return await store_upload(chunks)
+    monkeypatch.setattr(attachments_router, "store_upload", observed_store_upload)
+
+    response = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "a.txt"}, content=b"hello", headers=headers)
+    assert response.status_code == 201
+    assert transaction_open == [False]
+    assert crud.get_attachment(db_session, issue_id, response.json()["id"]).filename == "a.txt"
+
+def test_streamed_upload_stops_at_limit(attachment_storage):
+    async def body():
+        for _ in range(100):
+            yield b"x" * 1000
+
+    with pytest.raises(AttachmentTooLarge):
+        asyncio.run(store_upload(body(), max_bytes=5000))
+    assert stored_files(attachment_storage) == []
+
+def test_prune_removes_blobs_of_deleted_issues(test_client: TestClient, admin_auth_token: str, db_session: Session,
+                                               attachment_storage):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    kept_issue, deleted_issue = create_issue(test_client, headers), create_issue(test_client, headers)
+    kept = test_client.post(f"/api/v1/issues/{kept_issue}/attachments", params={"filename": "a"}, content=b"keep", headers=headers).json()
+    test_client.post(f"/api/v1/issues/{deleted_issue}/attachments", params={"filename": "b"}, content=b"drop", headers=headers)
+
+    crud.delete_issue(db_session, deleted_issue)
+    assert db_session.query(models.IssueAttachment).count() == 1
+    # Fresh blobs are kept, as their attachment rows may still be on the way
+    assert prune_orphan_blobs(db_session) == 0
+
+    old = time.time() - attachments.ORPHAN_BLOB_GRACE.total_seconds() - 60
+    for digest, _ in attachment_storage.iter_blobs():
+        os.utime(attachment_storage.path(digest), (old, old))
+    assert prune_orphan_blobs(db_session) == 1
+    # Derived artifacts go with their blob
+    assert stored_files(attachment_storage) == [kept["sha256"], f"{kept['sha256']}.text.txt"]
+
+def test_prune_keeps_blobs_reused_while_it_runs(test_client: TestClient, admin_auth_token: str, db_session: Session,
+                                               attachment_storage, monkeypatch):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    digest, _ = asyncio.run(store_upload(single_chunk(b"stack trace")))
+    old = time.time() - 2 * 3600
+    os.utime(attachment_storage.path(digest), (old, old))
+
+    # A duplicate upload commits between the sweep's candidate scan and its deletion
+    is_referenced = attachments._is_referenced
+    def race_duplicate_upload(db, candidate):
+        asyncio.run(store_upload(single_chunk(b"stack trace")))
+        crud.create_attachment(db_session, issue_id, "trace.txt", "text/plain", 11, candidate)
+        return is_referenced(db, candidate)
+    monkeypatch.setattr(attachments, "_is_referenced", race_duplicate_upload)
+
+    assert prune_orphan_blobs(db_session) == 0
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments", headers=headers)
+    download = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{response.json()[0]['id']}/download", headers=headers)
+    assert download.status_code == 200 and download.content == b"stack trace"
+    assert stored_files(attachment_storage) == [digest]
+
+def test_download_supports_ranges_and_etags(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    contents = os.urandom(200000)
+    attachment = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "screen shot.png"},
+                                  content=contents, headers={**headers, "Content-Type": "image/png"}).json()
+    url = f"/api/v1/issues/{issue_id}/attachments/{attachment['id']}/download"
+
+    response = test_client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.content == contents
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["etag"] == f'"{attachment["sha256"]}"'
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = test_client.get(url, headers={**headers, "Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == contents[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(contents)}"
+
+    response = test_client.get(url, headers={**headers, "If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Admins see every issue; another issue's ID does not expose the attachment
+    assert test_client.get(url, headers={"Authorization": f"Bearer {admin_auth_token}"}).status_code == 200
+    other_issue_id = create_issue(test_client, headers)
+    assert test_client.get(f"/api/v1/issues/{other_issue_id}/attachments/{attachment['id']}/download", headers=headers).status_code == 404
+
+def test_download_hands_off_to_proxy(test_client: TestClient, admin_auth_token: str, monkeypatch):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    attachment = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "log.txt"},
+                                  content=b"log line", headers=headers).json()
+    monkeypatch.setattr(attachments_router, "ATTACHMENT_ACCEL_REDIRECT_PREFIX", "/internal/attachments/")
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{attachment['id']}/download", headers=headers)
+    digest = attachment["sha256"]
+    assert response.headers["x-accel-redirect"] == f"/internal/attachments/{digest[:2]}/{digest[2:4]}/{digest}"
+    assert response.content == b""
+
+def test_uploads_are_processed_in_the_background(test_client: TestClient, reporter_auth_token: str, monkeypatch):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    events = []
+
+    async def capture(payload):
+        events.append(payload)
+    monkeypatch.setattr(attachment_processing.manager, "broadcast", capture)
+
+    image = io.BytesIO()
+    Image.new("RGB", (1200, 600), "red").save(image, format="PNG")
+    # Declared types are not trusted; the contents decide
+    screenshot = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "screen.bin"},
+                                  content=image.getvalue(), headers={**headers, "Content-Type": "application/octet-stream"}).json()
+    log = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "app.log"},
+                           content=b"\x1b[31mERROR\x1b[0m disk full\n", headers=headers).json()
+    # Background tasks have run by the time the test client returns
+    assert screenshot["status"] == "PENDING"
+
+    listed = {attachment["id"]: attachment for attachment in test_client.get(f"/api/v1/issues/{issue_id}/attachments", headers=headers).json()}
+    processed = listed[screenshot["id"]]
+    assert processed["status"] == "READY"
+    assert processed["detected_type"] == "image/png"
+    assert processed["artifacts"] == ["thumbnail.png"]
+    assert set(processed["stage_timings"]) == {"sniff", "thumbnail"}
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{screenshot['id']}/artifacts/thumbnail.png", headers=headers)
+    assert response.status_code == 200
+    with Image.open(io.BytesIO(response.content)) as thumbnail:
+        assert thumbnail.size == (320, 160)
+
+    processed = listed[log["id"]]
+    assert processed["status"] == "READY"
+    assert processed["detected_type"] == "text/plain"
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{log['id']}/artifacts/text.txt", headers=headers)
+    assert response.text == "ERROR disk full\n"
+    assert test_client.get(f"/api/v1/issues/{issue_id}/attachments/{log['id']}/artifacts/thumbnail.png", headers=headers).status_code == 404
+
+    assert [(event["type"], event["attachment_id"], event["status"]) for event in events] == [
+        ("attachment_processed", screenshot["id"], "READY"), ("attachment_processed", log["id"], "READY"),
+    ]
+    assert set(events[0]["stage_timings_ms"]) == {"sniff", "thumbnail"}
+
+def test_timed_out_stages_kill_their_worker(monkeypatch):
+    attachment_processing._run_stage(time.sleep, 0) # Start the pool before timing a step
+    pool = attachment_processing._pool
+    processes = list(pool._processes.values())
+    monkeypatch.setattr(attachment_processing, "ATTACHMENT_STAGE_TIMEOUT_SECONDS", 0.2)
+    try:
+        with pytest.raises(TimeoutError):
+            attachment_processing._run_stage(time.sleep, 30)
+        for process in processes:
+            process.join(timeout=5)
+            assert not process.is_alive()
+        # The next step runs in a fresh pool
+        attachment_processing._run_stage(time.sleep, 0)
+        assert attachment_processing._pool is not pool
+    finally:
+        attachment_processing.shutdown_process_pool()
+
+def test_stage_timeouts_do_not_count_waiting_for_a_worker(monkeypatch):
+    attachment_processing._run_stage(time.sleep, 0) # Start the pool before timing a step
+    pool = attachment_processing._pool
+    monkeypatch.setattr(attachment_processing, "ATTACHMENT_STAGE_TIMEOUT_SECONDS", 0.6)
+    # One more step than there are worker processes, so the last one waits for a free process
+    steps = attachment_processing.ATTACHMENT_PROCESS_WORKERS + 1
+    try:
+        with ThreadPoolExecutor(max_workers=steps) as executor:
+            runs = list(executor.map(lambda _: attachment_processing._run_stage(time.sleep, 0.4), range(steps)))
+        assert all(elapsed < 0.6 for _, elapsed in runs)
+        assert attachment_processing._pool is pool
+    finally:
+        attachment_processing.shutdown_process_pool()
+
+def test_processing_failure_is_recorded(test_client: TestClient, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    issue_id = create_issue(test_client, headers)
+    # A PNG signature followed by garbage cannot be thumbnailed
+    attachment = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "broken.png"},
+                                  content=b"\x89PNG\r\n\x1a\n" + b"\x00" * 100, headers=headers).json()
+    processed = test_client.get(f"/api/v1/issues/{issue_id}/attachments", headers=headers).json()[0]
+    assert processed["id"] == attachment["id"]
+    assert processed["status"] == "FAILED"
+    assert processed["processing_error"]
+    assert "sniff" in processed["stage_timings"]
@@ -65,4 +65,27 @@ def test_update_issue_title(db_session: Session):
     retrieved_issue = crud.get_issue(db=db_session, issue_id=getattr(db_issue, "id"))
     assert retrieved_issue is not None
     assert getattr(retrieved_issue, "id") == getattr(db_issue, "id")
-    assert getattr(retrieved_issue, "title") == "Test Issue"
\ No newline at end of file
+    assert getattr(retrieved_issue, "title") == "Test Issue"
+
+
+def test_issue_writes_are_logged_as_events(db_session: Session):
+    owner = crud.create_user(db=db_session, user=schemas.UserCreate(email="issue.owner@example.com", password="password"))
+    maintainer = crud.create_user(db=db_session, user=schemas.UserCreate(email="maintainer@example.com", password="password", role=models.UserRole.MAINTAINER))
+    db_issue = crud.create_issue(db=db_session, issue=schemas.IssueCreate(title="Test Issue", severity=schemas.IssueSeverity.LOW), owner_id=owner.id)
+    issue_id = db_issue.id
+
+    crud.update_issue(db_session, issue_id, schemas.IssueUpdate(status=models.IssueStatus.TRIAGED, severity=schemas.IssueSeverity.HIGH), actor_id=maintainer.id)
+    crud.delete_issue(db_session, issue_id, actor_id=maintainer.id)
+
+    events = list(crud.iter_issue_events(db_session, issue_id=issue_id))
+    assert [(event.event_type, event.actor_id) for event in events] == [
+        (models.IssueEventType.CREATED, owner.id),
+        (models.IssueEventType.UPDATED, maintainer.id),
+        (models.IssueEventType.DELETED, maintainer.id),
+    ]
+    created, updated, deleted = events
+    assert (created.old_status, created.new_status, created.new_severity) == (None, models.IssueStatus.OPEN, models.IssueSeverity.LOW)
+    assert (updated.old_status, updated.new_status) == (models.IssueStatus.OPEN, models.IssueStatus.TRIAGED)
+    assert (updated.old_severity, updated.new_severity) == (models.IssueSeverity.LOW, models.IssueSeverity.HIGH)
+    assert (deleted.old_status, deleted.new_status) == (models.IssueStatus.TRIAGED, None)
+    assert created.at <= updated.at <= deleted.at
@@ -1,5 +1,11 @@
 # backend/tests/test_dashboard_api.py
+from datetime import datetime
+
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.stats import refresh_daily_stats
 
 def test_get_dashboard_status_counts(
     test_client: TestClient,
@@ -22,4 +28,71 @@ def test_get_dashboard_status_counts(
     status_counts = data["status_counts"]
     assert "OPEN" in status_counts
     assert "IN_PROGRESS" in status_counts
-    assert "DONE" in status_counts
\ No newline at end of file
+    assert "DONE" in status_counts
+
+
+def test_get_dashboard_history_by_day_and_week(
+    test_client: TestClient,
+    maintainer_auth_token: str,
+    db_session: Session
+):
+    owner = crud.get_user_by_email(db_session, "maintainer@example.com")
+    issue = crud.create_issue(db_session, schemas.IssueCreate(title="Crash on start", severity="HIGH"), owner_id=owner.id)
+    issue.created_at = issue.updated_at = datetime(2026, 3, 2, 9)
+    db_session.commit()
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 10))
+    issue.status, issue.updated_at = models.IssueStatus.DONE, datetime(2026, 3, 3, 9)
+    db_session.commit()
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 3, 10))
+
+    headers = {"Authorization": f"Bearer {maintainer_auth_token}"}
+    response = test_client.get("/api/v1/dashboard/history", params={"from": "2026-03-01", "to": "2026-03-31"}, headers=headers)
+    assert response.status_code == 200
+    points = response.json()["points"]
+    assert [point["period_start"] for point in points] == ["2026-03-02", "2026-03-03"]
+    assert points[0]["status_counts"]["OPEN"] == 1
+    assert points[1]["status_counts"] == {"OPEN": 0, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1}
+    assert points[1]["severity_counts"]["HIGH"] == 1
+
+    # Rollups hold the counts at the end of each period
+    response = test_client.get("/api/v1/dashboard/history", params={"from": "2026-03-04", "to": "2026-03-31", "granularity": "WEEK"}, headers=headers)
+    points = response.json()["points"]
+    assert [point["period_start"] for point in points] == ["2026-03-02"]
+    assert points[0]["status_counts"]["DONE"] == 1
+
+    response = test_client.get("/api/v1/dashboard/history", params={"from": "2026-03-31", "to": "2026-03-01"}, headers=headers)
+    assert response.status_code == 400
+
+    # Ranges are capped by the number of points they return
+    response = test_client.get("/api/v1/dashboard/history", params={"from": "2020-01-01", "to": "2026-03-31"}, headers=headers)
+    assert response.status_code == 400
+    response = test_client.get("/api/v1/dashboard/history", params={"from": "2020-01-01", "to": "2026-03-31", "granularity": "WEEK"}, headers=headers)
+    assert response.status_code == 200
+
+def test_get_dashboard_summary_breakdowns(
+    test_client: TestClient,
+    maintainer_auth_token: str,
+    reporter_auth_token: str,
+    db_session: Session
+):
+    maintainer = crud.get_user_by_email(db_session, "maintainer@example.com")
+    reporter = crud.get_user_by_email(db_session, "reporter@example.com")
+    for owner, severity in ((reporter, "HIGH"), (reporter, "LOW"), (maintainer, "HIGH")):
+        crud.create_issue(db_session, schemas.IssueCreate(title="Broken link", severity=severity), owner_id=owner.id)
+    crud.update_issue(db_session, 1, schemas.IssueUpdate(status=models.IssueStatus.DONE))
+
+    headers = {"Authorization": f"Bearer {maintainer_auth_token}"}
+    response = test_client.get("/api/v1/dashboard/summary", params={"reporters": 1}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["status_counts"] == {"OPEN": 2, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1}
+    assert data["severity_counts"] == {"LOW": 1, "MEDIUM": 0, "HIGH": 2, "CRITICAL": 0}
+    assert data["status_severity_counts"]["DONE"]["HIGH"] == 1
+    assert data["reporter_count"] == 2
+    assert data["top_reporters"] == [
+        {"owner_id": reporter.id, "total": 2, "status_counts": {"OPEN": 1, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1}}
+    ]
+
+    response = test_client.get("/api/v1/dashboard/summary", headers={"Authorization": f"Bearer {reporter_auth_token}"})
+    assert response.status_code == 403
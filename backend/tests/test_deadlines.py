@@ -0,0 +1,74 @@
+# backend/tests/test_deadlines.py
+import time
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.orm import sessionmaker
+
+from main import app
+from app import deadlines
+from app.database import get_db
+from app.deadlines import DeadlineExceeded, apply_deadline, install_deadline_reset, is_deadline_error, request_deadline
+from .database_test import TestingSessionLocal
+
+# Counts to a billion, far longer than any deadline here
+SLOW_QUERY = text("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 1000000000) SELECT count(*) FROM n")
+
+def test_statements_are_cancelled_at_the_deadline(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/deadline.db", pool_size=1, max_overflow=0)
+    install_deadline_reset(engine)
+    Session = sessionmaker(bind=engine)
+
+    db = Session()
+    apply_deadline(db, time.monotonic() + 0.05)
+    started = time.monotonic()
+    with pytest.raises(exc.OperationalError) as raised:
+        db.execute(SLOW_QUERY)
+    assert time.monotonic() - started < 5
+    assert is_deadline_error(raised.value)
+    db.close()
+
+    # The pooled connection no longer carries the expired deadline
+    db = Session()
+    assert db.execute(text("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000) SELECT count(*) FROM n")).scalar() == 100000
+    db.close()
+
+    db = Session()
+    apply_deadline(db, time.monotonic() - 1)
+    with pytest.raises(DeadlineExceeded):
+        db.execute(text("SELECT 1"))
+    db.close()
+    engine.dispose()
+
+def test_routes_report_exceeded_deadlines(test_client: TestClient, admin_auth_token: str, monkeypatch):
+    def deadline_db(request: Request):
+        db = TestingSessionLocal()
+        apply_deadline(db, request_deadline(request))
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = deadline_db
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+
+    monkeypatch.setitem(deadlines.ROUTE_TIMEOUT_SECONDS, "/api/v1/issues/{issue_id}", 0)
+    response = test_client.get("/api/v1/issues/1", headers=headers)
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Request deadline exceeded"}
+    assert test_client.get("/api/v1/issues/", headers=headers).status_code == 200
+
+    def exhausted_pool():
+        raise exc.TimeoutError("QueuePool limit of size 5 overflow 10 reached")
+    app.dependency_overrides[get_db] = exhausted_pool
+    response = test_client.get("/api/v1/dashboard/summary", headers=headers)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    app.dependency_overrides[get_db] = deadline_db
+    metrics = test_client.get("/api/v1/system/deadlines", headers=headers).json()
+    assert metrics == [
+        {"route": "/api/v1/dashboard/summary", "timeout_seconds": 30, "deadline_exceeded": 0, "pool_timeouts": 1},
+        {"route": "/api/v1/issues/{issue_id}", "timeout_seconds": 0, "deadline_exceeded": 1, "pool_timeouts": 0},
+    ]
@@ -0,0 +1,90 @@
+# backend/tests/test_dedup.py
+from fastapi.testclient import TestClient
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.dedup import DuplicateIndex
+
+def test_find_duplicates_ranks_similar_issues():
+    index = DuplicateIndex()
+    index.add(1, 10, "Login page crashes on Safari", "Clicking submit shows a blank screen")
+    index.add(2, 10, "Export to CSV is slow", "Takes minutes for large projects")
+    index.add(3, 20, "Login page crashes on Safari 17", "Clicking submit shows a blank white screen")
+
+    matches = index.find_duplicates("Login page crashes in Safari", "Clicking submit shows a blank screen")
+    assert [match["issue_id"] for match in matches] == [1, 3]
+    assert matches[0]["similarity"] >= matches[1]["similarity"]
+
+    # Scoped lookups only return issues of that owner
+    assert [match["issue_id"] for match in index.find_duplicates("Login page crashes on Safari 17", "Clicking submit shows a blank white screen", owner_id=20)] == [3]
+
+    index.remove(1)
+    assert [match["issue_id"] for match in index.find_duplicates("Login page crashes in Safari", "Clicking submit shows a blank screen")] == [3]
+
+def test_snapshot_round_trip_catches_up(db_session: Session, tmp_path):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    kept = crud.create_issue(db_session, schemas.IssueCreate(title="Upload fails for large images", description="413 error"), owner_id=owner.id)
+    removed = crud.create_issue(db_session, schemas.IssueCreate(title="Dark mode colors are wrong"), owner_id=owner.id)
+
+    index = DuplicateIndex()
+    index.build(db_session)
+    path = str(tmp_path / "index.npz")
+    index.save_snapshot(path)
+    # A second save replaces the snapshot and leaves no temporary files behind
+    index.save_snapshot(path)
+    assert [entry.name for entry in tmp_path.iterdir()] == ["index.npz"]
+
+    # Changes made while the snapshot was on disk are picked up when it is restored
+    crud.delete_issue(db_session, removed.id)
+    added = crud.create_issue(db_session, schemas.IssueCreate(title="Password reset email never arrives"), owner_id=owner.id)
+
+    restored = DuplicateIndex()
+    restored.load_or_build(db_session, path)
+    assert len(restored) == 2
+    assert restored.find_duplicates("Upload fails for large images", "413 error")[0]["issue_id"] == kept.id
+    assert restored.find_duplicates("Password reset email never arrives")[0]["issue_id"] == added.id
+    assert restored.find_duplicates("Dark mode colors are wrong") == []
+
+def test_catch_up_reads_late_commits_and_deletion_events(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    removed = crud.create_issue(db_session, schemas.IssueCreate(title="Dark mode colors are wrong"), owner_id=owner.id)
+    index = DuplicateIndex()
+    index.build(db_session)
+
+    # Written by another worker, stamped before the last sync but committed after it
+    late = models.Issue(title="Password reset email never arrives", owner_id=owner.id,
+                        updated_at=index.indexed_at - timedelta(seconds=5))
+    db_session.add(late)
+    db_session.commit()
+    # Write hooks only reach the process-wide index, so this one learns of the deletion from its event
+    crud.delete_issue(db_session, removed.id)
+
+    index.catch_up(db_session)
+    assert index.find_duplicates("Password reset email never arrives")[0]["issue_id"] == late.id
+    assert index.find_duplicates("Dark mode colors are wrong") == []
+
+def test_create_issue_returns_possible_duplicates(test_client: TestClient, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_data = {"title": "Dashboard chart does not load", "description": "Spinner keeps spinning forever", "severity": "HIGH"}
+    response = test_client.post("/api/v1/issues/", json=issue_data, headers=headers)
+    assert response.status_code == 201
+    first_id = response.json()["id"]
+    assert response.json()["possible_duplicates"] == []
+
+    response = test_client.post("/api/v1/issues/duplicates", json=issue_data, headers=headers)
+    assert response.status_code == 200
+    assert response.json()[0]["issue_id"] == first_id
+
+    response = test_client.post("/api/v1/issues/", json=issue_data, headers=headers)
+    assert response.status_code == 201
+    duplicates = response.json()["possible_duplicates"]
+    assert duplicates[0]["issue_id"] == first_id
+    assert duplicates[0]["similarity"] == 1.0
+
+    # Updates and deletes keep the index in sync
+    second_id = response.json()["id"]
+    test_client.put(f"/api/v1/issues/{first_id}", json={"title": "Something else entirely", "description": "Unrelated"}, headers=headers)
+    response = test_client.post("/api/v1/issues/duplicates", json=issue_data, headers=headers)
+    assert [match["issue_id"] for match in response.json()] == [second_id]
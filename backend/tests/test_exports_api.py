@@ -0,0 +1,97 @@
+# backend/tests/test_exports_api.py
+import time
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, exports, models, schemas
+from app.job_queue import QueueWorker
+from tests.database_test import TestingSessionLocal
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+def wait_for_export(test_client: TestClient, job_id: int, headers) -> dict:
+    for _ in range(500):
+        job = test_client.get(f"/api/v1/exports/{job_id}", headers=headers).json()
+        if job["status"] in ("COMPLETED", "FAILED"):
+            return job
+        time.sleep(0.01)
+    return job
+
+def test_export_issues_to_parquet(test_client: TestClient, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Parquet Issue", "severity": "HIGH"}, headers=headers)
+
+    response = test_client.post("/api/v1/exports/", json={"dataset": "ISSUES", "format": "PARQUET"}, headers=headers)
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    # The export runs on the export executor, not in the request
+    job = wait_for_export(test_client, job_id, headers)
+    assert job["status"] == "COMPLETED"
+    assert job["row_count"] == 1
+
+    response = test_client.get(job["download_url"], headers=headers)
+    assert response.status_code == 200
+    table = pq.read_table(pa.BufferReader(response.content))
+    assert table.num_rows == 1
+    assert pa.types.is_dictionary(table.schema.field("status").type)
+    assert pa.types.is_timestamp(table.schema.field("created_at").type)
+    assert table.column("severity").to_pylist() == ["HIGH"]
+    assert table.column("status").type.value_type == pa.string()
+
+def test_export_daily_stats_to_arrow(test_client: TestClient, admin_auth_token: str, db_session: Session):
+    crud.create_daily_stats(db_session, date(2025, 7, 1), {"OPEN": 3, "TRIAGED": 1, "IN_PROGRESS": 0, "DONE": 2})
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+
+    response = test_client.post("/api/v1/exports/", json={"dataset": "DAILY_STATS", "format": "ARROW"}, headers=headers)
+    assert response.status_code == 202
+    job = wait_for_export(test_client, response.json()["id"], headers)
+    assert job["status"] == "COMPLETED"
+
+    response = test_client.get(job["download_url"], headers=headers)
+    table = pa.ipc.open_file(pa.BufferReader(response.content)).read_all()
+    assert table.column("OPEN").to_pylist() == [3]
+    assert table.column("DONE").to_pylist() == [2]
+
+def test_export_requires_maintainer_or_admin(test_client: TestClient, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    response = test_client.post("/api/v1/exports/", json={"dataset": "ISSUES"}, headers=headers)
+    assert response.status_code == 403
+
+def test_failed_export_is_recorded(db_session: Session, monkeypatch, export_dir):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="admin@example.com", password="password", role=models.UserRole.ADMIN))
+    job = crud.create_export_job(db_session, schemas.ExportJobCreate(dataset=models.ExportDataset.ISSUES), requested_by_id=owner.id)
+
+    def explode(db, dataset, path, file_format, batch_size):
+        open(path, "wb").close()
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(exports, "write_columnar_export", explode)
+
+    exports.run_export_job(TestingSessionLocal(), job.id)
+    # The partly written file is removed
+    assert list(export_dir.iterdir()) == []
+
+    db_session.expire_all()
+    failed = crud.get_export_job(db_session, job.id)
+    assert failed.status == models.ExportStatus.FAILED
+    assert failed.error == "disk full"
+
+def test_exports_can_run_on_queue_workers(test_client: TestClient, admin_auth_token: str, db_session: Session, monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_RUNNER", "queue")
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    job_id = test_client.post("/api/v1/exports/", json={"dataset": "ISSUES", "format": "ARROW"}, headers=headers).json()["id"]
+
+    assert test_client.get(f"/api/v1/exports/{job_id}", headers=headers).json()["status"] == "PENDING"
+    queued = db_session.query(models.QueuedJob).one()
+    assert (queued.kind, queued.payload) == ("export", {"export_job_id": job_id})
+
+    assert QueueWorker("worker-1", session_factory=TestingSessionLocal, poll_interval=0).run_once()
+    assert test_client.get(f"/api/v1/exports/{job_id}", headers=headers).json()["status"] == "COMPLETED"
@@ -0,0 +1,74 @@
+# backend/tests/test_health.py
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.database import engine
+from app.db_pool import InstrumentedQueuePool, install_idle_ping, pool_status
+from app.routers import health
+
+def test_probes_follow_pool_saturation(test_client: TestClient, admin_auth_token: str):
+    response = test_client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["database_pool"]["pool_class"] == "InstrumentedQueuePool"
+
+    pool = pool_status(engine, "idle")
+    held = [engine.raw_connection() for _ in range(pool["capacity"] - pool["checked_out"])]
+    try:
+        response = test_client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Database connection pool is exhausted"
+        # Liveness reports saturation but still passes
+        response = test_client.get("/healthz")
+        assert response.status_code == 200
+        assert response.json()["status"] == "saturated"
+        assert response.json()["database_pool"]["saturated"] is True
+    finally:
+        for connection in held:
+            connection.close()
+    assert test_client.get("/readyz").status_code == 200
+
+    stats = test_client.get("/api/v1/system/db_pool", headers={"Authorization": f"Bearer {admin_auth_token}"}).json()
+    assert stats["checkouts"] >= len(held)
+    assert stats["checked_out"] == 0
+
+def test_readiness_fails_when_the_database_hangs(test_client: TestClient, monkeypatch):
+    release = threading.Event()
+    pings = []
+    def hanging_ping():
+        pings.append(1)
+        release.wait(5)
+    monkeypatch.setattr(health, "_ping_database", hanging_ping)
+    monkeypatch.setattr(health, "READY_PING_TIMEOUT_SECONDS", 0.05)
+    try:
+        for _ in range(2):
+            response = test_client.get("/readyz")
+            assert response.status_code == 503
+            assert response.json()["detail"] == "Database did not answer within 0.05s"
+        # The second probe waited on the hung ping instead of starting another
+        assert pings == [1]
+    finally:
+        release.set()
+
+def test_pool_counts_checkout_timeouts(tmp_path):
+    pool_engine = create_engine(f"sqlite:///{tmp_path}/pool.db", poolclass=InstrumentedQueuePool,
+                                pool_size=1, max_overflow=0, pool_timeout=0.05)
+    # Pings every checkout after the first, failing nothing but exercising the check
+    install_idle_ping(pool_engine, idle_seconds=0)
+    with pool_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    held = pool_engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        pool_engine.connect()
+    held.close()
+
+    status = pool_status(pool_engine, "idle")
+    assert status["capacity"] == 1
+    assert status["checkouts"] == 2
+    assert status["timeouts"] == 1
+    assert status["seconds_since_last_timeout"] is not None
+    assert status["wait_ms_max"] >= status["wait_ms_p95"]
+    pool_engine.dispose()
@@ -0,0 +1,99 @@
+# backend/tests/test_idempotency.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.idempotency import IdempotencyStore, REPLAYED_HEADER, idempotency_store, request_fingerprint
+from tests.database_test import TestingSessionLocal
+
+def test_retries_replay_the_first_response(test_client: TestClient, db_session: Session, reporter_auth_token: str, admin_auth_token: str):
+    reporter = {"Authorization": f"Bearer {reporter_auth_token}", "Idempotency-Key": "create-1"}
+    issue = {"title": "Outage", "severity": "CRITICAL"}
+
+    first = test_client.post("/api/v1/issues/", json=issue, headers=reporter)
+    retry = test_client.post("/api/v1/issues/", json=issue, headers=reporter)
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert REPLAYED_HEADER not in first.headers and retry.headers[REPLAYED_HEADER] == "true"
+    assert db_session.query(models.Issue).count() == 1
+
+    # Replays come from the database once this worker's memory no longer has them
+    idempotency_store._responses.clear()
+    assert test_client.post("/api/v1/issues/", json=issue, headers=reporter).json() == first.json()
+
+    # Reusing a key for another request is rejected; keys of different users are independent
+    changed = test_client.post("/api/v1/issues/", json={**issue, "title": "Other"}, headers=reporter)
+    assert changed.status_code == 422
+    admin = {"Authorization": f"Bearer {admin_auth_token}", "Idempotency-Key": "create-1"}
+    assert test_client.post("/api/v1/issues/", json=issue, headers=admin).json()["id"] != first.json()["id"]
+    # Without a key every request creates an issue
+    test_client.post("/api/v1/issues/", json=issue, headers={"Authorization": reporter["Authorization"]})
+    assert db_session.query(models.Issue).count() == 3
+
+    metrics = test_client.get("/api/v1/system/idempotency", headers={"Authorization": admin["Authorization"]}).json()
+    assert (metrics["executed"], metrics["replayed"], metrics["cache_hits"], metrics["mismatches"]) == (2, 2, 2, 1)
+
+def test_concurrent_duplicates_wait_for_the_original(db_session: Session):
+    user = crud.create_user(db_session, schemas.UserCreate(email="client@example.com", password="password"))
+    store = IdempotencyStore(wait_seconds=5)
+    identity = ("issues.create", user.id, "retry-storm")
+    calls = []
+
+    async def create():
+        calls.append(len(calls))
+        await asyncio.sleep(0.1)
+        return {"id": 1}
+
+    # Like concurrent requests, each has its own session, since the store uses it from the thread pool
+    sessions = [TestingSessionLocal() for _ in range(5)]
+
+    async def scenario():
+        return await asyncio.gather(*(store.run(db, identity, {"title": "Outage"}, create, 201) for db in sessions))
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        for db in sessions:
+            db.close()
+    assert calls == [0]
+    # Whichever request claimed the key ran; the others replay its response
+    assert [result for result in results if isinstance(result, dict)] == [{"id": 1}]
+    replays = [result for result in results if not isinstance(result, dict)]
+    assert [(result.status_code, result.body) for result in replays] == [(201, b'{"id":1}')] * 4
+    assert store.status()["waited"] == 4
+
+def test_failed_and_abandoned_requests_free_their_key(db_session: Session):
+    user = crud.create_user(db_session, schemas.UserCreate(email="client@example.com", password="password"))
+    store = IdempotencyStore(wait_seconds=0.05)
+    identity = ("issues.create", user.id, "key")
+
+    async def fail():
+        raise HTTPException(status_code=400, detail="Invalid")
+
+    async def create():
+        return {"id": 2}
+
+    with pytest.raises(HTTPException):
+        asyncio.run(store.run(db_session, identity, {}, fail, 201))
+    assert db_session.query(models.IdempotencyKey).count() == 0
+
+    # A claim still in progress makes duplicates give up with 409 once their wait is over
+    store._claim(db_session, identity, request_fingerprint({}))
+    with pytest.raises(HTTPException) as conflict:
+        asyncio.run(store.run(db_session, identity, {}, create, 201))
+    assert conflict.value.status_code == 409
+
+    # An abandoned claim, and later an expired response, are taken over
+    record = db_session.get(models.IdempotencyKey, identity, populate_existing=True)
+    record.locked_until = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    assert asyncio.run(store.run(db_session, identity, {}, create, 201)) == {"id": 2}
+
+    db_session.get(models.IdempotencyKey, identity, populate_existing=True).expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    assert store.purge_expired(db_session) == 1
@@ -0,0 +1,105 @@
+# backend/tests/test_issue_cache.py
+from fastapi.testclient import TestClient
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.issue_cache import InMemoryNotifier, IssueCache, issue_cache
+from .database_test import engine as test_engine
+
+def test_hot_issue_reads_skip_the_database(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    issue_id = test_client.post("/api/v1/issues/", json={"title": "Outage", "severity": "CRITICAL"}, headers=headers).json()["id"]
+
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        for _ in range(3):
+            assert test_client.get(f"/api/v1/issues/{issue_id}", headers=headers).json()["title"] == "Outage"
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record)
+    assert len([statement for statement in statements if "FROM issues" in statement]) == 1
+
+    status = test_client.get("/api/v1/system/issue_cache", headers={"Authorization": f"Bearer {admin_auth_token}"}).json()
+    assert (status["hits"], status["misses"], status["hit_ratio"]) == (2, 1, round(2 / 3, 4))
+
+    # Writes invalidate the cached row
+    assert test_client.put(f"/api/v1/issues/{issue_id}", json={"title": "Outage resolved"}, headers=headers).status_code == 200
+    assert test_client.get(f"/api/v1/issues/{issue_id}", headers=headers).json()["title"] == "Outage resolved"
+    assert test_client.delete(f"/api/v1/issues/{issue_id}", headers={"Authorization": f"Bearer {admin_auth_token}"}).status_code == 204
+    assert test_client.get(f"/api/v1/issues/{issue_id}", headers=headers).status_code == 404
+
+def test_invalidations_reach_other_workers(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    issue = crud.create_issue(db_session, schemas.IssueCreate(title="Outage", severity="HIGH"), owner_id=owner.id)
+    # Two workers' caches, connected like the Postgres notifier connects processes
+    notifier = InMemoryNotifier()
+    workers = [IssueCache(notifier=notifier), IssueCache(notifier=notifier)]
+
+    def load():
+        return crud.get_issues(db_session, limit=1)[0]
+    for cache in workers:
+        db_session.expunge_all()
+        cache.read_through(db_session, issue.id, load)
+    assert [len(cache) for cache in workers] == [1, 1]
+
+    # A cached row comes back attached to the session, without a query
+    db_session.expunge_all()
+    cached = workers[1].read_through(db_session, issue.id, load)
+    assert inspect(cached).persistent and cached.title == "Outage"
+    assert workers[1].hits == 1
+
+    workers[0].on_issue_write("updated", issue)
+    assert [len(cache) for cache in workers] == [0, 0]
+
+    # A row loaded before an invalidation is not cached, as it may be stale already
+    generation = workers[0].generation()
+    workers[0].invalidate(issue.id)
+    workers[0].put(issue.id, {"id": issue.id}, generation)
+    assert len(workers[0]) == 0
+
+class TransactionalNotifier(InMemoryNotifier):
+    """
+    Records publishes like the Postgres notifier makes them, inside the writing transaction.
+    """
+    transactional = True
+
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, issue_id: int):
+        self.published.append(("after commit", issue_id))
+
+    def publish_in(self, db: Session, issue_id: int):
+        self.published.append(("in transaction" if db.in_transaction() else "outside transaction", issue_id))
+
+def test_invalidations_are_published_with_the_write(db_session: Session, monkeypatch):
+    notifier = TransactionalNotifier()
+    monkeypatch.setattr(issue_cache, "notifier", notifier)
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+
+    # New issues are in no cache, so creating one publishes nothing
+    issue = crud.create_issue(db_session, schemas.IssueCreate(title="Outage"), owner_id=owner.id)
+    assert notifier.published == []
+    crud.update_issue(db_session, issue.id, schemas.IssueUpdate(title="Outage resolved"))
+    crud.delete_issue(db_session, issue.id)
+    assert notifier.published == [("in transaction", issue.id), ("in transaction", issue.id)]
+
+def test_cache_memory_is_bounded():
+    cache = IssueCache(max_entries=2, max_bytes=10 ** 6)
+    for issue_id in range(1, 4):
+        cache.put(issue_id, {"id": issue_id, "title": "x"}, cache.generation())
+    assert cache.get(1) is None and cache.get(3) is not None
+    assert cache.evictions == 1
+
+    cache = IssueCache(max_entries=100, max_bytes=3000)
+    for issue_id in range(1, 4):
+        cache.put(issue_id, {"id": issue_id, "description": "x" * 500}, cache.generation())
+    assert len(cache) == 2
+    assert cache.status()["approximate_bytes"] <= 3000
+    # Rows larger than the whole cache are never kept
+    cache.put(9, {"id": 9, "description": "x" * 5000}, cache.generation())
+    assert cache.get(9) is None
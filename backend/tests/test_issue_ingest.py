@@ -0,0 +1,79 @@
+# backend/tests/test_issue_ingest.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.issue_ingest import IssueBatcher, issue_batcher
+from .database_test import TestingSessionLocal
+
+def test_concurrent_issues_are_written_in_batches(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="monitor@example.com", password="password"))
+    batcher = IssueBatcher(session_factory=TestingSessionLocal, max_batch=10, flush_ms=200)
+    titles = [f"Disk full on host {n}" for n in range(25)]
+    try:
+        with ThreadPoolExecutor(max_workers=25) as pool:
+            futures = list(pool.map(lambda title: batcher.submit(schemas.IssueCreate(title=title), owner.id), titles))
+        created = [future.result(timeout=10) for future in futures]
+    finally:
+        batcher.shutdown()
+
+    assert [issue.title for issue in created] == titles
+    assert len({issue.id for issue in created}) == 25
+    assert all(issue.status == models.IssueStatus.OPEN and issue.owner_id == owner.id for issue in created)
+    assert db_session.query(models.IssueEvent).filter(models.IssueEvent.event_type == models.IssueEventType.CREATED).count() == 25
+    status = batcher.status()
+    assert status["issues"] == 25 and status["largest_batch"] == 10 and status["batches"] < 25
+
+def test_a_bad_issue_only_fails_its_own_caller(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="monitor@example.com", password="password"))
+    batcher = IssueBatcher(session_factory=TestingSessionLocal, flush_ms=200)
+    try:
+        good = batcher.submit(schemas.IssueCreate(title="Queue backlog"), owner.id)
+        bad = batcher.submit(schemas.IssueCreate.model_construct(title=None, description=None, severity=None), owner.id)
+        assert good.result(timeout=10).title == "Queue backlog"
+        with pytest.raises(Exception):
+            bad.result(timeout=10)
+    finally:
+        batcher.shutdown()
+    assert batcher.status()["failures"] == 1
+    assert [issue.title for issue in db_session.query(models.Issue)] == ["Queue backlog"]
+
+def test_cancelled_callers_do_not_stop_the_writer(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="monitor@example.com", password="password"))
+    batcher = IssueBatcher(session_factory=TestingSessionLocal, flush_ms=50)
+
+    async def scenario():
+        # A caller cancelled while its issue waits in the batch, e.g. on client disconnect
+        cancelled = asyncio.ensure_future(batcher.create(schemas.IssueCreate(title="Disconnected"), owner.id))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await asyncio.wait_for(batcher.create(schemas.IssueCreate(title="Next"), owner.id), timeout=10)
+
+    # A future cancelled before its batch is written is skipped
+    skipped = batcher.submit(schemas.IssueCreate(title="Given up"), owner.id)
+    skipped.cancel()
+    try:
+        assert asyncio.run(scenario()).title == "Next"
+    finally:
+        batcher.shutdown()
+    assert sorted(issue.title for issue in db_session.query(models.Issue)) == ["Disconnected", "Next"]
+
+def test_create_endpoint_uses_the_batcher_when_enabled(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str, monkeypatch):
+    monkeypatch.setattr(issue_batcher, "enabled", True)
+    monkeypatch.setattr(issue_batcher, "session_factory", TestingSessionLocal)
+    try:
+        response = test_client.post("/api/v1/issues/", json={"title": "Outage", "severity": "CRITICAL"},
+                                    headers={"Authorization": f"Bearer {reporter_auth_token}"})
+    finally:
+        issue_batcher.shutdown()
+    assert response.status_code == 201
+    assert response.json()["title"] == "Outage" and response.json()["status"] == "OPEN"
+
+    status = test_client.get("/api/v1/system/issue_ingest", headers={"Authorization": f"Bearer {admin_auth_token}"}).json()
+    assert (status["enabled"], status["batches"], status["issues"]) == (True, 1, 1)
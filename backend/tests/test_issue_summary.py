@@ -0,0 +1,61 @@
+# backend/tests/test_issue_summary.py
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app import crud, issue_summary, models, schemas
+
+def test_my_summary_counts_only_callers_issues(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    for title, severity in (("First", "LOW"), ("Second", "HIGH"), ("Third", "HIGH")):
+        test_client.post("/api/v1/issues/", json={"title": title, "severity": severity}, headers=headers)
+    test_client.post("/api/v1/issues/", json={"title": "Not mine", "severity": "CRITICAL"},
+                     headers={"Authorization": f"Bearer {admin_auth_token}"})
+
+    response = test_client.get("/api/v1/issues/me/summary", params={"recent": 2}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["status_counts"]["OPEN"] == 3
+    assert data["severity_counts"] == {"LOW": 1, "MEDIUM": 0, "HIGH": 2, "CRITICAL": 0}
+    assert [issue["title"] for issue in data["recent_issues"]] == ["Third", "Second"]
+
+    response = test_client.get("/api/v1/issues/me/summary", params={"recent": 100}, headers=headers)
+    assert response.status_code == 422
+
+def test_my_summary_is_cached_until_the_owner_writes(test_client: TestClient, reporter_auth_token: str, db_session: Session):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    reporter = crud.get_user_by_email(db_session, "reporter@example.com")
+    created = test_client.post("/api/v1/issues/", json={"title": "Cached", "severity": "LOW"}, headers=headers).json()
+    assert test_client.get("/api/v1/issues/me/summary", headers=headers).json()["total"] == 1
+
+    # A write that bypasses crud is not seen until the cache entry is dropped
+    db_session.add(models.Issue(title="Raw insert", severity=models.IssueSeverity.LOW, owner_id=reporter.id))
+    db_session.commit()
+    assert test_client.get("/api/v1/issues/me/summary", headers=headers).json()["total"] == 1
+
+    crud.update_issue(db_session, created["id"], schemas.IssueUpdate(status=models.IssueStatus.DONE))
+    data = test_client.get("/api/v1/issues/me/summary", headers=headers).json()
+    assert data["total"] == 2
+    assert data["status_counts"]["DONE"] == 1
+
+def test_summary_computed_during_a_write_is_not_cached(reporter_auth_token: str, db_session: Session, monkeypatch):
+    reporter = crud.get_user_by_email(db_session, "reporter@example.com")
+    compute = crud.get_owner_issue_summary
+
+    def compute_then_write(db, owner_id, recent_limit):
+        summary = compute(db, owner_id, recent_limit=recent_limit)
+        # The write commits and invalidates after the summary was read, before it is cached
+        crud.create_issue(db, schemas.IssueCreate(title="Raced", severity=models.IssueSeverity.LOW), reporter.id)
+        return summary
+
+    monkeypatch.setattr(crud, "get_owner_issue_summary", compute_then_write)
+    assert issue_summary.get_owner_summary(db_session, reporter.id).total == 0
+    monkeypatch.setattr(crud, "get_owner_issue_summary", compute)
+    assert issue_summary.get_owner_summary(db_session, reporter.id).total == 1
+
+def test_owner_counts_use_covering_index(db_session: Session):
+    plan = db_session.execute(text(
+        "EXPLAIN QUERY PLAN SELECT status, severity, count(*) FROM issues WHERE owner_id = 1 GROUP BY status, severity"
+    )).all()
+    assert "COVERING INDEX ix_issues_owner_status_severity" in " ".join(str(row[-1]) for row in plan)
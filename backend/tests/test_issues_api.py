@@ -6,6 +6,7 @@ from tests.main_test import client, override_get_db # Use the test client and DB
 from app import schemas, crud
 from sqlalchemy.orm import Session
 import pytest
+import json
 
 # Fixture to create a test user and token
 @pytest.fixture(scope="function")
@@ -114,4 +115,75 @@ def test_get_issue_by_id_not_found(test_client: TestClient, reporter_auth_token:
     # Attempt to get an issue that does not exist
     response = test_client.get("/api/v1/issues/999999", headers=headers)
     assert response.status_code == 404
-    
\ No newline at end of file
+    
+def test_export_issues_csv_scoped_to_reporter(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    reporter_headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Reporter Issue", "severity": "LOW"}, headers=reporter_headers)
+    test_client.post("/api/v1/issues/", json={"title": "Admin Issue", "severity": "HIGH"}, headers=admin_headers)
+
+    # Reporters only export their own issues
+    response = test_client.get("/api/v1/issues/export?format=csv", headers=reporter_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().splitlines()
+    assert lines[0] == "id,title,description,severity,status,created_at,updated_at,owner_id"
+    assert len(lines) == 2
+    assert "Reporter Issue" in lines[1]
+
+    # Admins export everything
+    response = test_client.get("/api/v1/issues/export?format=csv", headers=admin_headers)
+    assert response.status_code == 200
+    assert len(response.text.strip().splitlines()) == 3
+
+def test_export_issues_ndjson(test_client: TestClient, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "NDJSON Issue", "severity": "CRITICAL"}, headers=headers)
+
+    response = test_client.get("/api/v1/issues/export?format=ndjson", headers=headers)
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 1
+    assert records[0]["title"] == "NDJSON Issue"
+    assert records[0]["severity"] == "CRITICAL"
+    assert records[0]["status"] == "OPEN"
+
+def test_export_issues_invalid_format(test_client: TestClient, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    response = test_client.get("/api/v1/issues/export?format=xml", headers=headers)
+    assert response.status_code == 400
+
+def test_search_issues_ranked_and_scoped(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    reporter_headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Login page crashes", "description": "Blank screen after submit", "severity": "HIGH"}, headers=reporter_headers)
+    test_client.post("/api/v1/issues/", json={"title": "Slow dashboard", "description": "Crashes sometimes on login", "severity": "LOW"}, headers=reporter_headers)
+    test_client.post("/api/v1/issues/", json={"title": "Admin login crashes", "severity": "MEDIUM"}, headers=admin_headers)
+
+    # Title matches rank above description matches, and reporters only see their own issues
+    response = test_client.get("/api/v1/issues/search", params={"q": "login crashes"}, headers=reporter_headers)
+    assert response.status_code == 200
+    assert [issue["title"] for issue in response.json()] == ["Login page crashes", "Slow dashboard"]
+
+    response = test_client.get("/api/v1/issues/search", params={"q": "login crashes"}, headers=admin_headers)
+    assert len(response.json()) == 3
+
+    response = test_client.get("/api/v1/issues/search", params={"q": "login", "limit": 1, "skip": 1}, headers=admin_headers)
+    assert len(response.json()) == 1
+
+def test_search_issues_follows_updates_and_deletes(test_client: TestClient, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    issue_id = test_client.post("/api/v1/issues/", json={"title": "Printer offline", "severity": "LOW"}, headers=headers).json()["id"]
+
+    test_client.put(f"/api/v1/issues/{issue_id}", json={"title": "Scanner offline"}, headers=headers)
+    assert test_client.get("/api/v1/issues/search", params={"q": "printer"}, headers=headers).json() == []
+    assert len(test_client.get("/api/v1/issues/search", params={"q": "scanner"}, headers=headers).json()) == 1
+
+    test_client.delete(f"/api/v1/issues/{issue_id}", headers=headers)
+    assert test_client.get("/api/v1/issues/search", params={"q": "scanner"}, headers=headers).json() == []
+
+def test_search_issues_ignores_query_syntax(test_client: TestClient, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    response = test_client.get("/api/v1/issues/search", params={"q": '"AND OR -* ('}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
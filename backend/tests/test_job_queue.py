@@ -0,0 +1,126 @@
+# backend/tests/test_job_queue.py
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import models
+from app.job_queue import QueueWorker, claim_next_job, complete_job, enqueue_job, job_handlers, requeue_stale_jobs
+from tests.database_test import TestingSessionLocal
+
+@pytest.fixture
+def handled():
+    calls = []
+
+    def record(db: Session, payload: dict):
+        calls.append(payload["n"])
+
+    def explode(db: Session, payload: dict):
+        raise RuntimeError("handler failed")
+
+    job_handlers["test_record"] = record
+    job_handlers["test_explode"] = explode
+    yield calls
+    del job_handlers["test_record"], job_handlers["test_explode"]
+
+def make_worker(name: str = "worker-1") -> QueueWorker:
+    return QueueWorker(name, session_factory=TestingSessionLocal, poll_interval=0)
+
+def test_jobs_run_by_priority_then_age(db_session: Session, handled):
+    enqueue_job(db_session, "test_record", {"n": 1})
+    enqueue_job(db_session, "test_record", {"n": 2}, priority=10)
+    enqueue_job(db_session, "test_record", {"n": 3})
+    enqueue_job(db_session, "test_record", {"n": 4}, delay_seconds=3600) # Not due yet
+
+    worker = make_worker()
+    while worker.run_once():
+        pass
+
+    assert handled == [2, 1, 3]
+    statuses = [job.status for job in db_session.query(models.QueuedJob).order_by(models.QueuedJob.id)]
+    assert statuses == [models.QueuedJobStatus.SUCCEEDED] * 3 + [models.QueuedJobStatus.QUEUED]
+
+def test_a_job_is_claimed_only_once(db_session: Session):
+    enqueue_job(db_session, "test_record", {"n": 1})
+    first, second = TestingSessionLocal(), TestingSessionLocal()
+    try:
+        assert claim_next_job(first, "worker-1").locked_by == "worker-1"
+        assert claim_next_job(second, "worker-2") is None
+    finally:
+        first.close()
+        second.close()
+
+def test_failed_jobs_retry_with_backoff_then_fail(db_session: Session, handled):
+    job = enqueue_job(db_session, "test_explode", max_attempts=2)
+    worker = make_worker()
+
+    assert worker.run_once() is True
+    db_session.refresh(job)
+    assert job.status == models.QueuedJobStatus.QUEUED
+    assert job.attempts == 1
+    assert job.last_error == "handler failed"
+    assert job.run_at > datetime.utcnow()
+    assert worker.run_once() is False # Backing off
+
+    job.run_at = datetime.utcnow()
+    db_session.commit()
+    assert worker.run_once() is True
+    db_session.refresh(job)
+    assert job.status == models.QueuedJobStatus.FAILED
+    assert job.attempts == 2
+
+def test_stale_running_jobs_are_requeued(db_session: Session, handled):
+    job = enqueue_job(db_session, "test_record", {"n": 7})
+    claimer = TestingSessionLocal()
+    try:
+        claim_next_job(claimer, "dead-worker")
+    finally:
+        claimer.close()
+
+    assert requeue_stale_jobs(db_session, lock_timeout_seconds=60) == 0
+    db_session.query(models.QueuedJob).update({"locked_at": datetime.utcnow() - timedelta(minutes=5)})
+    db_session.commit()
+    assert requeue_stale_jobs(db_session, lock_timeout_seconds=60) == 1
+
+    assert make_worker().run_once() is True
+    assert handled == [7]
+    db_session.refresh(job)
+    assert job.status == models.QueuedJobStatus.SUCCEEDED
+    assert job.attempts == 2
+
+def test_running_jobs_renew_their_lock(db_session: Session):
+    job = enqueue_job(db_session, "test_slow")
+    recovered = []
+
+    def slow(db: Session, payload: dict):
+        # Long past the lock timeout the job is still held, thanks to the heartbeat
+        time.sleep(0.5)
+        recovered.append(requeue_stale_jobs(db, lock_timeout_seconds=0.3))
+
+    job_handlers["test_slow"] = slow
+    try:
+        assert QueueWorker("worker-1", session_factory=TestingSessionLocal, poll_interval=0, heartbeat_interval=0.05).run_once()
+    finally:
+        del job_handlers["test_slow"]
+    assert recovered == [0]
+    db_session.refresh(job)
+    assert job.status == models.QueuedJobStatus.SUCCEEDED and job.attempts == 1
+
+def test_a_stale_worker_cannot_overwrite_a_new_claim(db_session: Session):
+    job = enqueue_job(db_session, "test_record", {"n": 1})
+    stale, current = TestingSessionLocal(), TestingSessionLocal()
+    try:
+        stale_job = claim_next_job(stale, "worker-1")
+        db_session.query(models.QueuedJob).update({"locked_at": datetime.utcnow() - timedelta(minutes=5)})
+        db_session.commit()
+        requeue_stale_jobs(db_session, lock_timeout_seconds=60)
+        assert claim_next_job(current, "worker-2").attempts == 2
+
+        # worker-1 finally finishes its first attempt
+        assert complete_job(stale, stale_job, "worker-1", 1) is False
+    finally:
+        stale.close()
+        current.close()
+    db_session.refresh(job)
+    assert (job.status, job.locked_by, job.attempts) == (models.QueuedJobStatus.RUNNING, "worker-2", 2)
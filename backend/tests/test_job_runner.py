@@ -0,0 +1,89 @@
+# backend/tests/test_job_runner.py
+import asyncio
+import threading
+import time
+
+from app.job_runner import SKIPPED, JobRunner, ensure_within_timeout
+
+def test_job_runs_off_the_event_loop_thread_and_records_success():
+    runner = JobRunner(max_workers=1)
+    threads = []
+    job = runner.job("threaded_job", lambda: threads.append(threading.current_thread().name))
+
+    asyncio.run(job())
+
+    assert threads[0].startswith("scheduled-job")
+    metrics = runner.metrics["threaded_job"]
+    assert metrics.successes == 1
+    assert metrics.failures == 0
+    assert metrics.last_duration_seconds is not None
+    runner.shutdown()
+
+def test_failures_and_skips_are_counted():
+    runner = JobRunner(max_workers=1)
+
+    def broken():
+        raise RuntimeError("database unavailable")
+
+    async def scenario():
+        await runner.run("broken_job", broken)
+        await runner.run("skipped_job", lambda: SKIPPED)
+        await asyncio.sleep(0) # Let the completion callbacks run
+
+    asyncio.run(scenario())
+    assert runner.metrics["broken_job"].failures == 1
+    assert runner.metrics["broken_job"].last_error == "database unavailable"
+    assert runner.metrics["skipped_job"].skipped == 1
+    assert runner.metrics["skipped_job"].successes == 0
+    runner.shutdown()
+
+def test_timed_out_job_blocks_overlapping_runs_until_it_finishes():
+    runner = JobRunner(max_workers=2)
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+
+    async def scenario():
+        await runner.run("slow_job", slow, timeout_seconds=0.05)
+        # The first run is still going, so this one must not start
+        await runner.run("slow_job", slow, timeout_seconds=0.05)
+        release.set()
+        while runner.metrics["slow_job"].running:
+            await asyncio.sleep(0.01)
+        await runner.run("slow_job", lambda: calls.append(2), timeout_seconds=1)
+
+    asyncio.run(scenario())
+    metrics = runner.metrics["slow_job"]
+    assert calls == [1, 2]
+    assert metrics.timeouts == 1
+    assert metrics.overlaps == 1
+    assert metrics.successes == 2
+    runner.shutdown()
+
+def test_timed_out_jobs_stop_at_their_next_check():
+    runner = JobRunner(max_workers=1)
+    steps = []
+
+    def long_job():
+        for step in range(500):
+            ensure_within_timeout()
+            steps.append(step)
+            time.sleep(0.01)
+
+    async def scenario():
+        await runner.run("long_job", long_job, timeout_seconds=0.05)
+        while runner.metrics["long_job"].running:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    metrics = runner.metrics["long_job"]
+    assert 0 < len(steps) < 500
+    assert metrics.timeouts == 1
+    assert metrics.successes == metrics.failures == 0
+    assert metrics.last_error == "Scheduled job exceeded its timeout"
+    # Outside scheduled jobs there is no timeout to exceed
+    ensure_within_timeout()
+    runner.shutdown()
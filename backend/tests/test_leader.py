@@ -0,0 +1,94 @@
+# backend/tests/test_leader.py
+import time
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import models
+from app.job_runner import SKIPPED
+from app.leader import LeaderLease
+from tests.database_test import TestingSessionLocal
+
+def make_lease(holder_id: str) -> LeaderLease:
+    return LeaderLease("test-scheduler", ttl_seconds=60, session_factory=TestingSessionLocal, holder_id=holder_id)
+
+def expire_lease(db: Session, name: str):
+    db.get(models.SchedulerLease, name).expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+def test_only_one_worker_holds_the_lease(db_session: Session):
+    first, second = make_lease("worker-1"), make_lease("worker-2")
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    # Renewal keeps the lease with the current holder
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    assert first.is_leader and not second.is_leader
+
+def test_lease_fails_over_on_expiry_and_release(db_session: Session):
+    first, second = make_lease("worker-1"), make_lease("worker-2")
+    assert first.try_acquire() is True
+
+    expire_lease(db_session, "test-scheduler")
+    assert second.try_acquire() is True
+    assert first.try_acquire() is False
+    assert not first.is_leader
+
+    second.release()
+    assert not second.is_leader
+    assert first.try_acquire() is True
+
+def test_leader_only_jobs_run_once_and_record_runs(db_session: Session):
+    first, second = make_lease("worker-1"), make_lease("worker-2")
+    first.try_acquire()
+    second.try_acquire()
+
+    runs = []
+    for lease in (first, second):
+        lease.leader_only("count_job", lambda: runs.append(1))()
+    assert runs == [1]
+
+    state = db_session.get(models.ScheduledJobState, "count_job")
+    assert state.last_run_by == "worker-1"
+    assert state.last_run_at is not None
+
+def test_leader_only_jobs_stop_when_the_lease_is_lost(db_session: Session):
+    first, second = make_lease("worker-1"), make_lease("worker-2")
+    first.try_acquire()
+
+    def long_job():
+        # Another worker takes over while the job runs; the renewal thread notices
+        expire_lease(db_session, "test-scheduler")
+        second.try_acquire()
+        first.try_acquire()
+        first.ensure_leader()
+
+    assert first.leader_only("long_job", long_job)() is SKIPPED
+    assert db_session.get(models.ScheduledJobState, "long_job") is None
+
+def test_lease_renews_on_its_own_thread(db_session: Session):
+    lease = make_lease("worker-1")
+    lease.start_renewal(0.01)
+    try:
+        for _ in range(500):
+            if lease.is_leader:
+                break
+            time.sleep(0.01)
+        assert lease.is_leader
+    finally:
+        lease.stop_renewal()
+    assert lease._renewal_thread is None
+
+def test_scheduler_status_endpoint(test_client: TestClient, admin_auth_token: str, reporter_auth_token: str):
+    response = test_client.get("/api/v1/system/scheduler", headers={"Authorization": f"Bearer {reporter_auth_token}"})
+    assert response.status_code == 403
+
+    response = test_client.get("/api/v1/system/scheduler", headers={"Authorization": f"Bearer {admin_auth_token}"})
+    assert response.status_code == 200
+    status = response.json()
+    assert status["lease_name"] == "scheduler"
+    assert status["leader"] is None
+    assert status["is_leader"] is False
+    assert status["jobs"] == []
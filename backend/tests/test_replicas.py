@@ -0,0 +1,191 @@
+# backend/tests/test_replicas.py
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from main import app
+from app import database, exports, models
+from app.database import Base, get_db
+from app.issue_cache import IssueCache, issue_cache
+from app.replicas import ReplicaSet, RoutingSession
+from app.storage import blob_storage
+from .database_test import engine as test_engine
+
+def sqlite_engine(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+def add_user(engine, email):
+    db = sessionmaker(bind=engine)()
+    db.add(models.User(email=email, hashed_password="x"))
+    db.commit()
+    db.close()
+
+def emails(db):
+    return [user.email for user in db.query(models.User).order_by(models.User.id)]
+
+@pytest.fixture
+def databases(tmp_path):
+    # Each database holds a different user, to tell which one answered
+    engines = {name: sqlite_engine(tmp_path / f"{name}.db") for name in ("primary", "replica_a", "replica_b")}
+    for name, engine in engines.items():
+        add_user(engine, f"{name}@example.com")
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+def test_reads_rotate_over_healthy_replicas(databases, tmp_path):
+    replicas = ReplicaSet([databases["replica_a"], databases["replica_b"]])
+    Session = sessionmaker(class_=RoutingSession, bind=databases["primary"])
+
+    answered = []
+    for _ in range(4):
+        db = Session(replica=replicas.choose())
+        answered += emails(db)
+        db.close()
+    assert answered == ["replica_a@example.com", "replica_b@example.com"] * 2
+
+    # A replica that cannot be reached is skipped until a health check passes again
+    missing_dir = tmp_path / "offline"
+    offline = create_engine(f"sqlite:///{missing_dir}/replica.db")
+    replicas = ReplicaSet([databases["replica_a"], offline])
+    assert replicas.check() == 1
+    assert replicas.status()[1]["healthy"] is False
+    assert {replicas.choose() for _ in range(4)} == {databases["replica_a"]}
+
+    missing_dir.mkdir()
+    assert replicas.check() == 2
+    assert {replicas.choose() for _ in range(4)} == {databases["replica_a"], offline}
+    offline.dispose()
+
+    # With no healthy replica, reads fall back to the primary
+    replicas.replicas[0].mark_unhealthy("down for maintenance")
+    replicas.replicas[1].mark_unhealthy("down for maintenance")
+    assert replicas.choose() is None
+
+def test_issue_cache_keeps_only_rows_read_from_the_primary(databases):
+    for name in ("primary", "replica_a"):
+        db = sessionmaker(bind=databases[name])()
+        # The replica still has the title from before the write
+        db.add(models.Issue(id=1, title="Outage resolved" if name == "primary" else "Outage", owner_id=1))
+        db.commit()
+        db.close()
+    Session = sessionmaker(class_=RoutingSession, bind=databases["primary"])
+    cache = IssueCache()
+
+    def read(db):
+        return cache.read_through(db, 1, lambda: db.get(models.Issue, 1)).title
+
+    db = Session(replica=databases["replica_a"])
+    assert read(db) == "Outage"
+    assert len(cache) == 0
+    db.close()
+
+    db = Session()
+    assert read(db) == "Outage resolved"
+    db.close()
+    assert len(cache) == 1
+    db = Session(replica=databases["replica_a"])
+    assert read(db) == "Outage resolved"
+    db.close()
+
+def test_session_reads_its_own_writes_from_the_primary(databases):
+    Session = sessionmaker(class_=RoutingSession, bind=databases["primary"])
+    db = Session(replica=databases["replica_a"])
+    assert emails(db) == ["replica_a@example.com"]
+
+    db.add(models.User(email="new@example.com", hashed_password="x"))
+    db.commit()
+    assert not db.reads_from_replica
+    assert emails(db) == ["primary@example.com", "new@example.com"]
+    db.close()
+
+    replica = sessionmaker(bind=databases["replica_a"])()
+    assert emails(replica) == ["replica_a@example.com"]
+    replica.close()
+
+def test_only_read_only_requests_use_replicas(databases, monkeypatch):
+    monkeypatch.setattr(database, "replicas", ReplicaSet([databases["replica_a"]]))
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(class_=RoutingSession, bind=databases["primary"]))
+
+    def session_for(method):
+        dependency = get_db(Request({"type": "http", "method": method, "headers": []}))
+        db = next(dependency)
+        try:
+            return emails(db)
+        finally:
+            dependency.close()
+
+    assert session_for("GET") == ["replica_a@example.com"]
+    assert session_for("POST") == ["primary@example.com"]
+    # Outside requests, e.g. scheduled jobs
+    dependency = get_db()
+    assert emails(next(dependency)) == ["primary@example.com"]
+    dependency.close()
+
+@pytest.fixture
+def lagging(test_client: TestClient, tmp_path):
+    # An empty replica stands in for one that has not caught up with the primary yet
+    lagging = sqlite_engine(tmp_path / "lagging.db")
+    Session = sessionmaker(class_=RoutingSession, bind=test_engine)
+
+    def routed_db(request: Request):
+        db = Session(replica=lagging if request.method == "GET" else None)
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = routed_db
+    yield lagging
+    lagging.dispose()
+
+def test_lookups_missed_by_a_lagging_replica_retry_on_the_primary(test_client: TestClient, reporter_auth_token: str, lagging):
+    headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    # The user is only on the primary so far
+    assert test_client.get("/api/v1/users/me", headers=headers).json()["email"] == "reporter@example.com"
+
+    add_user(lagging, "reporter@example.com")
+    created = test_client.post("/api/v1/issues/", json={"title": "Replica lag", "severity": "LOW"}, headers=headers)
+    assert created.status_code == 201
+    # The new issue is found on the primary after missing on the replica
+    response = test_client.get(f"/api/v1/issues/{created.json()['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Replica lag"
+    # Listings are served by the replica as they are
+    assert test_client.get("/api/v1/issues/", headers=headers).json() == []
+
+def test_attachments_and_exports_missed_by_a_lagging_replica_retry_on_the_primary(
+        test_client: TestClient, admin_auth_token: str, lagging, tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_storage, "root", str(tmp_path / "blobs"))
+    monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path / "exports"))
+    replica = sessionmaker(bind=lagging)()
+    replica.add(models.User(email="admin@example.com", hashed_password="x", role=models.UserRole.ADMIN))
+    replica.commit()
+    replica.close()
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    issue_id = test_client.post("/api/v1/issues/", json={"title": "Replica lag", "severity": "LOW"}, headers=headers).json()["id"]
+    attachment = test_client.post(f"/api/v1/issues/{issue_id}/attachments", params={"filename": "log.txt"},
+                                  content=b"replica lag\n", headers={**headers, "Content-Type": "text/plain"}).json()
+
+    # Served from the primary once the issue itself misses on the replica
+    issue_cache.clear()
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments", headers=headers)
+    assert [listed["id"] for listed in response.json()] == [attachment["id"]]
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{attachment['id']}/download", headers=headers)
+    assert response.content == b"replica lag\n"
+    response = test_client.get(f"/api/v1/issues/{issue_id}/attachments/{attachment['id']}/artifacts/text.txt", headers=headers)
+    assert response.text == "replica lag\n"
+
+    job_id = test_client.post("/api/v1/exports/", json={"dataset": "ISSUES", "format": "PARQUET"}, headers=headers).json()["id"]
+    for _ in range(500):
+        job = test_client.get(f"/api/v1/exports/{job_id}", headers=headers).json()
+        if job["status"] == "COMPLETED":
+            break
+        time.sleep(0.01)
+    assert job["id"] == job_id
+    assert test_client.get(job["download_url"], headers=headers).status_code == 200
@@ -0,0 +1,138 @@
+# backend/tests/test_single_flight.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.routers import issues as issues_router
+from app.single_flight import SingleFlight
+
+def test_concurrent_callers_share_one_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def count_issues(scope):
+        calls.append(scope)
+        release.wait(5)
+        return {"open": 3}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flight.do, ("dashboard", "staff"), count_issues, "staff") for _ in range(8)]
+        for _ in range(500):
+            if flight.status() and flight.status()[0]["coalesced"] == 7:
+                break
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == ["staff"]
+    assert all(result is results[0] for result in results)
+    assert flight.status() == [{"name": "dashboard", "in_flight": 0, "executions": 1, "coalesced": 7}]
+    # Completed computations are not reused
+    flight.do(("dashboard", "staff"), count_issues, "staff")
+    assert len(calls) == 2
+
+def test_async_waiters_share_results_and_errors():
+    flight = SingleFlight()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        threading.Event().wait(0.1)
+        if value == "broken":
+            raise RuntimeError("query failed")
+        return value
+
+    async def scenario():
+        same = await asyncio.gather(*(flight.run(("list", "owner-1"), slow, "owner-1") for _ in range(10)))
+        other_scope = await asyncio.gather(flight.run(("list", "owner-1"), slow, "owner-1"), flight.run(("list", "owner-2"), slow, "owner-2"))
+        failures = await asyncio.gather(*(flight.run(("list", "broken"), slow, "broken") for _ in range(3)), return_exceptions=True)
+        return same, other_scope, failures
+
+    same, other_scope, failures = asyncio.run(scenario())
+    assert same == ["owner-1"] * 10
+    assert other_scope == ["owner-1", "owner-2"]
+    assert calls == ["owner-1", "owner-1", "owner-2", "broken"]
+    assert [str(failure) for failure in failures] == ["query failed"] * 3
+
+    flight.enabled = False
+    assert asyncio.run(flight.run(("list", "owner-1"), slow, "owner-1")) == "owner-1"
+    assert len(calls) == 5
+
+def test_cancelled_waiters_do_not_cancel_the_shared_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "counts"
+
+    async def scenario():
+        callers = [asyncio.ensure_future(flight.run(("dashboard", "staff"), slow)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        # One client disconnects while the others keep waiting
+        callers[1].cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    leader, cancelled, waiter = asyncio.run(scenario())
+    assert (leader, waiter) == ("counts", "counts")
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert flight.status() == [{"name": "dashboard", "in_flight": 0, "executions": 1, "coalesced": 2}]
+
+def test_writes_stop_callers_joining_older_issue_lists(monkeypatch):
+    flight = SingleFlight()
+    monkeypatch.setattr(issues_router, "single_flight", flight)
+    release = threading.Event()
+    calls = []
+
+    def list_issues(label):
+        calls.append(label)
+        if label.startswith("before"):
+            release.wait(5)
+        return label
+
+    all_issues, reporter_2 = ("issues.list", None, 0, 100), ("issues.list", 2, 0, 100)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        before = pool.submit(flight.do, all_issues, list_issues, "before write")
+        other_scope = pool.submit(flight.do, reporter_2, list_issues, "before write, other scope")
+        for _ in range(500):
+            if len(calls) == 2:
+                break
+            time.sleep(0.01)
+        # Reporter 1 creates an issue; only lists that can include it are computed afresh
+        issues_router._forget_issue_lists("created", SimpleNamespace(id=1, owner_id=1))
+        after = flight.do(all_issues, list_issues, "after write")
+        joined = pool.submit(flight.do, reporter_2, list_issues, "unused")
+        for _ in range(500):
+            if flight.status()[0]["coalesced"] == 1:
+                break
+            time.sleep(0.01)
+        release.set()
+        assert (before.result(), after) == ("before write", "after write")
+        assert other_scope.result() == joined.result() == "before write, other scope"
+    assert sorted(calls) == ["after write", "before write", "before write, other scope"]
+
+@pytest.mark.parametrize("path", ["/api/v1/dashboard/status_counts", "/api/v1/dashboard/summary"])
+def test_coalesced_endpoints_keep_their_responses(test_client: TestClient, admin_auth_token: str, path: str):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Outage", "severity": "CRITICAL"}, headers=headers)
+    response = test_client.get(path, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status_counts"]["OPEN"] == 1
+
+def test_issue_lists_are_coalesced_per_scope(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    reporter, admin = ({"Authorization": f"Bearer {token}"} for token in (reporter_auth_token, admin_auth_token))
+    test_client.post("/api/v1/issues/", json={"title": "Mine", "severity": "LOW"}, headers=reporter)
+    test_client.post("/api/v1/issues/", json={"title": "Theirs", "severity": "LOW"}, headers=admin)
+
+    assert [issue["title"] for issue in test_client.get("/api/v1/issues/", headers=reporter).json()] == ["Mine"]
+    assert [issue["title"] for issue in test_client.get("/api/v1/issues/", headers=admin).json()] == ["Mine", "Theirs"]
+    metrics = test_client.get("/api/v1/system/single_flight", headers=admin).json()
+    assert metrics == [{"name": "issues.list", "in_flight": 0, "executions": 2, "coalesced": 0}]
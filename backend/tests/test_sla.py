@@ -0,0 +1,78 @@
+# backend/tests/test_sla.py
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.sla import sla_report
+
+DAY = datetime(2026, 3, 2) # A Monday
+
+def add_issue(db: Session, owner_id: int, severity: str, transitions, at: datetime = DAY) -> models.Issue:
+    """
+    Creates an issue at `at` and applies (status, hours after creation) transitions through crud.
+    """
+    issue = crud.create_issue(db, schemas.IssueCreate(title=f"{severity} issue", severity=severity), owner_id=owner_id)
+    issue.created_at = issue.updated_at = at
+    for status, hours in transitions:
+        crud.update_issue(db, issue.id, schemas.IssueUpdate(status=status))
+        event = db.query(models.IssueEvent).filter(models.IssueEvent.issue_id == issue.id).order_by(models.IssueEvent.id.desc()).first()
+        event.at = issue.updated_at = at + timedelta(hours=hours)
+    db.commit()
+    return issue
+
+def test_sla_percentiles_by_severity_and_week(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    add_issue(db_session, owner.id, "HIGH", [(models.IssueStatus.TRIAGED, 2), (models.IssueStatus.DONE, 10)])
+    add_issue(db_session, owner.id, "LOW", [(models.IssueStatus.DONE, 4)])
+    add_issue(db_session, owner.id, "LOW", [(models.IssueStatus.TRIAGED, 30)])
+    # Resolved before the event log existed: falls back on updated_at
+    legacy = add_issue(db_session, owner.id, "MEDIUM", [])
+    legacy.status, legacy.updated_at = models.IssueStatus.DONE, DAY + timedelta(hours=20)
+    db_session.commit()
+
+    report = sla_report(db_session, DAY.date(), DAY.date() + timedelta(days=6), today=date(2026, 10, 19))
+
+    done = report["time_to_done"]
+    assert done["overall"]["count"] == 3
+    assert done["overall"]["p50_hours"] == 10.0
+    assert done["by_severity"][models.IssueSeverity.HIGH]["p50_hours"] == 10.0
+    assert done["by_severity"][models.IssueSeverity.CRITICAL]["count"] == 0
+    assert [week["week_start"] for week in done["by_week"]] == [DAY.date()]
+    assert [bucket["count"] for bucket in done["histogram"]][:5] == [0, 0, 1, 2, 0]
+
+    triage = report["time_to_triage"]
+    assert triage["overall"]["count"] == 4
+    assert triage["by_severity"][models.IssueSeverity.LOW]["p99_hours"] > 29
+
+def test_closed_days_are_cached_and_today_recomputed(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    today = date(2026, 3, 3)
+    add_issue(db_session, owner.id, "HIGH", [(models.IssueStatus.DONE, 5)])
+    assert sla_report(db_session, DAY.date(), today, today=today)["time_to_done"]["overall"]["count"] == 1
+
+    # A late change to a closed day is not picked up, but today's resolutions are
+    add_issue(db_session, owner.id, "HIGH", [(models.IssueStatus.DONE, 6)])
+    add_issue(db_session, owner.id, "LOW", [(models.IssueStatus.DONE, 1)], at=datetime(2026, 3, 3, 8))
+    report = sla_report(db_session, DAY.date(), today, today=today)
+    assert report["time_to_done"]["overall"]["count"] == 2
+    assert report["time_to_done"]["by_severity"][models.IssueSeverity.LOW]["count"] == 1
+
+def test_sla_endpoint_requires_maintainer(test_client: TestClient, reporter_auth_token: str):
+    response = test_client.get("/api/v1/dashboard/sla", headers={"Authorization": f"Bearer {reporter_auth_token}"})
+    assert response.status_code == 403
+
+def test_sla_endpoint_defaults_to_recent_weeks(test_client: TestClient, maintainer_auth_token: str):
+    response = test_client.get("/api/v1/dashboard/sla", headers={"Authorization": f"Bearer {maintainer_auth_token}"})
+    assert response.status_code == 200
+    body = response.json()
+    assert (date.fromisoformat(body["end"]) - date.fromisoformat(body["start"])).days == 83
+    assert body["time_to_done"]["overall"] == {"count": 0, "p50_hours": None, "p90_hours": None, "p99_hours": None}
+
+def test_sla_endpoint_rejects_ranges_past_the_cache(test_client: TestClient, maintainer_auth_token: str):
+    headers = {"Authorization": f"Bearer {maintainer_auth_token}"}
+    response = test_client.get("/api/v1/dashboard/sla", params={"from": "2020-01-01", "to": "2026-01-01"}, headers=headers)
+    assert response.status_code == 400
+    response = test_client.get("/api/v1/dashboard/sla", params={"from": "2025-01-01", "to": "2026-01-01"}, headers=headers)
+    assert response.status_code == 200
@@ -0,0 +1,100 @@
+# backend/tests/test_snapshot.py
+from datetime import date, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.models import IssueSeverity, IssueSliceDimension, IssueStatus
+from app.snapshot import BYTES_PER_ISSUE, IssueColumnSnapshot, issue_snapshot, slice_issues
+
+class Row:
+    def __init__(self, id, status=IssueStatus.OPEN, severity=IssueSeverity.LOW, owner_id=1, created_at=datetime(2026, 3, 2, 12)):
+        self.id = id
+        self.status = status
+        self.severity = severity
+        self.owner_id = owner_id
+        self.created_at = created_at
+        self.updated_at = created_at
+
+def counts(rows, *fields):
+    return {tuple(row[field] for field in fields): row["count"] for row in rows}
+
+def test_snapshot_groups_and_filters():
+    snapshot = IssueColumnSnapshot()
+    snapshot.on_issue_write("created", Row(1, IssueStatus.OPEN, IssueSeverity.HIGH, owner_id=1))
+    snapshot.on_issue_write("created", Row(2, IssueStatus.OPEN, IssueSeverity.HIGH, owner_id=2, created_at=datetime(2026, 3, 8, 23)))
+    snapshot.on_issue_write("created", Row(3, IssueStatus.DONE, IssueSeverity.LOW, owner_id=1, created_at=datetime(2026, 3, 9)))
+
+    by_status_severity = snapshot.aggregate([IssueSliceDimension.STATUS, IssueSliceDimension.SEVERITY])
+    assert counts(by_status_severity, "status", "severity") == {
+        (IssueStatus.OPEN, IssueSeverity.HIGH): 2,
+        (IssueStatus.DONE, IssueSeverity.LOW): 1,
+    }
+    # Weeks start on Monday
+    assert counts(snapshot.aggregate([IssueSliceDimension.WEEK]), "week_start") == {(date(2026, 3, 2),): 2, (date(2026, 3, 9),): 1}
+    assert counts(snapshot.aggregate([IssueSliceDimension.OWNER], statuses=[IssueStatus.OPEN]), "owner_id") == {(1,): 1, (2,): 1}
+    assert snapshot.aggregate([], owner_id=1, created_to=date(2026, 3, 8)) == [{"count": 1}]
+    assert snapshot.aggregate([], severities=[IssueSeverity.CRITICAL]) == [{"count": 0}]
+
+def test_snapshot_handles_updates_deletes_and_out_of_order_ids():
+    snapshot = IssueColumnSnapshot()
+    snapshot._index_rows(Row(issue_id) for issue_id in (2, 4, 6, 8))
+    snapshot.on_issue_write("created", Row(5, IssueStatus.TRIAGED))
+    snapshot.on_issue_write("updated", Row(2, IssueStatus.DONE))
+    snapshot.on_issue_write("deleted", Row(4))
+    assert snapshot._indexed_ids() == {2, 5, 6, 8}
+    assert counts(snapshot.aggregate([IssueSliceDimension.STATUS]), "status") == {
+        (IssueStatus.OPEN,): 2, (IssueStatus.TRIAGED,): 1, (IssueStatus.DONE,): 1,
+    }
+
+    # Deleting enough rows compacts the columns; re-created rows come back
+    snapshot.on_issue_write("deleted", Row(6))
+    assert snapshot._size == len(snapshot) == 3
+    snapshot.on_issue_write("created", Row(6))
+    assert list(snapshot._columns["id"][:snapshot._size]) == [2, 5, 6, 8]
+    assert snapshot.memory_bytes() > 0
+
+def test_slice_from_database_matches_snapshot(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    for severity in ("LOW", "HIGH", "HIGH"):
+        crud.create_issue(db_session, schemas.IssueCreate(title=f"{severity} issue", severity=severity), owner_id=owner.id)
+    crud.update_issue(db_session, 1, schemas.IssueUpdate(status=IssueStatus.DONE))
+    group_by = [IssueSliceDimension.SEVERITY, IssueSliceDimension.STATUS]
+
+    from_snapshot = slice_issues(db_session, group_by, owner_id=owner.id)
+    issue_snapshot.enabled = False
+    try:
+        from_database = slice_issues(db_session, group_by, owner_id=owner.id)
+    finally:
+        issue_snapshot.enabled = True
+    assert (from_snapshot["source"], from_database["source"]) == ("snapshot", "database")
+    assert from_snapshot["rows"] == from_database["rows"]
+    assert from_snapshot["total"] == 3
+
+def test_slices_endpoint(test_client: TestClient, maintainer_auth_token: str, reporter_auth_token: str):
+    headers = {"Authorization": f"Bearer {maintainer_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Checkout fails", "severity": "CRITICAL"}, headers=headers)
+    test_client.post("/api/v1/issues/", json={"title": "Typo on footer", "severity": "LOW"}, headers=headers)
+
+    response = test_client.get("/api/v1/dashboard/slices", params={"group_by": ["SEVERITY"], "status": "OPEN"}, headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert {row["severity"]: row["count"] for row in body["rows"]} == {"LOW": 1, "CRITICAL": 1}
+    assert body["rows"][0]["status"] is None
+
+    response = test_client.get("/api/v1/dashboard/slices", params={"group_by": ["OWNER", "OWNER"]}, headers=headers)
+    assert response.status_code == 400
+    response = test_client.get("/api/v1/dashboard/slices", headers={"Authorization": f"Bearer {reporter_auth_token}"})
+    assert response.status_code == 403
+
+def test_snapshot_status_endpoint(test_client: TestClient, admin_auth_token: str):
+    headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Checkout fails", "severity": "CRITICAL"}, headers=headers)
+    response = test_client.get("/api/v1/system/issue_snapshot", headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["enabled"] is True
+    assert body["issue_count"] == 1
+    assert body["bytes_per_million_issues"] == BYTES_PER_ISSUE * 1_000_000
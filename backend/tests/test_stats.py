@@ -0,0 +1,81 @@
+# backend/tests/test_stats.py
+from datetime import date, datetime
+
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.stats import backfill_daily_stats, refresh_daily_stats
+
+def add_issue(db: Session, owner_id: int, status: models.IssueStatus, at: datetime) -> models.Issue:
+    issue = crud.create_issue(db, schemas.IssueCreate(title=f"{status.value} issue"), owner_id=owner_id)
+    issue.status, issue.created_at, issue.updated_at = status, at, at
+    db.commit()
+    return issue
+
+def set_status(db: Session, issue: models.Issue, status: models.IssueStatus, at: datetime):
+    issue.status, issue.updated_at = status, at
+    db.commit()
+
+def rows_by_day(db: Session):
+    db.expire_all()
+    return {row.date.date(): row.issue_counts_by_status for row in db.query(models.DailyStats).order_by(models.DailyStats.date)}
+
+def test_refresh_upserts_todays_row_incrementally(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    first = add_issue(db_session, owner.id, models.IssueStatus.OPEN, datetime(2026, 3, 2, 8))
+    add_issue(db_session, owner.id, models.IssueStatus.DONE, datetime(2026, 3, 2, 9))
+
+    stats = refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 10))
+    assert stats.issue_counts_by_status == {"OPEN": 1, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1}
+
+    set_status(db_session, first, models.IssueStatus.IN_PROGRESS, datetime(2026, 3, 2, 11))
+    third = add_issue(db_session, owner.id, models.IssueStatus.OPEN, datetime(2026, 3, 2, 11))
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 12))
+    # Running again without changes is a no-op
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 12, 30))
+    crud.delete_issue(db_session, third.id)
+    # Deletions are read from their events, stamped here on the test's clock
+    db_session.query(models.IssueEvent).filter(models.IssueEvent.event_type == models.IssueEventType.DELETED).update(
+        {"at": datetime(2026, 3, 2, 12, 45)}, synchronize_session=False
+    )
+    db_session.commit()
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 13))
+    # Deletion events re-read through the watermark overlap are not counted twice
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 13, 1))
+
+    assert rows_by_day(db_session) == {date(2026, 3, 2): {"OPEN": 0, "TRIAGED": 0, "IN_PROGRESS": 1, "DONE": 1}}
+
+def test_refresh_closes_skipped_days_with_end_of_day_counts(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    issue = add_issue(db_session, owner.id, models.IssueStatus.OPEN, datetime(2026, 3, 2, 8))
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 2, 10))
+
+    # Changed late on the 2nd, and again on the 4th, with no refresh in between
+    set_status(db_session, issue, models.IssueStatus.TRIAGED, datetime(2026, 3, 2, 23))
+    other = add_issue(db_session, owner.id, models.IssueStatus.OPEN, datetime(2026, 3, 3, 9))
+    set_status(db_session, other, models.IssueStatus.DONE, datetime(2026, 3, 4, 9))
+    refresh_daily_stats(db_session, now=datetime(2026, 3, 4, 10))
+
+    assert rows_by_day(db_session) == {
+        date(2026, 3, 2): {"OPEN": 0, "TRIAGED": 1, "IN_PROGRESS": 0, "DONE": 0},
+        # The issue created on the 3rd was last updated on the 4th, so it is only counted from then
+        date(2026, 3, 3): {"OPEN": 0, "TRIAGED": 1, "IN_PROGRESS": 0, "DONE": 0},
+        date(2026, 3, 4): {"OPEN": 0, "TRIAGED": 1, "IN_PROGRESS": 0, "DONE": 1},
+    }
+
+def test_backfill_fills_only_missing_days(db_session: Session):
+    owner = crud.create_user(db_session, schemas.UserCreate(email="owner@example.com", password="password"))
+    add_issue(db_session, owner.id, models.IssueStatus.DONE, datetime(2026, 3, 1, 8))
+    later = add_issue(db_session, owner.id, models.IssueStatus.OPEN, datetime(2026, 3, 1, 9))
+    set_status(db_session, later, models.IssueStatus.IN_PROGRESS, datetime(2026, 3, 3, 9))
+    crud.create_daily_stats(db_session, datetime(2026, 3, 2), {"OPEN": 7, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 0})
+
+    assert backfill_daily_stats(db_session, end=date(2026, 3, 3)) == 2
+    assert backfill_daily_stats(db_session, end=date(2026, 3, 3)) == 0
+
+    assert rows_by_day(db_session) == {
+        # Updated after the 1st, so counted with its initial status
+        date(2026, 3, 1): {"OPEN": 1, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1},
+        date(2026, 3, 2): {"OPEN": 7, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 0},
+        date(2026, 3, 3): {"OPEN": 0, "TRIAGED": 0, "IN_PROGRESS": 1, "DONE": 1},
+    }
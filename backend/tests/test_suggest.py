@@ -0,0 +1,86 @@
+# backend/tests/test_suggest.py
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.suggest import TitleSuggestIndex, _database_suggest_query
+
+class Row:
+    def __init__(self, id, title, owner_id=1):
+        self.id = id
+        self.title = title
+        self.owner_id = owner_id
+        self.description = None
+
+def test_suggest_ranks_title_and_word_prefixes_first():
+    index = TitleSuggestIndex()
+    index.on_issue_write("created", Row(1, "Relogin loop on mobile"))
+    index.on_issue_write("created", Row(2, "Login button misaligned"))
+    index.on_issue_write("created", Row(3, "Cannot login after reset"))
+    index.on_issue_write("created", Row(4, "Export is slow"))
+
+    assert [match["id"] for match in index.suggest("log")] == [2, 3, 1]
+    assert [match["id"] for match in index.suggest("LOGIN B")] == [2]
+    # Prefixes shorter than a trigram match title starts only, as on Postgres
+    assert [match["id"] for match in index.suggest("ex")] == [4]
+    assert [match["id"] for match in index.suggest("lo")] == [2]
+    assert index.suggest("zzz") == []
+
+    index.on_issue_write("deleted", Row(2, "Login button misaligned"))
+    index.on_issue_write("updated", Row(3, "Cannot sign in after reset"))
+    assert [match["id"] for match in index.suggest("log")] == [1]
+
+def test_suggest_ranks_every_match_for_common_prefixes():
+    index = TitleSuggestIndex()
+    for issue_id in range(1, 5001):
+        index.on_issue_write("created", Row(issue_id, f"Crash when saving draft {issue_id}"))
+    index.on_issue_write("created", Row(5001, "Draft"))
+    # The best match is found however many titles contain the prefix
+    assert index.suggest("draft", limit=1)[0]["id"] == 5001
+
+def test_short_prefixes_are_ordered_like_the_postgres_index():
+    index = TitleSuggestIndex()
+    index.on_issue_write("created", Row(1, "Disk full", owner_id=1))
+    index.on_issue_write("created", Row(2, "db timeout", owner_id=2))
+    index.on_issue_write("created", Row(3, "Deploy failed", owner_id=1))
+    index.on_issue_write("created", Row(4, "Disk full", owner_id=1))
+    index.on_issue_write("created", Row(5, "Old disk", owner_id=1))
+    # lower(title), then newest first
+    assert [match["id"] for match in index.suggest("d")] == [2, 3, 4, 1]
+    assert [match["id"] for match in index.suggest("d", owner_id=1, limit=2)] == [3, 4]
+    assert [match["id"] for match in index.suggest("di", limit=1)] == [4]
+    assert [match["id"] for match in index.suggest("d", owner_id=2)] == [2]
+
+def test_suggest_respects_owner_and_limit():
+    index = TitleSuggestIndex()
+    for issue_id in range(1, 31):
+        index.on_issue_write("created", Row(issue_id, f"Crash report {issue_id}", owner_id=issue_id % 2))
+    assert len(index.suggest("crash", limit=5)) == 5
+    assert all(match["id"] % 2 == 1 for match in index.suggest("crash", owner_id=1, limit=20))
+
+def test_short_prefixes_use_anchored_match_on_postgres(db_session):
+    def compiled(prefix):
+        query = _database_suggest_query(db_session, prefix, None, 10)
+        return str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    short = compiled("Lo")
+    assert "lower(issues.title) LIKE 'lo%%'" in short
+    assert "similarity" not in short
+    long = compiled("Log")
+    assert "ILIKE '%%Log%%'" in long
+    assert "similarity" in long
+
+def test_suggest_endpoint_scoped_to_reporter(test_client: TestClient, reporter_auth_token: str, admin_auth_token: str):
+    reporter_headers = {"Authorization": f"Bearer {reporter_auth_token}"}
+    admin_headers = {"Authorization": f"Bearer {admin_auth_token}"}
+    test_client.post("/api/v1/issues/", json={"title": "Payment page times out", "severity": "HIGH"}, headers=reporter_headers)
+    test_client.post("/api/v1/issues/", json={"title": "Payment webhook retries", "severity": "LOW"}, headers=admin_headers)
+
+    response = test_client.get("/api/v1/issues/suggest", params={"prefix": "pay"}, headers=reporter_headers)
+    assert response.status_code == 200
+    assert [match["title"] for match in response.json()] == ["Payment page times out"]
+
+    response = test_client.get("/api/v1/issues/suggest", params={"prefix": "pay"}, headers=admin_headers)
+    assert len(response.json()) == 2
+
+    response = test_client.get("/api/v1/issues/suggest", params={"prefix": "pay", "limit": 100}, headers=admin_headers)
+    assert response.status_code == 422
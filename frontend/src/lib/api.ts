@@ -120,6 +120,10 @@ export async function getIssues(): Promise<unknown> {
 	return fetchApi('/issues');
 }
 
+export async function getMyIssueSummary(recent: number = 5): Promise<unknown> {
+	return fetchApi(`/issues/me/summary?recent=${recent}`);
+}
+
 export async function getIssue(issueId: number): Promise<unknown> {
 	return fetchApi(`/issues/${issueId}`);
 }
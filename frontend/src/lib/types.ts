@@ -63,6 +63,13 @@ export interface Issue {
 	owner_id: number;
 }
 
+export interface OwnerIssueSummary {
+	total: number;
+	status_counts: { [key in IssueStatus]: number };
+	severity_counts: { [key in IssueSeverity]: number };
+	recent_issues: Issue[];
+}
+
 // --- Dashboard Types ---
 
 export interface DashboardData {